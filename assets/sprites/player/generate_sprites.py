@@ -3,11 +3,22 @@
 Generate SNES-style (16-bit era) pixel art sprites for player character "Cristian".
 Style: Final Fantasy VI field sprites / Zelda: A Link to the Past.
 Size: 16x24 pixels, transparent background, 3/4 top-down perspective.
-12 sprites total: 4 idle directions + 8 walk frames.
+12 frames total: 4 idle directions + 8 walk frames, one PNG each.
+The game plays the hand-painted cristian_spritesheet.png; the frames can also
+be packed into cristian_spritesheet_generated.png (3x4 cells of 48x48, frames
+drawn at 2x), built only with --variants so the committed sheet is untouched.
+Frames are composited from head, torso and legs layers; each distinct part
+is painted once and shared by every frame that shows it (PARTS).
 """
 
-from PIL import Image
 import os
+import sys
+from functools import lru_cache
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "tools"))
+from pixelkit import FLIP_LEFT_RIGHT, Canvas, build, godot, layers, sheets
+from pixelkit.manifest import Manifest
+from pixelkit.registry import asset, default_output
 
 # === COLOR PALETTE ===
 T = (0, 0, 0, 0)  # Transparent
@@ -52,17 +63,12 @@ def new_grid():
 
 def make_image(pixels):
     """Create a 16x24 RGBA image from a 2D pixel array."""
-    img = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-    for y in range(H):
-        for x in range(W):
-            if y < len(pixels) and x < len(pixels[y]):
-                img.putpixel((x, y), pixels[y][x])
-    return img
+    return Canvas.from_grid(W, H, pixels, T)
 
 
 def mirror_image(img):
     """Flip image horizontally for right-facing variants."""
-    return img.transpose(Image.FLIP_LEFT_RIGHT)
+    return img.transpose(FLIP_LEFT_RIGHT)
 
 
 def set_row(p, r, data):
@@ -185,44 +191,18 @@ def draw_legs_back_idle(p):
     set_row(p, 23, {4: OL, 5: OL, 6: OL, 8: OL, 9: OL, 10: OL, 11: OL})
 
 
-# ============================================================
-# IDLE DOWN — Front-facing, arms at sides, feet together
-# ============================================================
-def make_idle_down():
-    p = new_grid()
-    copy_head_front(p)
-    draw_torso_front_idle(p)
-    draw_legs_front_idle(p)
-    return make_image(p)
-
-
-# ============================================================
-# IDLE UP — Back view
-# ============================================================
-def make_idle_up():
-    p = new_grid()
-    copy_head_back(p)
-    draw_torso_back_idle(p)
-    draw_legs_back_idle(p)
-    return make_image(p)
-
-
-# ============================================================
-# IDLE LEFT — Left-facing profile
-# ============================================================
-def make_idle_left():
-    p = new_grid()
-    copy_head_left(p)
-
-    # Torso — side view (narrower ~8-9px)
-    set_row(p, 9,  {4: OL, 5: CH, 6: CB, 7: CB, 8: CB, 9: CS, 10: CB, 11: OL})
+def draw_torso_left_idle(p):
+    """Hoodie torso for left idle (rows 9-14) — side view (narrower ~8-9px)."""
+    set_row(p, 9, {4: OL, 5: CH, 6: CB, 7: CB, 8: CB, 9: CS, 10: CB, 11: OL})
     set_row(p, 10, {3: OL, 4: CB, 5: CH, 6: CB, 7: CB, 8: CB, 9: CS, 10: CB, 11: OL})
     set_row(p, 11, {3: OL, 4: CS, 5: CB, 6: CB, 7: CS, 8: CB, 9: CB, 10: CS, 11: OL})
     set_row(p, 12, {3: OL, 4: CB, 5: CS, 6: CB, 7: CB, 8: CS, 9: CB, 10: CB, 11: OL})
     set_row(p, 13, {4: OL, 5: CB, 6: CS, 7: CB, 8: CB, 9: CS, 10: CB, 11: OL})
     set_row(p, 14, {4: OL, 5: CS, 6: CB, 7: CS, 8: CS, 9: CB, 10: CS, 11: OL})
 
-    # Legs — profile (narrower)
+
+def draw_legs_left_idle(p):
+    """Legs/feet for left idle (rows 15-23) — profile (narrower)."""
     set_row(p, 15, {5: OL, 6: PB, 7: PB, 8: PS, 9: PB, 10: OL})
     set_row(p, 16, {5: OL, 6: PB, 7: PS, 8: PS, 9: PB, 10: OL})
     set_row(p, 17, {5: OL, 6: PB, 7: PS, 8: PB, 9: OL})
@@ -234,25 +214,9 @@ def make_idle_left():
     set_row(p, 22, {3: OL, 4: ShB, 5: ShB, 6: ShS, 7: ShS, 8: ShS, 9: OL})
     set_row(p, 23, {4: OL, 5: OL, 6: OL, 7: OL, 8: OL})
 
-    return make_image(p)
-
-
-# ============================================================
-# WALK DOWN 1 — Left leg forward, right arm swings forward
-# ============================================================
-def make_walk_down_1():
-    p = new_grid()
-    copy_head_front(p)
 
-    # Torso — right arm swings forward slightly (skin pixel visible)
-    set_row(p, 9,  {3: OL, 4: CH, 5: CH, 6: CB, 7: CH, 8: CH, 9: CB, 10: CH, 11: CH, 12: OL})
-    set_row(p, 10, {2: OL, 3: CH, 4: CB, 5: CB, 6: CH, 7: CB, 8: CB, 9: CH, 10: CB, 11: CB, 12: CS, 13: OL})
-    set_row(p, 11, {2: OL, 3: CB, 4: CB, 5: CS, 6: CB, 7: CB, 8: CB, 9: CB, 10: CS, 11: CB, 12: CB, 13: OL})
-    set_row(p, 12, {2: OL, 3: CS, 4: CB, 5: CB, 6: CB, 7: CS, 8: CS, 9: CB, 10: CB, 11: CB, 12: CS, 13: OL})
-    set_row(p, 13, {3: OL, 4: CB, 5: CB, 6: CS, 7: CB, 8: CB, 9: CS, 10: CB, 11: CB, 12: OL})
-    set_row(p, 14, {3: OL, 4: CS, 5: CS, 6: CB, 7: CS, 8: CS, 9: CB, 10: CS, 11: CS, 12: OL})
-
-    # Legs — left leg steps forward, right leg back
+def draw_legs_front_walk_1(p):
+    """Legs/feet for front walk 1 (rows 15-23) — left leg steps forward, right leg back."""
     set_row(p, 15, {4: OL, 5: PB, 6: PB, 7: PS, 8: PS, 9: PB, 10: PB, 11: OL})
     set_row(p, 16, {3: OL, 4: PB, 5: PB, 6: PS, 7: OL, 8: OL, 9: PS, 10: PB, 11: OL})
     set_row(p, 17, {3: OL, 4: PB, 5: PS, 6: OL, 8: OL, 9: PS, 10: PB, 11: OL})
@@ -264,25 +228,19 @@ def make_walk_down_1():
     set_row(p, 22, {2: OL, 3: ShS, 4: ShS, 5: ShS, 6: OL, 9: OL, 10: ShS, 11: ShS, 12: OL})
     set_row(p, 23, {3: OL, 4: OL, 5: OL, 6: OL, 10: OL, 11: OL, 12: OL})
 
-    return make_image(p)
-
-
-# ============================================================
-# WALK DOWN 2 — Right leg forward, left arm swings forward
-# ============================================================
-def make_walk_down_2():
-    p = new_grid()
-    copy_head_front(p)
 
-    # Torso — left arm forward
-    set_row(p, 9,  {3: OL, 4: CH, 5: CH, 6: CB, 7: CH, 8: CH, 9: CB, 10: CH, 11: CH, 12: OL})
+def draw_torso_front_walk_2(p):
+    """Hoodie torso for front walk 2 (rows 9-14) — left arm forward."""
+    set_row(p, 9, {3: OL, 4: CH, 5: CH, 6: CB, 7: CH, 8: CH, 9: CB, 10: CH, 11: CH, 12: OL})
     set_row(p, 10, {2: OL, 3: CS, 4: CB, 5: CB, 6: CH, 7: CB, 8: CB, 9: CH, 10: CB, 11: CB, 12: CH, 13: OL})
     set_row(p, 11, {2: OL, 3: CB, 4: CB, 5: CS, 6: CB, 7: CB, 8: CB, 9: CB, 10: CS, 11: CB, 12: CB, 13: OL})
     set_row(p, 12, {2: OL, 3: CS, 4: CB, 5: CB, 6: CB, 7: CS, 8: CS, 9: CB, 10: CB, 11: CB, 12: CS, 13: OL})
     set_row(p, 13, {3: OL, 4: CB, 5: CB, 6: CS, 7: CB, 8: CB, 9: CS, 10: CB, 11: CB, 12: OL})
     set_row(p, 14, {3: OL, 4: CS, 5: CS, 6: CB, 7: CS, 8: CS, 9: CB, 10: CS, 11: CS, 12: OL})
 
-    # Legs — right leg forward, left leg back
+
+def draw_legs_front_walk_2(p):
+    """Legs/feet for front walk 2 (rows 15-23) — right leg forward, left leg back."""
     set_row(p, 15, {4: OL, 5: PB, 6: PB, 7: PS, 8: PS, 9: PB, 10: PB, 11: OL})
     set_row(p, 16, {4: OL, 5: PB, 6: PS, 7: OL, 8: OL, 9: PB, 10: PB, 11: PB, 12: OL})
     set_row(p, 17, {4: OL, 5: PB, 6: PS, 7: OL, 9: OL, 10: PS, 11: PB, 12: OL})
@@ -294,25 +252,9 @@ def make_walk_down_2():
     set_row(p, 22, {3: OL, 4: ShS, 5: ShS, 6: OL, 9: OL, 10: ShS, 11: ShS, 12: ShS, 13: OL})
     set_row(p, 23, {3: OL, 4: OL, 5: OL, 10: OL, 11: OL, 12: OL, 13: OL})
 
-    return make_image(p)
-
-
-# ============================================================
-# WALK UP 1 — Walking back, left leg forward
-# ============================================================
-def make_walk_up_1():
-    p = new_grid()
-    copy_head_back(p)
 
-    # Torso — arm swing (right arm forward from behind)
-    set_row(p, 9,  {3: OL, 4: CS, 5: CB, 6: CB, 7: CS, 8: CS, 9: CB, 10: CB, 11: CS, 12: OL})
-    set_row(p, 10, {2: OL, 3: CB, 4: CB, 5: CS, 6: CB, 7: CB, 8: CB, 9: CS, 10: CB, 11: CB, 12: CB, 13: OL})
-    set_row(p, 11, {2: OL, 3: CB, 4: CS, 5: CB, 6: CB, 7: CS, 8: CS, 9: CB, 10: CB, 11: CS, 12: CB, 13: OL})
-    set_row(p, 12, {2: OL, 3: CS, 4: CB, 5: CB, 6: CS, 7: CB, 8: CB, 9: CS, 10: CB, 11: CB, 12: CS, 13: OL})
-    set_row(p, 13, {3: OL, 4: CB, 5: CS, 6: CB, 7: CB, 8: CB, 9: CB, 10: CS, 11: CB, 12: OL})
-    set_row(p, 14, {3: OL, 4: CS, 5: CS, 6: CB, 7: CS, 8: CS, 9: CB, 10: CS, 11: CS, 12: OL})
-
-    # Legs — left forward, right back
+def draw_legs_back_walk_1(p):
+    """Legs/feet for back walk 1 (rows 15-23) — left forward, right back."""
     set_row(p, 15, {4: OL, 5: PB, 6: PB, 7: PS, 8: PS, 9: PB, 10: PB, 11: OL})
     set_row(p, 16, {3: OL, 4: PB, 5: PB, 6: PS, 7: OL, 8: OL, 9: PS, 10: PB, 11: OL})
     set_row(p, 17, {3: OL, 4: PB, 5: PS, 6: OL, 8: OL, 9: PS, 10: PB, 11: OL})
@@ -323,25 +265,9 @@ def make_walk_up_1():
     set_row(p, 22, {2: OL, 3: ShS, 4: ShS, 5: ShS, 6: OL, 9: OL, 10: ShS, 11: ShS, 12: OL})
     set_row(p, 23, {3: OL, 4: OL, 5: OL, 6: OL, 10: OL, 11: OL, 12: OL})
 
-    return make_image(p)
-
-
-# ============================================================
-# WALK UP 2 — Walking back, right leg forward
-# ============================================================
-def make_walk_up_2():
-    p = new_grid()
-    copy_head_back(p)
-
-    # Torso — opposite arm swing
-    set_row(p, 9,  {3: OL, 4: CS, 5: CB, 6: CB, 7: CS, 8: CS, 9: CB, 10: CB, 11: CS, 12: OL})
-    set_row(p, 10, {2: OL, 3: CB, 4: CB, 5: CS, 6: CB, 7: CB, 8: CB, 9: CS, 10: CB, 11: CB, 12: CB, 13: OL})
-    set_row(p, 11, {2: OL, 3: CB, 4: CS, 5: CB, 6: CB, 7: CS, 8: CS, 9: CB, 10: CB, 11: CS, 12: CB, 13: OL})
-    set_row(p, 12, {2: OL, 3: CS, 4: CB, 5: CB, 6: CS, 7: CB, 8: CB, 9: CS, 10: CB, 11: CB, 12: CS, 13: OL})
-    set_row(p, 13, {3: OL, 4: CB, 5: CS, 6: CB, 7: CB, 8: CB, 9: CB, 10: CS, 11: CB, 12: OL})
-    set_row(p, 14, {3: OL, 4: CS, 5: CS, 6: CB, 7: CS, 8: CS, 9: CB, 10: CS, 11: CS, 12: OL})
 
-    # Legs — right forward, left back
+def draw_legs_back_walk_2(p):
+    """Legs/feet for back walk 2 (rows 15-23) — right forward, left back."""
     set_row(p, 15, {4: OL, 5: PB, 6: PB, 7: PS, 8: PS, 9: PB, 10: PB, 11: OL})
     set_row(p, 16, {4: OL, 5: PB, 6: PS, 7: OL, 8: OL, 9: PB, 10: PB, 11: PB, 12: OL})
     set_row(p, 17, {4: OL, 5: PB, 6: PS, 7: OL, 9: OL, 10: PS, 11: PB, 12: OL})
@@ -352,18 +278,10 @@ def make_walk_up_2():
     set_row(p, 22, {3: OL, 4: ShS, 5: ShS, 6: OL, 9: OL, 10: ShS, 11: ShS, 12: ShS, 13: OL})
     set_row(p, 23, {3: OL, 4: OL, 5: OL, 10: OL, 11: OL, 12: OL, 13: OL})
 
-    return make_image(p)
-
-
-# ============================================================
-# WALK LEFT 1 — Walking left, stride pose 1 (front leg forward)
-# ============================================================
-def make_walk_left_1():
-    p = new_grid()
-    copy_head_left(p)
 
-    # Torso — side view with arm swing (front arm forward)
-    set_row(p, 9,  {4: OL, 5: CH, 6: CB, 7: CB, 8: CB, 9: CS, 10: CB, 11: OL})
+def draw_torso_left_walk_1(p):
+    """Hoodie torso for left walk 1 (rows 9-14) — side view with arm swing (front arm forward)."""
+    set_row(p, 9, {4: OL, 5: CH, 6: CB, 7: CB, 8: CB, 9: CS, 10: CB, 11: OL})
     set_row(p, 10, {3: OL, 4: CB, 5: CH, 6: CB, 7: CB, 8: CB, 9: CS, 10: CB, 11: OL})
     # Front arm swings forward — hand pixel
     set_row(p, 11, {2: OL, 3: SS, 4: OL, 5: CB, 6: CB, 7: CS, 8: CB, 9: CB, 10: CS, 11: OL})
@@ -371,7 +289,9 @@ def make_walk_left_1():
     set_row(p, 13, {4: OL, 5: CB, 6: CS, 7: CB, 8: CB, 9: CS, 10: CB, 11: OL})
     set_row(p, 14, {4: OL, 5: CS, 6: CB, 7: CS, 8: CS, 9: CB, 10: CS, 11: OL})
 
-    # Legs — stride: front leg forward, back leg behind
+
+def draw_legs_left_walk_1(p):
+    """Legs/feet for left walk 1 (rows 15-23) — stride: front leg forward, back leg behind."""
     set_row(p, 15, {5: OL, 6: PB, 7: PB, 8: PS, 9: PB, 10: OL})
     set_row(p, 16, {4: OL, 5: PB, 6: PB, 7: PS, 8: PB, 9: PB, 10: OL})
     set_row(p, 17, {3: OL, 4: PB, 5: PS, 6: OL, 8: OL, 9: PB, 10: OL})
@@ -383,18 +303,10 @@ def make_walk_left_1():
     set_row(p, 22, {1: OL, 2: ShB, 3: ShS, 4: ShS, 5: ShS, 6: OL, 9: OL, 10: ShS, 11: OL})
     set_row(p, 23, {2: OL, 3: OL, 4: OL, 5: OL, 6: OL, 10: OL, 11: OL})
 
-    return make_image(p)
-
-
-# ============================================================
-# WALK LEFT 2 — Walking left, stride pose 2 (back leg forward)
-# ============================================================
-def make_walk_left_2():
-    p = new_grid()
-    copy_head_left(p)
 
-    # Torso — opposite arm swing (back arm visible)
-    set_row(p, 9,  {4: OL, 5: CH, 6: CB, 7: CB, 8: CB, 9: CS, 10: CB, 11: OL})
+def draw_torso_left_walk_2(p):
+    """Hoodie torso for left walk 2 (rows 9-14) — opposite arm swing (back arm visible)."""
+    set_row(p, 9, {4: OL, 5: CH, 6: CB, 7: CB, 8: CB, 9: CS, 10: CB, 11: OL})
     set_row(p, 10, {3: OL, 4: CB, 5: CH, 6: CB, 7: CB, 8: CB, 9: CS, 10: CB, 11: OL})
     # Back arm swings forward — hand pixel behind body
     set_row(p, 11, {3: OL, 4: CS, 5: CB, 6: CB, 7: CS, 8: CB, 9: CB, 10: CS, 11: OL, 12: SS, 13: OL})
@@ -402,7 +314,9 @@ def make_walk_left_2():
     set_row(p, 13, {4: OL, 5: CB, 6: CS, 7: CB, 8: CB, 9: CS, 10: CB, 11: OL})
     set_row(p, 14, {4: OL, 5: CS, 6: CB, 7: CS, 8: CS, 9: CB, 10: CS, 11: OL})
 
-    # Legs — opposite stride
+
+def draw_legs_left_walk_2(p):
+    """Legs/feet for left walk 2 (rows 15-23) — opposite stride."""
     set_row(p, 15, {5: OL, 6: PB, 7: PB, 8: PS, 9: PB, 10: OL})
     set_row(p, 16, {5: OL, 6: PB, 7: PS, 8: PB, 9: PB, 10: PB, 11: OL})
     set_row(p, 17, {5: OL, 6: PB, 7: OL, 8: OL, 9: PS, 10: PB, 11: OL})
@@ -414,67 +328,129 @@ def make_walk_left_2():
     set_row(p, 22, {4: OL, 5: ShS, 6: OL, 8: OL, 9: ShS, 10: ShS, 11: ShB, 12: ShB, 13: OL})
     set_row(p, 23, {4: OL, 5: OL, 9: OL, 10: OL, 11: OL, 12: OL, 13: OL})
 
-    return make_image(p)
-
 
 # ============================================================
-# MAIN — Generate all 12 sprites
+# LAYERS — every body part is painted once into a cached band and
+# frames are composited from the bands (pixelkit.layers)
 # ============================================================
-def main():
-    out_dir = "/Users/macbook/Flat101/godtest/vdh-godot/assets/sprites/player"
-    os.makedirs(out_dir, exist_ok=True)
+BANDS = {"head": (0, 9), "torso": (9, 15), "legs": (15, 24)}  # rows [top, bottom)
+VIEWS = ("down", "up", "left")
+POSES = ("idle", "walk_1", "walk_2")
+
+# (part, view) -> painter per pose; poses sharing a painter share its layer,
+# so the 9 drawn frames need 18 layers instead of 27
+PARTS = {
+    ("head", "down"): (copy_head_front, copy_head_front, copy_head_front),
+    ("torso", "down"): (draw_torso_front_idle, draw_torso_front_idle, draw_torso_front_walk_2),
+    ("legs", "down"): (draw_legs_front_idle, draw_legs_front_walk_1, draw_legs_front_walk_2),
+    ("head", "up"): (copy_head_back, copy_head_back, copy_head_back),
+    ("torso", "up"): (draw_torso_back_idle, draw_torso_back_idle, draw_torso_back_idle),
+    ("legs", "up"): (draw_legs_back_idle, draw_legs_back_walk_1, draw_legs_back_walk_2),
+    ("head", "left"): (copy_head_left, copy_head_left, copy_head_left),
+    ("torso", "left"): (draw_torso_left_idle, draw_torso_left_walk_1, draw_torso_left_walk_2),
+    ("legs", "left"): (draw_legs_left_idle, draw_legs_left_walk_1, draw_legs_left_walk_2),
+}
+
+
+@lru_cache(maxsize=None)
+def paint_layer(painter, part):
+    """The band of one body part, painted the first time a frame needs it (once per build process)."""
+    top, bottom = BANDS[part]
+    p = new_grid()
+    painter(p)
+    return make_image(p).crop((0, top, W, bottom))
 
-    sprites = {}
 
-    # Idle sprites
-    print("Generating idle_down...")
-    sprites["idle_down"] = make_idle_down()
+def part_layer(part, view, pose):
+    return paint_layer(PARTS[part, view][POSES.index(pose)], part)
 
-    print("Generating idle_up...")
-    sprites["idle_up"] = make_idle_up()
 
-    print("Generating idle_left...")
-    sprites["idle_left"] = make_idle_left()
+def compose_frame(view, pose):
+    """One 16x24 frame: head, torso and legs layers at their band offsets."""
+    return layers.compose((W, H), [(part_layer(part, view, pose), (0, top))
+                                   for part, (top, _) in BANDS.items()])
 
-    print("Generating idle_right (mirror of left)...")
-    sprites["idle_right"] = mirror_image(sprites["idle_left"])
 
-    # Walk down sprites
-    print("Generating walk_down_1...")
-    sprites["walk_down_1"] = make_walk_down_1()
+def register_frame(view, pose):
+    name = "player/idle_%s" % view if pose == "idle" else "player/walk_%s_%s" % (view, pose[-1])
 
-    print("Generating walk_down_2...")
-    sprites["walk_down_2"] = make_walk_down_2()
+    @asset(name, size=(W, H), tags=("characters",))
+    def make_frame():
+        return compose_frame(view, pose)
+    return make_frame
 
-    # Walk up sprites
-    print("Generating walk_up_1...")
-    sprites["walk_up_1"] = make_walk_up_1()
 
-    print("Generating walk_up_2...")
-    sprites["walk_up_2"] = make_walk_up_2()
+for _view in VIEWS:
+    for _pose in POSES:
+        register_frame(_view, _pose)
+
+# ============================================================
+# WALK/IDLE RIGHT — Horizontal mirrors of the left-facing frames
+# ============================================================
+@asset("player/idle_right", size=(W, H), tags=("characters",), deps=("player/idle_left",))
+def make_idle_right(idle_left):
+    return mirror_image(idle_left)
+
+
+@asset("player/walk_right_1", size=(W, H), tags=("characters",), deps=("player/walk_left_1",))
+def make_walk_right_1(walk_left_1):
+    return mirror_image(walk_left_1)
 
-    # Walk left sprites
-    print("Generating walk_left_1...")
-    sprites["walk_left_1"] = make_walk_left_1()
 
-    print("Generating walk_left_2...")
-    sprites["walk_left_2"] = make_walk_left_2()
+@asset("player/walk_right_2", size=(W, H), tags=("characters",), deps=("player/walk_left_2",))
+def make_walk_right_2(walk_left_2):
+    return mirror_image(walk_left_2)
 
-    # Walk right sprites (mirror of left)
-    print("Generating walk_right_1 (mirror of walk_left_1)...")
-    sprites["walk_right_1"] = mirror_image(sprites["walk_left_1"])
 
-    print("Generating walk_right_2 (mirror of walk_left_2)...")
-    sprites["walk_right_2"] = mirror_image(sprites["walk_left_2"])
+# ============================================================
+# SPRITESHEET — 3 cols (idle, walk_1, walk_2) x 4 rows (down, up, left, right)
+# ============================================================
+SHEET_CELL = (48, 48)   # player.gd _setup_from_spritesheet
+SHEET_SCALE = 2         # drawn at 0.5 in game, so frames stay 16x24 on screen
+SHEET_PADDING = 0
+SHEET_EXTRUDE = 0
+SHEET_FRAMES = [
+    "player/%s" % frame
+    for d in ("down", "up", "left", "right")
+    for frame in ("idle_" + d, "walk_%s_1" % d, "walk_%s_2" % d)
+]
+# idle = col 0, walk = idle/step1/idle/step2, as indices into SHEET_FRAMES
+SHEET_ANIMATIONS = godot.four_way(3, {"idle": ([0], 8), "walk": ([0, 1, 0, 2], 8)})
+
+
+# Opt-in (--variants): the committed cristian_spritesheet.png is hand-painted
+# and stays the sheet player.gd loads. The right row mirrors the left one, so
+# it is stored once and played with flip_h.
+@asset("player/cristian_spritesheet", variant="generated", tags=("characters", "sheet"), deps=SHEET_FRAMES)
+def make_spritesheet(*frames):
+    unique, _ = sheets.dedupe(frames, SHEET_ANIMATIONS)
+    return sheets.assemble(unique, 3, SHEET_CELL, SHEET_PADDING, SHEET_EXTRUDE, SHEET_SCALE)
+
+
+# SpriteFrames for the generated sheet; regions are trimmed to each frame's
+# opaque pixels, the AtlasTexture margin keeps the 48x48 cell (and its anchor)
+@asset("player/cristian_frames", variant="generated",
+       output="assets/sprites/player/cristian_spritesheet_generated.tres",
+       tags=("characters", "godot"), deps=("player/cristian_spritesheet@generated",) + tuple(SHEET_FRAMES))
+def make_sprite_frames(sheet, *frames):
+    unique, refs = sheets.dedupe(frames, SHEET_ANIMATIONS)
+    regions = sheets.grid_regions(3, -(-len(unique) // 3), SHEET_CELL, SHEET_PADDING, SHEET_EXTRUDE)
+    regions, trims = sheets.trim_regions(sheet, regions)
+    return godot.sprite_frames_tres(godot.res_path(default_output("player/cristian_spritesheet@generated")),
+                                    regions, sheets.remap(SHEET_ANIMATIONS, refs), trims=trims)
 
-    # Save all sprites
-    print("\nSaving sprites...")
-    for name, img in sprites.items():
-        filepath = os.path.join(out_dir, f"{name}.png")
-        img.save(filepath)
-        print(f"  Saved: {filepath} ({img.size[0]}x{img.size[1]})")
 
-    # Verification
+# ============================================================
+# MAIN — Generate all 12 sprites
+# ============================================================
+def main(argv=None):
+    args = build.parse_args(argv)
+    status = build.run(args, sources=[__file__])
+    if status or args.list:
+        return status
+    records = Manifest.for_root(args.root).by_output()
+
+    # Verification (from the build manifest, no PNG decoding)
     print("\n=== VERIFICATION ===")
     expected = [
         "idle_down.png", "idle_up.png", "idle_left.png", "idle_right.png",
@@ -483,16 +459,12 @@ def main():
     ]
     all_ok = True
     for fname in expected:
-        fpath = os.path.join(out_dir, fname)
-        if os.path.exists(fpath):
-            img = Image.open(fpath)
-            if img.size == (16, 24) and img.mode == "RGBA":
-                # Count non-transparent pixels
-                data = list(img.getdata())
-                opaque = sum(1 for px in data if px[3] > 0)
-                print(f"  [OK] {fname} — 16x24 RGBA, {opaque} opaque pixels")
+        rec = records.get("assets/sprites/player/" + fname)
+        if rec and os.path.exists(os.path.join(args.root, rec["output"])):
+            if (rec["width"], rec["height"]) == (16, 24) and rec["mode"] in ("RGBA", "P"):
+                print(f"  [OK] {fname} — 16x24 {rec['mode']}, {rec['opaque']} opaque pixels, {rec['colors']} colors")
             else:
-                print(f"  [WARN] {fname} — size={img.size}, mode={img.mode}")
+                print(f"  [WARN] {fname} — size=({rec['width']}, {rec['height']}), mode={rec['mode']}")
                 all_ok = False
         else:
             print(f"  [FAIL] {fname} — NOT FOUND")
@@ -512,7 +484,8 @@ def main():
     print("  Hoodie:         #3B5998 base / #5B79B8 highlight / #2A4070 shadow")
     print("  Pants:          #2B2B3B base / #1B1B2B shadow")
     print("  Shoes:          #5A3B20 base / #3A2510 shadow")
+    return 0 if all_ok else 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(sys.argv[1:]))
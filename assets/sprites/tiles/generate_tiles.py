@@ -1,87 +1,73 @@
 #!/usr/bin/env python3
 """
-Generate 22 SNES-style (16-bit era) pixel art tiles.
+Generate 22 SNES-style (16-bit era) pixel art tiles, the floor variant strip
+with its TileSet, and the seam report of the floor and wall tiles.
 Style: Zelda A Link to the Past — rich textures, dithering, 3+ tones per material.
 All tiles are 16x16 pixels.
 """
 
+import json
+import os
 import random
 import math
-from PIL import Image
+import sys
 
-random.seed(42)  # Reproducible results
+import numpy as np
 
-OUT = "/Users/macbook/Flat101/godtest/vdh-godot/assets/sprites/tiles/"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "tools"))
+from pixelkit import Canvas, build, godot, noise, primitives, registry, tiling
+from pixelkit.primitives import palette_array, parity_dither, random_fill
+from pixelkit.registry import asset
+from pixelkit.tiling import WrapCanvas
 
 def hex2rgb(h):
     h = h.lstrip("#")
     return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16))
 
 def make_img():
-    return Image.new("RGBA", (16, 16), (0, 0, 0, 255))
+    return Canvas(16, 16, (0, 0, 0, 255))
+
+TILE = (16, 16)
+
+def floor_seeds(name, k):
+    """(seeds, border) of k variants of a noise floor; the first seed is the floor tile itself."""
+    seed = registry.seed_for(name)
+    return [(seed + i) & 0xFFFFFFFF for i in range(k)], seed >> 32
+
+def make_tile():
+    """Canvas for floors and walls: drawing wraps around so the tile repeats seamlessly."""
+    return WrapCanvas(16, 16, (0, 0, 0, 255))
 
 def px(img, x, y, color):
-    if 0 <= x < 16 and 0 <= y < 16:
-        if isinstance(color, str):
-            color = hex2rgb(color)
-        if len(color) == 3:
-            color = color + (255,)
-        img.putpixel((x, y), color)
+    img.put(x, y, color)
 
 def gp(img, x, y):
-    if 0 <= x < 16 and 0 <= y < 16:
-        return img.getpixel((x, y))
-    return (0, 0, 0, 255)
+    return img.get(x, y, (0, 0, 0, 255))
 
-def dither_fill(img, x0, y0, w, h, c1, c2, density=0.5):
+def dither_fill(img, x0, y0, w, h, c1, c2, density=0.5, rng=random):
     """Fill rectangle with checkerboard dither between two colors."""
-    if isinstance(c1, str): c1 = hex2rgb(c1)
-    if isinstance(c2, str): c2 = hex2rgb(c2)
-    for y in range(y0, y0 + h):
-        for x in range(x0, x0 + w):
-            if (x + y) % 2 == 0:
-                px(img, x, y, c1 if random.random() > density * 0.3 else c2)
-            else:
-                px(img, x, y, c2 if random.random() > density * 0.3 else c1)
+    primitives.dither_fill(img, x0, y0, w, h, c1, c2, density, rng=rng)
 
-def noise_fill(img, x0, y0, w, h, colors, weights=None):
+def noise_fill(img, x0, y0, w, h, colors, weights=None, rng=random):
     """Fill rectangle with random noise from a palette."""
-    if weights is None:
-        weights = [1.0 / len(colors)] * len(colors)
-    total = sum(weights)
-    weights = [w / total for w in weights]
-    for y in range(y0, y0 + h):
-        for x in range(x0, x0 + w):
-            r = random.random()
-            cumulative = 0
-            for i, w_val in enumerate(weights):
-                cumulative += w_val
-                if r <= cumulative:
-                    c = colors[i]
-                    if isinstance(c, str): c = hex2rgb(c)
-                    px(img, x, y, c)
-                    break
+    primitives.noise_fill(img, x0, y0, w, h, colors, weights, rng=rng)
 
 def rect(img, x0, y0, w, h, color):
-    if isinstance(color, str): color = hex2rgb(color)
-    for y in range(y0, y0 + h):
-        for x in range(x0, x0 + w):
-            px(img, x, y, color)
+    primitives.rect(img, x0, y0, w, h, color)
 
 def hline(img, x0, x1, y, color):
-    for x in range(x0, x1 + 1):
-        px(img, x, y, color)
+    primitives.hline(img, x0, x1, y, color)
 
 def vline(img, x, y0, y1, color):
-    for y in range(y0, y1 + 1):
-        px(img, x, y, color)
+    primitives.vline(img, x, y0, y1, color)
 
 
 # ============================================================
 # 1. floor_wood.png
 # ============================================================
-def gen_floor_wood():
-    img = make_img()
+@asset("tiles/floor_wood", size=(16, 16), tags=("floor",))
+def gen_floor_wood(rng):
+    img = make_tile()
     base = hex2rgb("#8B6B4A")
     highlight = hex2rgb("#A08060")
     shadow = hex2rgb("#6B4B2A")
@@ -104,10 +90,9 @@ def gen_floor_wood():
                     px(img, x, y, base)
 
         # Highlight along top edge of plank
+        random_fill(img, 0, py0, 16, 1, (None, highlight), (0.15,), inclusive=True, rng=rng)
+        # Additional grain on highlight row
         for x in range(16):
-            if random.random() > 0.15:
-                px(img, x, py0, highlight)
-            # Additional grain on highlight row
             if (x + py0) % 5 == 0:
                 px(img, x, py0, grain)
 
@@ -119,10 +104,9 @@ def gen_floor_wood():
                 px(img, x, py1, deep)
 
     # Wood grain: scattered lighter pixels along planks
-    random.seed(100)
     for _ in range(20):
-        gx = random.randint(0, 15)
-        gy = random.randint(0, 15)
+        gx = rng.randint(0, 15)
+        gy = rng.randint(0, 15)
         # Don't overwrite groove lines
         if gy not in [4, 9, 15]:
             px(img, gx, gy, grain)
@@ -139,15 +123,15 @@ def gen_floor_wood():
         for nx in [1, 14]:
             px(img, nx, py0 + 1, nail)
 
-    img.save(OUT + "floor_wood.png")
-    print("  floor_wood.png")
+    return img
 
 
 # ============================================================
 # 2. floor_tile_kitchen.png
 # ============================================================
+@asset("tiles/floor_tile_kitchen", size=(16, 16), tags=("floor",))
 def gen_floor_tile_kitchen():
-    img = make_img()
+    img = make_tile()
     light = hex2rgb("#D4C8B0")
     dark = hex2rgb("#C4B8A0")
     grout = hex2rgb("#AAA090")
@@ -184,231 +168,151 @@ def gen_floor_tile_kitchen():
                         else:
                             px(img, x, y, base)
 
-    img.save(OUT + "floor_tile_kitchen.png")
-    print("  floor_tile_kitchen.png")
+    return img
 
 
 # ============================================================
 # 3. floor_grass.png
 # ============================================================
+@asset("tiles/floor_grass", size=(16, 16), tags=("floor",))
 def gen_floor_grass():
-    img = make_img()
-    base = hex2rgb("#4A8B3A")
-    dark = hex2rgb("#3A6B2A")
-    light = hex2rgb("#6AAB5A")
-    flower_y = hex2rgb("#DDCC44")
-    flower_w = (240, 240, 240)
-    mid = hex2rgb("#408030")
-
-    random.seed(77)
-    for y in range(16):
-        for x in range(16):
-            # Dithered base between base and dark
-            if (x + y) % 2 == 0:
-                px(img, x, y, base)
-            else:
-                px(img, x, y, dark if random.random() > 0.4 else base)
-
-    # Lighter grass tips scattered
-    for _ in range(18):
-        gx = random.randint(0, 15)
-        gy = random.randint(0, 15)
-        px(img, gx, gy, light)
+    return WrapCanvas.from_array(grass_tiles(*floor_seeds("tiles/floor_grass", 1))[0])
 
-    # Mid-tone tufts
-    for _ in range(12):
-        gx = random.randint(0, 15)
-        gy = random.randint(0, 15)
-        px(img, gx, gy, mid)
 
-    # Dark tufts (clusters of 2-3 dark pixels)
-    tuft_positions = [(2, 3), (3, 3), (8, 11), (9, 11), (13, 6), (14, 6), (5, 14), (1, 9)]
-    for tx, ty in tuft_positions:
-        px(img, tx, ty, dark)
+def grass_tiles(seeds, border=None):
+    """(N, 16, 16, 4) grass tiles, one per seed; a shared border seed makes them join each other."""
+    # dark to light, then the two flower colours
+    palette = palette_array(["#3A6B2A", "#408030", "#4A8B3A", "#6AAB5A", "#DDCC44", (240, 240, 240)])
 
-    # Tiny flower dots
-    flowers = [(4, 7, flower_y), (11, 2, flower_w), (1, 13, flower_y), (14, 10, flower_w)]
-    for fx, fy, fc in flowers:
-        px(img, fx, fy, fc)
+    # Clumps of dark and light grass from fractal value noise, blue-noise dithered
+    clumps = noise.equalize(noise.value_noise(TILE, 4, seeds, octaves=2, border=border))
+    index = noise.quantize(clumps, (0.2, 0.35, 0.9), noise.masks(TILE, noise.blue_noise(16), seeds), 0.5)
 
-    img.save(OUT + "floor_grass.png")
-    print("  floor_grass.png")
+    # Tiny flower dots, yellow or white
+    dots = noise.white(TILE, seeds, salt=1)
+    index[dots > 0.988] = 4
+    index[dots > 0.994] = 5
+    return palette[index]
 
 
 # ============================================================
 # 4. floor_concrete.png
 # ============================================================
+@asset("tiles/floor_concrete", size=(16, 16), tags=("floor",))
 def gen_floor_concrete():
-    img = make_img()
-    base = hex2rgb("#B0B0B0")
-    tex = hex2rgb("#A0A0A0")
-    crack = hex2rgb("#888888")
-    spot = hex2rgb("#C0C0C0")
-    dark_spot = hex2rgb("#989898")
-
-    random.seed(33)
-    # Dithered base
-    for y in range(16):
-        for x in range(16):
-            if (x + y) % 2 == 0:
-                px(img, x, y, base)
-            else:
-                px(img, x, y, tex if random.random() > 0.5 else base)
-
-    # Extra noise texture
-    for _ in range(15):
-        sx = random.randint(0, 15)
-        sy = random.randint(0, 15)
-        px(img, sx, sy, dark_spot)
-
-    # Aggregate spots (lighter)
-    for _ in range(12):
-        sx = random.randint(0, 15)
-        sy = random.randint(0, 15)
-        px(img, sx, sy, spot)
-
-    # Diagonal crack line
-    for i in range(16):
-        cx = i
-        cy = i
-        if 0 <= cx < 16 and 0 <= cy < 16:
-            px(img, cx, cy, crack)
-            # Crack shadow
-            if cx + 1 < 16:
-                if random.random() > 0.5:
-                    px(img, cx + 1, cy, hex2rgb("#909090"))
-
-    img.save(OUT + "floor_concrete.png")
-    print("  floor_concrete.png")
+    return WrapCanvas.from_array(concrete_tiles(*floor_seeds("tiles/floor_concrete", 1))[0])
+
+
+def concrete_tiles(seeds, border=None):
+    """(N, 16, 16, 4) concrete tiles, one per seed; a shared border seed makes them join each other."""
+    # tex, base, dark spot, spot, crack, crack shadow
+    palette = palette_array(["#A0A0A0", "#B0B0B0", "#989898", "#C0C0C0", "#888888", "#909090"])
+
+    # Dithered base: broad patches of texture and base, Bayer ordered at the edges
+    patches = noise.equalize(noise.value_noise(TILE, 4, seeds, octaves=2, border=border))
+    index = noise.quantize(patches, (0.5,), np.tile(noise.bayer(4), (4, 4)), 0.6)
+
+    # Darker noise texture and lighter aggregate spots
+    grit = noise.white(TILE, seeds, salt=1)
+    index[grit < 0.06] = 2
+    index[grit > 0.95] = 3
+
+    # Diagonal crack line with a broken shadow to its right, wrapping into the next tile
+    diagonal = np.arange(16)
+    index[:, diagonal, diagonal] = 4
+    tiles, ys = np.nonzero(noise.white((1, 16), seeds, salt=2)[:, :, 0] > 0.5)
+    index[tiles, ys, (ys + 1) % 16] = 5
+    return palette[index]
 
 
 # ============================================================
 # 5. floor_asphalt.png
 # ============================================================
+@asset("tiles/floor_asphalt", size=(16, 16), tags=("floor",))
 def gen_floor_asphalt():
-    img = make_img()
-    base = hex2rgb("#505050")
-    light = hex2rgb("#585858")
-    dark = hex2rgb("#484848")
-    speck = hex2rgb("#606060")
-    very_dark = hex2rgb("#404040")
-
-    random.seed(55)
-    # Noise-dithered fill
-    for y in range(16):
-        for x in range(16):
-            r = random.random()
-            if r < 0.40:
-                px(img, x, y, base)
-            elif r < 0.65:
-                px(img, x, y, light)
-            elif r < 0.85:
-                px(img, x, y, dark)
-            else:
-                px(img, x, y, very_dark)
+    return WrapCanvas.from_array(asphalt_tiles(*floor_seeds("tiles/floor_asphalt", 1))[0])
 
-    # Lighter speckles
-    for _ in range(8):
-        sx = random.randint(0, 15)
-        sy = random.randint(0, 15)
-        px(img, sx, sy, speck)
 
-    # A few very dark pits
-    for _ in range(5):
-        sx = random.randint(0, 15)
-        sy = random.randint(0, 15)
-        px(img, sx, sy, hex2rgb("#3A3A3A"))
+def asphalt_tiles(seeds, border=None):
+    """(N, 16, 16, 4) asphalt tiles, one per seed; a shared border seed makes them join each other."""
+    # dark to light, then speckle and pit
+    palette = palette_array(["#404040", "#484848", "#505050", "#585858", "#606060", "#3A3A3A"])
 
-    img.save(OUT + "floor_asphalt.png")
-    print("  floor_asphalt.png")
+    # Fine even grain (blue noise) over faint wear patches: 15% very dark, 20% dark, 40% base, 25% light
+    grain = noise.masks(TILE, noise.blue_noise(16), seeds)
+    wear = noise.value_noise(TILE, 4, seeds, border=border)
+    index = noise.quantize(noise.equalize(0.7 * grain + 0.3 * wear), (0.15, 0.35, 0.75))
+
+    # Lighter speckles and a few very dark pits
+    grit = noise.white(TILE, seeds, salt=1)
+    index[grit > 0.97] = 4
+    index[grit < 0.02] = 5
+    return palette[index]
 
 
 # ============================================================
 # 6. floor_dirt.png
 # ============================================================
+@asset("tiles/floor_dirt", size=(16, 16), tags=("floor",))
 def gen_floor_dirt():
-    img = make_img()
-    base = hex2rgb("#9B7B5A")
-    tex = hex2rgb("#8B6B4A")
-    pebble_dark = hex2rgb("#7B5B3A")
-    pebble_light = hex2rgb("#B09070")
-    twig = hex2rgb("#5A3A1A")
-    mid = hex2rgb("#907050")
-
-    random.seed(44)
-    # Dithered base
-    for y in range(16):
-        for x in range(16):
-            if (x + y) % 2 == 0:
-                px(img, x, y, base)
-            else:
-                r = random.random()
-                if r < 0.5:
-                    px(img, x, y, tex)
-                elif r < 0.75:
-                    px(img, x, y, mid)
-                else:
-                    px(img, x, y, base)
+    return WrapCanvas.from_array(dirt_tiles(*floor_seeds("tiles/floor_dirt", 1))[0])
+
 
-    # Dark pebbles
-    pebbles_d = [(3, 5), (10, 2), (7, 12), (14, 8), (1, 14), (12, 14)]
-    for ppx, ppy in pebbles_d:
-        px(img, ppx, ppy, pebble_dark)
+def dirt_tiles(seeds, border=None):
+    """(N, 16, 16, 4) dirt tiles, one per seed; a shared border seed makes them join each other."""
+    # tex, mid, base, then dark and light pebbles and the twig
+    palette = palette_array(["#8B6B4A", "#907050", "#9B7B5A", "#7B5B3A", "#B09070", "#5A3A1A"])
 
-    # Light pebbles
-    pebbles_l = [(5, 9), (13, 4), (2, 11), (9, 7), (0, 3), (15, 1)]
-    for ppx, ppy in pebbles_l:
-        px(img, ppx, ppy, pebble_light)
+    # Packed earth from value noise, checkerboard-dithered like the old parity fill
+    earth = noise.equalize(noise.value_noise(TILE, 4, seeds, octaves=2, border=border))
+    index = noise.quantize(earth, (0.3, 0.55), np.tile(noise.bayer(2), (8, 8)), 0.5)
 
-    # Small twig detail
-    px(img, 6, 6, twig)
-    px(img, 7, 6, twig)
-    px(img, 8, 7, twig)
+    # Dark and light pebbles
+    pebbles = noise.white(TILE, seeds, salt=1)
+    index[pebbles < 0.025] = 3
+    index[pebbles > 0.975] = 4
 
-    img.save(OUT + "floor_dirt.png")
-    print("  floor_dirt.png")
+    # Small twig somewhere on the tile
+    x, y = (noise.white((2, 1), seeds, salt=2)[:, 0] * 16).astype(np.intp).T
+    tiles = np.arange(len(index))
+    for dx, dy in ((0, 0), (1, 0), (2, 1)):
+        index[tiles, (y + dy) % 16, (x + dx) % 16] = 5
+    return palette[index]
 
 
 # ============================================================
 # 7. floor_classroom.png
 # ============================================================
-def gen_floor_classroom():
-    img = make_img()
+@asset("tiles/floor_classroom", size=(16, 16), tags=("floor",))
+def gen_floor_classroom(rng):
+    img = make_tile()
     base = hex2rgb("#C8B898")
     tex = hex2rgb("#C0B090")
     shine = hex2rgb("#D8C8A8")
     dark = hex2rgb("#B8A888")
 
-    random.seed(22)
     # Subtle dithered base
-    for y in range(16):
-        for x in range(16):
-            if (x + y) % 2 == 0:
-                px(img, x, y, base)
-            else:
-                px(img, x, y, tex if random.random() > 0.6 else base)
+    parity_dither(img, 0, 0, 16, 16, base, tex, 0.6, rng=rng)
 
     # Wax shine lines every 8 rows
     for y in [0, 8]:
-        for x in range(16):
-            if random.random() > 0.2:
-                px(img, x, y, shine)
+        random_fill(img, 0, y, 16, 1, (None, shine), (0.2,), inclusive=True, rng=rng)
 
     # Very subtle extra texture
     for _ in range(8):
-        sx = random.randint(0, 15)
-        sy = random.randint(0, 15)
+        sx = rng.randint(0, 15)
+        sy = rng.randint(0, 15)
         px(img, sx, sy, dark)
 
-    img.save(OUT + "floor_classroom.png")
-    print("  floor_classroom.png")
+    return img
 
 
 # ============================================================
 # 8. wall_house.png
 # ============================================================
-def gen_wall_house():
-    img = make_img()
+@asset("tiles/wall_house", size=(16, 16), tags=("wall",))
+def gen_wall_house(rng):
+    img = make_tile()
     wall_base = hex2rgb("#D8C8A8")
     wall_tex = hex2rgb("#D0C0A0")
     board_base = hex2rgb("#8B7B5B")
@@ -417,18 +321,12 @@ def gen_wall_house():
     wall_dark = hex2rgb("#C8B898")
 
     # Upper 14 rows: cream wall with subtle dither texture
-    random.seed(88)
-    for y in range(14):
-        for x in range(16):
-            if (x + y) % 2 == 0:
-                px(img, x, y, wall_base)
-            else:
-                px(img, x, y, wall_tex if random.random() > 0.55 else wall_base)
+    parity_dither(img, 0, 0, 16, 14, wall_base, wall_tex, 0.55, rng=rng)
 
     # Subtle wall texture dots
     for _ in range(10):
-        sx = random.randint(0, 15)
-        sy = random.randint(0, 13)
+        sx = rng.randint(0, 15)
+        sy = rng.randint(0, 13)
         px(img, sx, sy, wall_dark)
 
     # Lower 2 rows: baseboard
@@ -444,33 +342,29 @@ def gen_wall_house():
     for x in range(0, 16, 4):
         px(img, x, 15, board_shadow)
 
-    img.save(OUT + "wall_house.png")
-    print("  wall_house.png")
+    return img
 
 
 # ============================================================
 # 9. wall_brick.png
 # ============================================================
+@asset("tiles/wall_brick", size=(16, 16), tags=("wall",))
 def gen_wall_brick():
-    img = make_img()
+    img = make_tile()
     brick_base = hex2rgb("#8B4513")
     brick_hi = hex2rgb("#A05520")
     brick_shadow = hex2rgb("#6B3510")
     mortar = hex2rgb("#C0B090")
     brick_mid = hex2rgb("#7B3A10")
 
-    random.seed(99)
-
     # Fill with mortar
-    for y in range(16):
-        for x in range(16):
-            px(img, x, y, mortar)
+    rect(img, 0, 0, 16, 16, mortar)
 
     def draw_brick(x0, y0, w, h):
         """Draw one brick with highlight top/left, shadow bottom/right, textured fill."""
         for by in range(y0, y0 + h):
             for bx in range(x0, x0 + w):
-                # Wrap for seamless tiling
+                # The canvas wraps; the texture phase follows the wrapped position
                 wx = bx % 16
                 wy = by % 16
                 lx = bx - x0
@@ -478,18 +372,18 @@ def gen_wall_brick():
 
                 # Highlight on top and left edges
                 if ly == 0 or lx == 0:
-                    px(img, wx, wy, brick_hi)
+                    px(img, bx, by, brick_hi)
                 # Shadow on bottom and right edges
                 elif ly == h - 1 or lx == w - 1:
-                    px(img, wx, wy, brick_shadow)
+                    px(img, bx, by, brick_shadow)
                 else:
                     # Textured fill with dither
                     if (wx + wy) % 3 == 0:
-                        px(img, wx, wy, brick_mid)
+                        px(img, bx, by, brick_mid)
                     elif (wx + wy) % 5 == 0:
-                        px(img, wx, wy, brick_hi)
+                        px(img, bx, by, brick_hi)
                     else:
-                        px(img, wx, wy, brick_base)
+                        px(img, bx, by, brick_base)
 
     # Row 1 (y=0..6): mortar at y=0, bricks y=1..6
     # Two full bricks: x=0..6 and x=8..14, mortar at x=7, x=15
@@ -525,22 +419,21 @@ def gen_wall_brick():
     for x in range(16):
         px(img, x, 15, mortar)
 
-    img.save(OUT + "wall_brick.png")
-    print("  wall_brick.png")
+    return img
 
 
 # ============================================================
 # 10. wall_school.png
 # ============================================================
+@asset("tiles/wall_school", size=(16, 16), tags=("wall",))
 def gen_wall_school():
-    img = make_img()
+    img = make_tile()
     base = hex2rgb("#A0A8B8")
     stripe = hex2rgb("#98A0B0")
     baseboard = hex2rgb("#707880")
     board_hi = hex2rgb("#808890")
     wall_light = hex2rgb("#A8B0C0")
 
-    random.seed(66)
     # Main wall area (rows 0-13)
     for y in range(14):
         for x in range(16):
@@ -563,29 +456,23 @@ def gen_wall_school():
         px(img, x, 14, board_hi)
         px(img, x, 15, baseboard)
 
-    img.save(OUT + "wall_school.png")
-    print("  wall_school.png")
+    return img
 
 
 # ============================================================
 # 11. wall_dark.png
 # ============================================================
-def gen_wall_dark():
-    img = make_img()
+@asset("tiles/wall_dark", size=(16, 16), tags=("wall",))
+def gen_wall_dark(rng):
+    img = make_tile()
     base = hex2rgb("#2A2A30")
     brick = hex2rgb("#323238")
     drip = hex2rgb("#222228")
     mortar = hex2rgb("#252530")
     highlight = hex2rgb("#38383E")
 
-    random.seed(13)
     # Dark dithered base
-    for y in range(16):
-        for x in range(16):
-            if (x + y) % 2 == 0:
-                px(img, x, y, base)
-            else:
-                px(img, x, y, brick if random.random() > 0.4 else base)
+    parity_dither(img, 0, 0, 16, 16, base, brick, 0.4, rng=rng)
 
     # Subtle brick pattern (barely visible)
     # Horizontal mortar lines
@@ -612,13 +499,13 @@ def gen_wall_dark():
     px(img, 2, 3, highlight)
     px(img, 10, 10, highlight)
 
-    img.save(OUT + "wall_dark.png")
-    print("  wall_dark.png")
+    return img
 
 
 # ============================================================
 # 12. bed.png
 # ============================================================
+@asset("tiles/bed", size=(16, 16), tags=("furniture",))
 def gen_bed():
     img = make_img()
 
@@ -693,13 +580,13 @@ def gen_bed():
     for x in range(2, 15):
         px(img, x, 6, blanket_hi)
 
-    img.save(OUT + "bed.png")
-    print("  bed.png")
+    return img
 
 
 # ============================================================
 # 13. desk.png
 # ============================================================
+@asset("tiles/desk", size=(16, 16), tags=("furniture",))
 def gen_desk():
     img = make_img()
 
@@ -760,13 +647,13 @@ def gen_desk():
     px(img, 13, 6, pencil_tip)
     px(img, 8, 6, hex2rgb("#CC9933"))
 
-    img.save(OUT + "desk.png")
-    print("  desk.png")
+    return img
 
 
 # ============================================================
 # 14. door_open.png
 # ============================================================
+@asset("tiles/door_open", size=(16, 16), tags=("furniture",))
 def gen_door_open():
     img = make_img()
 
@@ -816,13 +703,13 @@ def gen_door_open():
         px(img, 3, y, hex2rgb("#151518"))
         px(img, 12, y, hex2rgb("#151518"))
 
-    img.save(OUT + "door_open.png")
-    print("  door_open.png")
+    return img
 
 
 # ============================================================
 # 15. door_closed.png
 # ============================================================
+@asset("tiles/door_closed", size=(16, 16), tags=("furniture",))
 def gen_door_closed():
     img = make_img()
 
@@ -890,14 +777,14 @@ def gen_door_closed():
     for x in range(1, 15):
         px(img, x, 15, door_dark)
 
-    img.save(OUT + "door_closed.png")
-    print("  door_closed.png")
+    return img
 
 
 # ============================================================
 # 16. tree.png
 # ============================================================
-def gen_tree():
+@asset("tiles/tree", size=(16, 16), tags=("furniture",))
+def gen_tree(rng):
     img = make_img()
 
     trunk = hex2rgb("#5B3B1A")
@@ -909,9 +796,7 @@ def gen_tree():
     canopy_mid = hex2rgb("#307020")
 
     # Fill transparent
-    for y in range(16):
-        for x in range(16):
-            px(img, x, y, (0, 0, 0, 0))
+    rect(img, 0, 0, 16, 16, (0, 0, 0, 0))
 
     # Canopy (roughly circular)
     for y in range(0, 15):
@@ -960,22 +845,21 @@ def gen_tree():
         px(img, x, 11, canopy_shadow)
 
     # Canopy highlight scatter
-    random.seed(111)
     for _ in range(10):
-        hx = random.randint(2, 12)
-        hy = random.randint(1, 9)
+        hx = rng.randint(2, 12)
+        hy = rng.randint(1, 9)
         dx = hx - 7
         dy = hy - 7
         if math.sqrt(dx * dx + dy * dy) <= 6:
             px(img, hx, hy, canopy_hi)
 
-    img.save(OUT + "tree.png")
-    print("  tree.png")
+    return img
 
 
 # ============================================================
 # 17. fountain.png
 # ============================================================
+@asset("tiles/fountain", size=(16, 16), tags=("furniture",))
 def gen_fountain():
     img = make_img()
 
@@ -988,9 +872,7 @@ def gen_fountain():
     stone_dark = hex2rgb("#505858")
 
     # Fill transparent
-    for y in range(16):
-        for x in range(16):
-            px(img, x, y, (0, 0, 0, 0))
+    rect(img, 0, 0, 16, 16, (0, 0, 0, 0))
 
     cx, cy = 7.5, 7.5
     for y in range(16):
@@ -1040,14 +922,14 @@ def gen_fountain():
     px(img, 8, 7, water_hi)
     px(img, 7, 8, (200, 220, 240, 255))
 
-    img.save(OUT + "fountain.png")
-    print("  fountain.png")
+    return img
 
 
 # ============================================================
 # 18. locker.png
 # ============================================================
-def gen_locker():
+@asset("tiles/locker", size=(16, 16), tags=("furniture",))
+def gen_locker(rng):
     img = make_img()
 
     base = hex2rgb("#707880")
@@ -1058,9 +940,7 @@ def gen_locker():
     division = hex2rgb("#606870")
 
     # Main body
-    for y in range(16):
-        for x in range(16):
-            px(img, x, y, base)
+    rect(img, 0, 0, 16, 16, base)
 
     # Edges
     for y in range(16):
@@ -1094,20 +974,19 @@ def gen_locker():
     px(img, 5, 9, handle)
 
     # Subtle texture
-    random.seed(77)
     for _ in range(10):
-        sx = random.randint(1, 14)
-        sy = random.randint(5, 14)
-        px(img, sx, sy, shadow if random.random() > 0.5 else hi)
+        sx = rng.randint(1, 14)
+        sy = rng.randint(5, 14)
+        px(img, sx, sy, shadow if rng.random() > 0.5 else hi)
 
-    img.save(OUT + "locker.png")
-    print("  locker.png")
+    return img
 
 
 # ============================================================
 # 19. blackboard.png
 # ============================================================
-def gen_blackboard():
+@asset("tiles/blackboard", size=(16, 16), tags=("furniture",))
+def gen_blackboard(rng):
     img = make_img()
 
     board = hex2rgb("#2A4A3A")
@@ -1131,12 +1010,7 @@ def gen_blackboard():
         px(img, 15, y, frame_brown)
 
     # Board surface
-    for y in range(2, 13):
-        for x in range(2, 14):
-            if (x + y) % 2 == 0:
-                px(img, x, y, board)
-            else:
-                px(img, x, y, board_shadow if random.random() > 0.6 else board)
+    parity_dither(img, 2, 2, 12, 11, board, board_shadow, 0.6, rng=rng)
 
     # Chalk marks
     for x in [3, 4, 5, 7, 8, 10, 11, 12]:
@@ -1158,13 +1032,13 @@ def gen_blackboard():
     px(img, 6, 13, chalk)
     px(img, 10, 13, hex2rgb("#DDDD55"))
 
-    img.save(OUT + "blackboard.png")
-    print("  blackboard.png")
+    return img
 
 
 # ============================================================
 # 20. table_student.png
 # ============================================================
+@asset("tiles/table_student", size=(16, 16), tags=("furniture",))
 def gen_table_student():
     img = make_img()
 
@@ -1176,9 +1050,7 @@ def gen_table_student():
     leg_shadow = hex2rgb("#505050")
 
     # Fill transparent
-    for y in range(16):
-        for x in range(16):
-            px(img, x, y, (0, 0, 0, 0))
+    rect(img, 0, 0, 16, 16, (0, 0, 0, 0))
 
     # Table surface
     for y in range(2, 13):
@@ -1217,14 +1089,14 @@ def gen_table_student():
     for x in range(1, 15):
         px(img, x, 1, surface_dark)
 
-    img.save(OUT + "table_student.png")
-    print("  table_student.png")
+    return img
 
 
 # ============================================================
 # 21. fridge.png
 # ============================================================
-def gen_fridge():
+@asset("tiles/fridge", size=(16, 16), tags=("furniture",))
+def gen_fridge(rng):
     img = make_img()
 
     top = hex2rgb("#E8E8E8")
@@ -1236,9 +1108,7 @@ def gen_fridge():
     highlight = hex2rgb("#F0F0F0")
 
     # Main body
-    for y in range(16):
-        for x in range(16):
-            px(img, x, y, body)
+    rect(img, 0, 0, 16, 16, body)
 
     # Top (freezer) lighter
     for y in range(0, 6):
@@ -1281,19 +1151,18 @@ def gen_fridge():
         px(img, x, 15, dark_shadow)
 
     # Body texture
-    random.seed(200)
     for _ in range(8):
-        sx = random.randint(2, 12)
-        sy = random.randint(8, 14)
+        sx = rng.randint(2, 12)
+        sy = rng.randint(8, 14)
         px(img, sx, sy, shadow)
 
-    img.save(OUT + "fridge.png")
-    print("  fridge.png")
+    return img
 
 
 # ============================================================
 # 22. counter.png
 # ============================================================
+@asset("tiles/counter", size=(16, 16), tags=("furniture",))
 def gen_counter():
     img = make_img()
 
@@ -1361,46 +1230,83 @@ def gen_counter():
     px(img, 7, 11, knob)
     px(img, 8, 11, knob_hi)
 
-    img.save(OUT + "counter.png")
-    print("  counter.png")
+    return img
+
+
+# ============================================================
+# Floor variants: K seeded versions of each noise floor in one strip
+# ============================================================
+VARIANT_COUNT = 8
+BASE_WEIGHT = 4.0  # variant 0 is the floor tile itself, also used by STRETCH_TILE fills
+# (flip_h, flip_v, transpose) alternatives of every variant; the concrete crack
+# only keeps its direction when transposed
+FLIPS = ((False, False, False), (True, False, False), (False, True, False), (True, True, False))
+DIAGONAL = ((False, False, False), (False, False, True))
+# material -> (batch generator, floor asset, alternatives); one strip row each
+FLOOR_VARIANTS = {
+    "grass": (grass_tiles, "tiles/floor_grass", FLIPS),
+    "dirt": (dirt_tiles, "tiles/floor_dirt", FLIPS),
+    "asphalt": (asphalt_tiles, "tiles/floor_asphalt", FLIPS),
+    "concrete": (concrete_tiles, "tiles/floor_concrete", DIAGONAL),
+}
+VARIANT_STRIP = "tilesets/floor_variants"
+VARIANT_OUTPUT = "assets/sprites/tiles/floor_variants.png"
+
+
+@asset(VARIANT_STRIP, output=VARIANT_OUTPUT, size=(VARIANT_COUNT * 16, len(FLOOR_VARIANTS) * 16),
+       tags=("tilesets",))
+def gen_floor_variants():
+    rows = [make(*floor_seeds(name, VARIANT_COUNT)) for make, name, _ in FLOOR_VARIANTS.values()]
+    # (materials, K, 16, 16, 4) -> rows of K tiles side by side
+    strip = np.stack(rows).transpose(0, 2, 1, 3, 4).reshape(len(rows) * 16, VARIANT_COUNT * 16, 4)
+    return Canvas.from_array(strip)
+
+
+@asset("tilesets/floor_variants_tileset", output=VARIANT_OUTPUT[:-len(".png")] + ".tres",
+       tags=("tilesets", "godot"))
+def gen_floor_variants_tileset():
+    sources = []
+    for row, (material, (_, _, flips)) in enumerate(FLOOR_VARIANTS.items()):
+        weights = [BASE_WEIGHT] + [1.0] * (VARIANT_COUNT - 1)
+        tiles = [[(flip, weight / len(flips)) for flip in flips] for weight in weights]
+        sources.append((material, (0, row * 16), tiles))
+    return godot.tileset_tres(godot.res_path(VARIANT_OUTPUT), TILE, sources)
+
+
+# ============================================================
+# Seam report: every floor and wall tile checked in one batch
+# ============================================================
+# wrap line contrast / strongest line inside the tile
+SEAM_LIMIT = 1.0
+SEAM_TILES = registry.select(tags=("floor", "wall"), sources=[os.path.abspath(__file__)])
+
+
+@asset("reports/tile_seams", output="assets/sprites/tiles/seams.json", deps=[VARIANT_STRIP] + SEAM_TILES)
+def gen_seam_report(strip, *tiles):
+    # both wrap lines are checked on every tile: walls repeat downwards too,
+    # and a baseboard that meets the top of the next wall is reported as a seam
+    scores = tiling.seam_contrast(tiles)
+    edges = tiling.edge_contrast(tiles)
+    report = {}
+    for name, score, edge in zip(SEAM_TILES, scores, edges):
+        report[name] = {
+            "seam": [round(float(s), 3) for s in score],
+            "edge": [round(float(e), 1) for e in edge],
+            "seamless": [bool(s <= SEAM_LIMIT) for s in score],
+        }
+    # the variants of a material must also join each other, in any order
+    variants = {}
+    for row, material in enumerate(FLOOR_VARIANTS):
+        cells = [strip.crop((i * 16, row * 16, i * 16 + 16, row * 16 + 16)) for i in range(VARIANT_COUNT)]
+        score = tiling.joint_contrast(cells)
+        variants[material] = {"seam": [round(float(s), 3) for s in score],
+                              "seamless": [bool(s <= SEAM_LIMIT) for s in score]}
+    return json.dumps({"limit": SEAM_LIMIT, "tiles": report, "variants": variants},
+                      indent=1, sort_keys=True) + "\n"
 
 
 # ============================================================
 # Main
 # ============================================================
 if __name__ == "__main__":
-    print("Generating 22 SNES-style 16x16 pixel art tiles...")
-    print()
-
-    print("FLOORS:")
-    gen_floor_wood()
-    gen_floor_tile_kitchen()
-    gen_floor_grass()
-    gen_floor_concrete()
-    gen_floor_asphalt()
-    gen_floor_dirt()
-    gen_floor_classroom()
-
-    print()
-    print("WALLS:")
-    gen_wall_house()
-    gen_wall_brick()
-    gen_wall_school()
-    gen_wall_dark()
-
-    print()
-    print("FURNITURE:")
-    gen_bed()
-    gen_desk()
-    gen_door_open()
-    gen_door_closed()
-    gen_tree()
-    gen_fountain()
-    gen_locker()
-    gen_blackboard()
-    gen_table_student()
-    gen_fridge()
-    gen_counter()
-
-    print()
-    print("All 22 tiles generated successfully!")
+    sys.exit(build.main(sys.argv[1:], sources=[__file__]))
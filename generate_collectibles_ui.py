@@ -3,17 +3,17 @@
 Generate 16x16 pixel art sprites for collectibles and UI elements
 for the 2D RPG "Versos de Hero".
 All sprites drawn pixel by pixel using Pillow.
+Registered as "flat" variants of the SNES-style set in generate_sprites.py,
+written next to it as <name>_flat.png.
 """
 
-from PIL import Image, ImageDraw
 import os
 import math
+import sys
 
-COLLECTIBLES_DIR = "/Users/macbook/Flat101/godtest/vdh-godot/assets/sprites/collectibles/"
-UI_DIR = "/Users/macbook/Flat101/godtest/vdh-godot/assets/sprites/ui/"
-
-os.makedirs(COLLECTIBLES_DIR, exist_ok=True)
-os.makedirs(UI_DIR, exist_ok=True)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "tools"))
+from pixelkit import Canvas, build
+from pixelkit.registry import asset
 
 T = (0, 0, 0, 0)  # Transparent
 
@@ -21,8 +21,9 @@ T = (0, 0, 0, 0)  # Transparent
 # =============================================================================
 # 1. comic_page.png (16x16)
 # =============================================================================
+@asset("collectibles/comic_page", variant="flat", size=(16, 16), tags=("collectible",))
 def make_comic_page():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     paper = (240, 240, 232, 255)
     fold = (210, 210, 200, 255)
     fold_dark = (190, 190, 180, 255)
@@ -97,15 +98,15 @@ def make_comic_page():
             img.putpixel((x, 11), line_color)
             img.putpixel((x, 13), line_color)
 
-    img.save(os.path.join(COLLECTIBLES_DIR, "comic_page.png"))
-    print("  [OK] comic_page.png")
+    return img
 
 
 # =============================================================================
 # 2. grandma_memory.png (16x16)
 # =============================================================================
+@asset("collectibles/grandma_memory", variant="flat", size=(16, 16), tags=("collectible",))
 def make_grandma_memory():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     cx, cy = 7.5, 7.5  # center
 
     for y in range(16):
@@ -138,15 +139,15 @@ def make_grandma_memory():
     for sx, sy in sparkles:
         img.putpixel((sx, sy), (255, 248, 220, 255))
 
-    img.save(os.path.join(COLLECTIBLES_DIR, "grandma_memory.png"))
-    print("  [OK] grandma_memory.png")
+    return img
 
 
 # =============================================================================
 # 3. graffiti.png (16x16)
 # =============================================================================
+@asset("collectibles/graffiti", variant="flat", size=(16, 16), tags=("collectible",))
 def make_graffiti():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     brick = (128, 128, 128, 255)
     mortar = (100, 100, 100, 255)
     magenta = (221, 68, 170, 255)
@@ -202,15 +203,15 @@ def make_graffiti():
     img.putpixel((5, 9), drip)
     img.putpixel((5, 10), drip)
 
-    img.save(os.path.join(COLLECTIBLES_DIR, "graffiti.png"))
-    print("  [OK] graffiti.png")
+    return img
 
 
 # =============================================================================
 # 4. safe_spot.png (16x16)
 # =============================================================================
+@asset("collectibles/safe_spot", variant="flat", size=(16, 16), tags=("collectible",))
 def make_safe_spot():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     cx, cy = 7.5, 7.5
 
     # Warm glow background
@@ -254,15 +255,15 @@ def make_safe_spot():
     for hx, hy in highlights:
         img.putpixel((hx, hy), (255, 240, 150, 180))
 
-    img.save(os.path.join(COLLECTIBLES_DIR, "safe_spot.png"))
-    print("  [OK] safe_spot.png")
+    return img
 
 
 # =============================================================================
 # 5. heart_full.png (8x8)
 # =============================================================================
+@asset("ui/heart_full", variant="flat", size=(8, 8), tags=("hud",))
 def make_heart_full():
-    img = Image.new("RGBA", (8, 8), T)
+    img = Canvas(8, 8, T)
     red = (224, 32, 32, 255)
     highlight = (255, 96, 96, 255)
 
@@ -285,15 +286,15 @@ def make_heart_full():
     img.putpixel((1, 1), highlight)
     img.putpixel((5, 1), highlight)
 
-    img.save(os.path.join(UI_DIR, "heart_full.png"))
-    print("  [OK] heart_full.png")
+    return img
 
 
 # =============================================================================
 # 6. heart_half.png (8x8)
 # =============================================================================
+@asset("ui/heart_half", variant="flat", size=(8, 8), tags=("hud",))
 def make_heart_half():
-    img = Image.new("RGBA", (8, 8), T)
+    img = Canvas(8, 8, T)
     red = (224, 32, 32, 255)
     gray = (64, 64, 64, 255)
     highlight = (255, 96, 96, 255)
@@ -321,15 +322,15 @@ def make_heart_half():
     # Highlight on left bump only
     img.putpixel((1, 1), highlight)
 
-    img.save(os.path.join(UI_DIR, "heart_half.png"))
-    print("  [OK] heart_half.png")
+    return img
 
 
 # =============================================================================
 # 7. heart_empty.png (8x8)
 # =============================================================================
+@asset("ui/heart_empty", variant="flat", size=(8, 8), tags=("hud",))
 def make_heart_empty():
-    img = Image.new("RGBA", (8, 8), T)
+    img = Canvas(8, 8, T)
     dark = (64, 64, 64, 255)
     inner = (80, 80, 80, 255)
 
@@ -365,15 +366,15 @@ def make_heart_empty():
         for x in row:
             img.putpixel((x, y), dark)
 
-    img.save(os.path.join(UI_DIR, "heart_empty.png"))
-    print("  [OK] heart_empty.png")
+    return img
 
 
 # =============================================================================
 # 8. soul_heart.png (16x16) - Undertale-style soul heart
 # =============================================================================
+@asset("ui/soul_heart", variant="flat", size=(16, 16), tags=("hud",))
 def make_soul_heart():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     red = (255, 0, 0, 255)
     highlight = (255, 255, 255, 255)
     dark_red = (200, 0, 0, 255)
@@ -408,15 +409,15 @@ def make_soul_heart():
     img.putpixel((4, 3), highlight)
     img.putpixel((4, 4), highlight)
 
-    img.save(os.path.join(UI_DIR, "soul_heart.png"))
-    print("  [OK] soul_heart.png")
+    return img
 
 
 # =============================================================================
 # 9. arrow_continue.png (8x8) - downward triangle
 # =============================================================================
+@asset("ui/arrow_continue", variant="flat", size=(8, 8), tags=("hud",))
 def make_arrow_continue():
-    img = Image.new("RGBA", (8, 8), T)
+    img = Canvas(8, 8, T)
     white = (255, 255, 255, 255)
 
     # Downward pointing triangle
@@ -433,15 +434,15 @@ def make_arrow_continue():
         for x in cols:
             img.putpixel((x, y), white)
 
-    img.save(os.path.join(UI_DIR, "arrow_continue.png"))
-    print("  [OK] arrow_continue.png")
+    return img
 
 
 # =============================================================================
 # 10. interact_icon.png (16x16) - "E" key icon
 # =============================================================================
+@asset("ui/interact_icon", variant="flat", size=(16, 16), tags=("hud",))
 def make_interact_icon():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     bg = (240, 232, 208, 255)
     border_c = (139, 123, 91, 255)
     dark = (42, 42, 42, 255)
@@ -500,15 +501,15 @@ def make_interact_icon():
         img.putpixel((x, 11), dark)
         img.putpixel((x, 12), dark)
 
-    img.save(os.path.join(UI_DIR, "interact_icon.png"))
-    print("  [OK] interact_icon.png")
+    return img
 
 
 # =============================================================================
 # 11. diary_icon.png (16x16)
 # =============================================================================
+@asset("ui/diary_icon", variant="flat", size=(16, 16), tags=("hud",))
 def make_diary_icon():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     cover = (139, 107, 58, 255)
     front = (160, 136, 74, 255)
     spine = (100, 76, 40, 255)
@@ -560,15 +561,15 @@ def make_diary_icon():
     img.putpixel((10, 7), clasp)
     img.putpixel((9, 8), clasp)
 
-    img.save(os.path.join(UI_DIR, "diary_icon.png"))
-    print("  [OK] diary_icon.png")
+    return img
 
 
 # =============================================================================
 # 12. guitar_icon.png (16x16)
 # =============================================================================
+@asset("ui/guitar_icon", variant="flat", size=(16, 16), tags=("hud",))
 def make_guitar_icon():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     body = (123, 91, 42, 255)
     front = (160, 136, 80, 255)
     sound_hole = (42, 26, 10, 255)
@@ -643,28 +644,11 @@ def make_guitar_icon():
     for x in range(6, 10):
         img.putpixel((x, 2), neck)
 
-    img.save(os.path.join(UI_DIR, "guitar_icon.png"))
-    print("  [OK] guitar_icon.png")
+    return img
 
 
 # =============================================================================
 # Run all generators
 # =============================================================================
 if __name__ == "__main__":
-    print("Generating collectible sprites...")
-    make_comic_page()
-    make_grandma_memory()
-    make_graffiti()
-    make_safe_spot()
-
-    print("\nGenerating UI sprites...")
-    make_heart_full()
-    make_heart_half()
-    make_heart_empty()
-    make_soul_heart()
-    make_arrow_continue()
-    make_interact_icon()
-    make_diary_icon()
-    make_guitar_icon()
-
-    print("\nAll 12 sprites generated successfully!")
+    sys.exit(build.main(sys.argv[1:], sources=[__file__], variants=True))
@@ -5,60 +5,40 @@ Style: Final Fantasy VI / Zelda: A Link to the Past
 All sprites use transparent backgrounds with proper shading (3+ tones).
 """
 
-from PIL import Image
 import math
 import os
+import sys
 
-COLLECTIBLES = "/Users/macbook/Flat101/godtest/vdh-godot/assets/sprites/collectibles/"
-UI = "/Users/macbook/Flat101/godtest/vdh-godot/assets/sprites/ui/"
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "tools"))
+from pixelkit import Canvas, build, shading, shapes
+from pixelkit.registry import asset
 
 T = (0, 0, 0, 0)  # transparent
 
 
 def px(img, x, y, color):
     """Set pixel with bounds checking."""
-    if 0 <= x < img.width and 0 <= y < img.height:
-        if len(color) == 3:
-            color = color + (255,)
-        img.putpixel((x, y), color)
+    img.put(x, y, color)
 
 
 def fill_rect(img, x0, y0, x1, y1, color):
     """Fill a rectangle inclusive."""
-    if len(color) == 3:
-        color = color + (255,)
-    for yy in range(y0, y1 + 1):
-        for xx in range(x0, x1 + 1):
-            px(img, xx, yy, color)
+    img.fill_rect(x0, y0, x1 - x0 + 1, y1 - y0 + 1, color)
 
 
-def paint_shape(img, rows, body_color, rim_color, dark_color):
+def paint_shape(img, rows, body_color, rim_color, dark_color, light=(1, -1)):
     """Paint a silhouette from string rows with rim lighting and dark core."""
-    filled = set()
-    for y, row in enumerate(rows):
-        for x, ch in enumerate(row):
-            if ch == 'x':
-                filled.add((x, y))
-                img.putpixel((x, y), body_color)
-
-    # Rim light on right side and top
-    for (fx, fy) in filled:
-        if (fx + 1, fy) not in filled:
-            img.putpixel((fx, fy), rim_color)
-        elif (fx, fy - 1) not in filled and fy > 0:
-            img.putpixel((fx, fy), rim_color)
-
-    # Dark core for deep interior pixels
-    for (fx, fy) in filled:
-        if all((fx + dx, fy + dy) in filled for dx in [-2, 0, 2] for dy in [-2, 0, 2] if not (dx == 0 and dy == 0)):
-            img.putpixel((fx, fy), dark_color)
+    shading.paint_shape(img, rows, body_color, rim_color, dark_color, light)
 
 
 # =============================================================================
 # 1. COMIC PAGE (16x16)
 # =============================================================================
+@asset("collectibles/comic_page", size=(16, 16), tags=("collectible",))
 def make_comic_page():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     border = (24, 20, 37, 255)
     paper = (240, 240, 232, 255)
     shadow = (216, 216, 208, 255)
@@ -146,15 +126,15 @@ def make_comic_page():
     px(img, 5, 11, black)
     px(img, 6, 11, black)
 
-    img.save(COLLECTIBLES + "comic_page.png")
-    print("  [OK] comic_page.png")
+    return img
 
 
 # =============================================================================
 # 2. GRANDMA MEMORY (16x16)
 # =============================================================================
+@asset("collectibles/grandma_memory", size=(16, 16), tags=("collectible",))
 def make_grandma_memory():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     cx, cy = 7.5, 7.5
 
     glow_rings = [
@@ -199,15 +179,15 @@ def make_grandma_memory():
     for pos in [(3, 3), (12, 3), (3, 12), (12, 12)]:
         px(img, pos[0], pos[1], (255, 255, 255, 160))
 
-    img.save(COLLECTIBLES + "grandma_memory.png")
-    print("  [OK] grandma_memory.png")
+    return img
 
 
 # =============================================================================
 # 3. GRAFFITI (16x16)
 # =============================================================================
+@asset("collectibles/graffiti", size=(16, 16), tags=("collectible",))
 def make_graffiti():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     base = (112, 112, 112, 255)
     brick_shadow = (96, 96, 96, 255)
     mortar = (136, 136, 136, 255)
@@ -263,15 +243,15 @@ def make_graffiti():
     px(img, 9, 10, (221, 68, 170, 200))
     px(img, 9, 11, (221, 68, 170, 140))
 
-    img.save(COLLECTIBLES + "graffiti.png")
-    print("  [OK] graffiti.png")
+    return img
 
 
 # =============================================================================
 # 4. SAFE SPOT (16x16)
 # =============================================================================
+@asset("collectibles/safe_spot", size=(16, 16), tags=("collectible",))
 def make_safe_spot():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     cx, cy = 7.5, 7.5
 
     # Radial warm glow
@@ -319,15 +299,15 @@ def make_safe_spot():
     for sx, sy in [(2, 10), (13, 6), (5, 13), (1, 5)]:
         px(img, sx, sy, dim)
 
-    img.save(COLLECTIBLES + "safe_spot.png")
-    print("  [OK] safe_spot.png")
+    return img
 
 
 # =============================================================================
 # 5. HEART FULL (8x8)
 # =============================================================================
+@asset("ui/heart_full", size=(8, 8), tags=("hud",))
 def make_heart_full():
-    img = Image.new("RGBA", (8, 8), T)
+    img = Canvas(8, 8, T)
     base = (224, 32, 32, 255)
     hi = (255, 64, 64, 255)
     sh = (170, 24, 24, 255)
@@ -360,15 +340,15 @@ def make_heart_full():
                 else:
                     img.putpixel((x, y), base)
 
-    img.save(UI + "heart_full.png")
-    print("  [OK] heart_full.png")
+    return img
 
 
 # =============================================================================
 # 6. HEART HALF (8x8)
 # =============================================================================
+@asset("ui/heart_half", size=(8, 8), tags=("hud",))
 def make_heart_half():
-    img = Image.new("RGBA", (8, 8), T)
+    img = Canvas(8, 8, T)
     red_base = (224, 32, 32, 255)
     red_hi = (255, 64, 64, 255)
     red_sh = (170, 24, 24, 255)
@@ -405,15 +385,15 @@ def make_heart_half():
                     else:
                         img.putpixel((x, y), gray_base)
 
-    img.save(UI + "heart_half.png")
-    print("  [OK] heart_half.png")
+    return img
 
 
 # =============================================================================
 # 7. HEART EMPTY (8x8)
 # =============================================================================
+@asset("ui/heart_empty", size=(8, 8), tags=("hud",))
 def make_heart_empty():
-    img = Image.new("RGBA", (8, 8), T)
+    img = Canvas(8, 8, T)
     outline = (64, 64, 64, 255)
     fill = (53, 53, 53, 255)
     hi = (69, 69, 69, 255)
@@ -452,15 +432,15 @@ def make_heart_empty():
                 else:
                     img.putpixel((x, y), fill)
 
-    img.save(UI + "heart_empty.png")
-    print("  [OK] heart_empty.png")
+    return img
 
 
 # =============================================================================
 # 8. SOUL HEART (16x16)
 # =============================================================================
+@asset("ui/soul_heart", size=(16, 16), tags=("hud",))
 def make_soul_heart():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     base = (255, 0, 0, 255)
     hi = (255, 68, 68, 255)
     shadow = (204, 0, 0, 255)
@@ -468,11 +448,12 @@ def make_soul_heart():
     white = (255, 255, 255, 255)
     bright_hi = (255, 120, 120, 255)
 
+    # x = heart, w = white highlight, b = bright highlight (upper bumps)
     rows = [
         "                ",  # 0
         "  xxxx  xxxx    ",  # 1
-        " xxxxxx xxxxxx  ",  # 2 (note: 7th col is gap between bumps)
-        " xxxxxxxxxxxxxx ",  # 3
+        " xxwwbx xxwwbx  ",  # 2 (note: 7th col is gap between bumps)
+        " xxwbxxxxxwbxxx ",  # 3
         " xxxxxxxxxxxxxx ",  # 4
         " xxxxxxxxxxxxxx ",  # 5
         "  xxxxxxxxxxxx  ",  # 6
@@ -487,46 +468,26 @@ def make_soul_heart():
         "                ",  # 15
     ]
 
-    filled = set()
-    for y, row in enumerate(rows):
-        for x, ch in enumerate(row):
-            if ch == 'x':
-                filled.add((x, y))
-
-    outline_set = set()
-    for (fx, fy) in filled:
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1)]:
-            if (fx + dx, fy + dy) not in filled:
-                outline_set.add((fx, fy))
-                break
-
-    for (x, y) in filled:
-        if (x, y) in outline_set:
-            img.putpixel((x, y), outline_col)
-        elif y <= 4 and x <= 7:
-            img.putpixel((x, y), hi)
-        elif y >= 9:
-            img.putpixel((x, y), shadow)
-        else:
-            img.putpixel((x, y), base)
+    heart = shapes.mask(rows, "xwb")
+    ys, xs = np.indices(heart.shape)
+    shapes.paint_zones(img, heart, [
+        (shapes.outline(heart, shapes.EDGE_8), outline_col),
+        ((ys <= 4) & (xs <= 7), hi),
+        (ys >= 9, shadow),
+    ], base)
 
     # White highlights on upper bumps
-    for hx, hy in [(3, 2), (4, 2), (3, 3), (10, 2), (11, 2), (10, 3)]:
-        if (hx, hy) in filled:
-            img.putpixel((hx, hy), white)
-    for hx, hy in [(4, 3), (5, 2), (11, 3), (12, 2)]:
-        if (hx, hy) in filled:
-            img.putpixel((hx, hy), bright_hi)
+    shapes.paint_roles(img, shapes.roles(rows, "xwb"), {2: white, 3: bright_hi})
 
-    img.save(UI + "soul_heart.png")
-    print("  [OK] soul_heart.png")
+    return img
 
 
 # =============================================================================
 # 9. ARROW CONTINUE (8x8)
 # =============================================================================
+@asset("ui/arrow_continue", size=(8, 8), tags=("hud",))
 def make_arrow_continue():
-    img = Image.new("RGBA", (8, 8), T)
+    img = Canvas(8, 8, T)
     white = (255, 255, 255, 255)
     shadow = (192, 192, 192, 255)
     dk_shadow = (160, 160, 160, 255)
@@ -542,27 +503,23 @@ def make_arrow_continue():
         "        ",
     ]
 
-    for y in range(8):
-        for x in range(8):
-            if arrow[y][x] == 'x':
-                right_edge = (x + 1 >= 8 or arrow[y][x + 1] == ' ')
-                bot_edge = (y + 1 >= 8 or arrow[y + 1][x] == ' ')
-                if right_edge and bot_edge:
-                    img.putpixel((x, y), dk_shadow)
-                elif right_edge or bot_edge:
-                    img.putpixel((x, y), shadow)
-                else:
-                    img.putpixel((x, y), white)
+    shape = shapes.mask(arrow)
+    right_edge = ~shapes.shift(shape, 1, 0)
+    bot_edge = ~shapes.shift(shape, 0, 1)
+    shapes.paint_zones(img, shape, [
+        (right_edge & bot_edge, dk_shadow),
+        (right_edge | bot_edge, shadow),
+    ], white)
 
-    img.save(UI + "arrow_continue.png")
-    print("  [OK] arrow_continue.png")
+    return img
 
 
 # =============================================================================
 # 10. INTERACT ICON (16x16)
 # =============================================================================
+@asset("ui/interact_icon", size=(16, 16), tags=("hud",))
 def make_interact_icon():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     bg_base = (232, 224, 200, 255)
     bg_shadow = (208, 200, 176, 255)
     bg_hi = (240, 232, 216, 255)
@@ -609,15 +566,15 @@ def make_interact_icon():
         px(img, x, 11, letter)
         px(img, x, 12, letter)
 
-    img.save(UI + "interact_icon.png")
-    print("  [OK] interact_icon.png")
+    return img
 
 
 # =============================================================================
 # 11. DIARY ICON (16x16)
 # =============================================================================
+@asset("ui/diary_icon", size=(16, 16), tags=("hud",))
 def make_diary_icon():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     cover = (123, 91, 58, 255)
     cover_sh = (90, 58, 32, 255)
     cover_hi = (155, 123, 90, 255)
@@ -675,15 +632,15 @@ def make_diary_icon():
     px(img, 10, 7, gold)
     px(img, 9, 8, gold)
 
-    img.save(UI + "diary_icon.png")
-    print("  [OK] diary_icon.png")
+    return img
 
 
 # =============================================================================
 # 12. GUITAR ICON (16x16)
 # =============================================================================
+@asset("ui/guitar_icon", size=(16, 16), tags=("hud",))
 def make_guitar_icon():
-    img = Image.new("RGBA", (16, 16), T)
+    img = Canvas(16, 16, T)
     body = (123, 91, 42, 255)
     body_sh = (90, 58, 24, 255)
     body_hi = (155, 123, 74, 255)
@@ -764,15 +721,15 @@ def make_guitar_icon():
     for y in [2, 4, 6, 8, 11, 12]:
         px(img, 8, y, string)
 
-    img.save(UI + "guitar_icon.png")
-    print("  [OK] guitar_icon.png")
+    return img
 
 
 # =============================================================================
 # 13. PROJ INSULT (16x8)
 # =============================================================================
+@asset("ui/proj_insult", size=(16, 8), tags=("battle",))
 def make_proj_insult():
-    img = Image.new("RGBA", (16, 8), T)
+    img = Canvas(16, 8, T)
     base = (170, 34, 34, 255)
     shadow = (136, 34, 34, 255)
     hi = (204, 68, 68, 255)
@@ -790,43 +747,28 @@ def make_proj_insult():
         "  xxxxxxxxxxxx  ",
     ]
 
-    filled = set()
-    for y in range(8):
-        for x in range(16):
-            if pill[y][x] == 'x':
-                filled.add((x, y))
-
-    outline_set = set()
-    for (fx, fy) in filled:
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            if (fx + dx, fy + dy) not in filled:
-                outline_set.add((fx, fy))
-                break
-
-    for (fx, fy) in filled:
-        if (fx, fy) in outline_set:
-            img.putpixel((fx, fy), outline)
-        elif fy <= 2:
-            img.putpixel((fx, fy), hi)
-        elif fy >= 6:
-            img.putpixel((fx, fy), shadow)
-        else:
-            img.putpixel((fx, fy), base)
+    shape = shapes.mask(pill)
+    ys = np.indices(shape.shape)[0]
+    shapes.paint_zones(img, shape, [
+        (shapes.outline(shape), outline),
+        (ys <= 2, hi),
+        (ys >= 6, shadow),
+    ], base)
 
     # Squiggly text
     for x in [4, 5, 6, 7, 8, 9, 10, 11]:
         ty = 3 if x % 3 == 0 else 4
         px(img, x, ty, text)
 
-    img.save(UI + "proj_insult.png")
-    print("  [OK] proj_insult.png")
+    return img
 
 
 # =============================================================================
 # 14. PROJ SLAP (12x12)
 # =============================================================================
+@asset("ui/proj_slap", size=(12, 12), tags=("battle",))
 def make_proj_slap():
-    img = Image.new("RGBA", (12, 12), T)
+    img = Canvas(12, 12, T)
     skin = (232, 184, 136, 255)
     skin_sh = (200, 152, 104, 255)
     skin_hi = (255, 208, 168, 255)
@@ -847,28 +789,13 @@ def make_proj_slap():
         "            ",
     ]
 
-    filled = set()
-    for y in range(12):
-        for x in range(12):
-            if fist[y][x] == 'x':
-                filled.add((x, y))
-
-    outline_set = set()
-    for (fx, fy) in filled:
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            if (fx + dx, fy + dy) not in filled:
-                outline_set.add((fx, fy))
-                break
-
-    for (fx, fy) in filled:
-        if (fx, fy) in outline_set:
-            img.putpixel((fx, fy), outline)
-        elif fx <= 4 and fy <= 4:
-            img.putpixel((fx, fy), skin_hi)
-        elif fx >= 8 or fy >= 8:
-            img.putpixel((fx, fy), skin_sh)
-        else:
-            img.putpixel((fx, fy), skin)
+    shape = shapes.mask(fist)
+    ys, xs = np.indices(shape.shape)
+    shapes.paint_zones(img, shape, [
+        (shapes.outline(shape), outline),
+        ((xs <= 4) & (ys <= 4), skin_hi),
+        ((xs >= 8) | (ys >= 8), skin_sh),
+    ], skin)
 
     # Finger curl lines
     for x in range(4, 9):
@@ -885,15 +812,15 @@ def make_proj_slap():
     px(img, 2, 7, skin)
     px(img, 2, 8, outline)
 
-    img.save(UI + "proj_slap.png")
-    print("  [OK] proj_slap.png")
+    return img
 
 
 # =============================================================================
 # 15. PROJ LAUGH (16x8)
 # =============================================================================
+@asset("ui/proj_laugh", size=(16, 8), tags=("battle",))
 def make_proj_laugh():
-    img = Image.new("RGBA", (16, 8), T)
+    img = Canvas(16, 8, T)
     base = (255, 221, 0, 255)
     shadow = (221, 187, 0, 255)
     hi = (255, 238, 68, 255)
@@ -935,15 +862,15 @@ def make_proj_laugh():
         if (sx, sy) not in all_set and 0 <= sx < 16 and 0 <= sy < 8:
             px(img, sx, sy, extrude)
 
-    img.save(UI + "proj_laugh.png")
-    print("  [OK] proj_laugh.png")
+    return img
 
 
 # =============================================================================
 # 16. PROJ PAPERBALL (8x8)
 # =============================================================================
+@asset("ui/proj_paperball", size=(8, 8), tags=("battle",))
 def make_proj_paperball():
-    img = Image.new("RGBA", (8, 8), T)
+    img = Canvas(8, 8, T)
     base = (232, 224, 208, 255)
     shadow = (208, 200, 184, 255)
     hi = (240, 232, 224, 255)
@@ -962,28 +889,13 @@ def make_proj_paperball():
         "        ",
     ]
 
-    filled = set()
-    for y in range(7):
-        for x in range(8):
-            if ball[y][x] == 'x':
-                filled.add((x, y))
-
-    outline_set = set()
-    for (fx, fy) in filled:
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            if (fx + dx, fy + dy) not in filled:
-                outline_set.add((fx, fy))
-                break
-
-    for (fx, fy) in filled:
-        if (fx, fy) in outline_set:
-            img.putpixel((fx, fy), outline)
-        elif fx <= 3 and fy <= 2:
-            img.putpixel((fx, fy), hi)
-        elif fx >= 5 and fy >= 4:
-            img.putpixel((fx, fy), shadow)
-        else:
-            img.putpixel((fx, fy), base)
+    shape = shapes.mask(ball)
+    ys, xs = np.indices(shape.shape)
+    shapes.paint_zones(img, shape, [
+        (shapes.outline(shape), outline),
+        ((xs <= 3) & (ys <= 2), hi),
+        ((xs >= 5) & (ys >= 4), shadow),
+    ], base)
 
     # Crumple lines
     for cx, cy in [(3, 2), (4, 3), (5, 2), (2, 4), (3, 5), (5, 4), (6, 3)]:
@@ -993,15 +905,15 @@ def make_proj_paperball():
     px(img, 3, 7, drop)
     px(img, 4, 7, drop)
 
-    img.save(UI + "proj_paperball.png")
-    print("  [OK] proj_paperball.png")
+    return img
 
 
 # =============================================================================
 # 17. SILHOUETTE BULLY 1 (24x32) — Stocky, menacing
 # =============================================================================
+@asset("ui/silhouette_bully1", size=(24, 32), tags=("battle",))
 def make_silhouette_bully1():
-    img = Image.new("RGBA", (24, 32), T)
+    img = Canvas(24, 32, T)
     sil = [
         "                        ",  # 0
         "        xxxxxx          ",  # 1
@@ -1037,15 +949,15 @@ def make_silhouette_bully1():
         "                        ",  # 31
     ]
     paint_shape(img, sil, (26, 26, 26, 255), (42, 42, 42, 255), (18, 18, 18, 255))
-    img.save(UI + "silhouette_bully1.png")
-    print("  [OK] silhouette_bully1.png")
+    return img
 
 
 # =============================================================================
 # 18. SILHOUETTE BULLY 2 (24x32) — Tall thin, arm raised pointing
 # =============================================================================
+@asset("ui/silhouette_bully2", size=(24, 32), tags=("battle",))
 def make_silhouette_bully2():
-    img = Image.new("RGBA", (24, 32), T)
+    img = Canvas(24, 32, T)
     sil = [
         "                        ",  # 0
         "       xxxxx            ",  # 1
@@ -1081,15 +993,15 @@ def make_silhouette_bully2():
         "                        ",  # 31
     ]
     paint_shape(img, sil, (26, 26, 26, 255), (42, 42, 42, 255), (18, 18, 18, 255))
-    img.save(UI + "silhouette_bully2.png")
-    print("  [OK] silhouette_bully2.png")
+    return img
 
 
 # =============================================================================
 # 19. SILHOUETTE BULLY 3 (24x32) — Medium build, arms crossed
 # =============================================================================
+@asset("ui/silhouette_bully3", size=(24, 32), tags=("battle",))
 def make_silhouette_bully3():
-    img = Image.new("RGBA", (24, 32), T)
+    img = Canvas(24, 32, T)
     sil = [
         "                        ",  # 0
         "        xxxxx           ",  # 1
@@ -1125,15 +1037,15 @@ def make_silhouette_bully3():
         "                        ",  # 31
     ]
     paint_shape(img, sil, (26, 26, 26, 255), (42, 42, 42, 255), (18, 18, 18, 255))
-    img.save(UI + "silhouette_bully3.png")
-    print("  [OK] silhouette_bully3.png")
+    return img
 
 
 # =============================================================================
 # 20. SILHOUETTE BULLY 4 (24x32) — Stocky, leaning forward
 # =============================================================================
+@asset("ui/silhouette_bully4", size=(24, 32), tags=("battle",))
 def make_silhouette_bully4():
-    img = Image.new("RGBA", (24, 32), T)
+    img = Canvas(24, 32, T)
     sil = [
         "                        ",  # 0
         "          xxxxx         ",  # 1
@@ -1173,72 +1085,13 @@ def make_silhouette_bully4():
     rim = (42, 42, 42, 255)
     dark = (18, 18, 18, 255)
 
-    filled = set()
-    for y, row in enumerate(sil):
-        for x, ch in enumerate(row):
-            if ch == 'x':
-                filled.add((x, y))
-                img.putpixel((x, y), body)
-
-    # Rim on left side and top
-    for (fx, fy) in filled:
-        if (fx - 1, fy) not in filled:
-            img.putpixel((fx, fy), rim)
-        elif (fx, fy - 1) not in filled and fy > 0:
-            img.putpixel((fx, fy), rim)
-
-    # Dark core
-    for (fx, fy) in filled:
-        if all((fx + dx, fy + dy) in filled for dx in [-2, 0, 2] for dy in [-2, 0, 2] if not (dx == 0 and dy == 0)):
-            img.putpixel((fx, fy), dark)
+    paint_shape(img, sil, body, rim, dark, light=(-1, -1))
 
-    img.save(UI + "silhouette_bully4.png")
-    print("  [OK] silhouette_bully4.png")
+    return img
 
 
 # =============================================================================
 # MAIN
 # =============================================================================
 if __name__ == "__main__":
-    os.makedirs(COLLECTIBLES, exist_ok=True)
-    os.makedirs(UI, exist_ok=True)
-
-    print("Generating SNES-style pixel art sprites...")
-    print()
-
-    print("COLLECTIBLES:")
-    make_comic_page()
-    make_grandma_memory()
-    make_graffiti()
-    make_safe_spot()
-    print()
-
-    print("UI - HEARTS:")
-    make_heart_full()
-    make_heart_half()
-    make_heart_empty()
-    make_soul_heart()
-    print()
-
-    print("UI - INTERFACE:")
-    make_arrow_continue()
-    make_interact_icon()
-    make_diary_icon()
-    make_guitar_icon()
-    print()
-
-    print("BATTLE PROJECTILES:")
-    make_proj_insult()
-    make_proj_slap()
-    make_proj_laugh()
-    make_proj_paperball()
-    print()
-
-    print("BULLY SILHOUETTES:")
-    make_silhouette_bully1()
-    make_silhouette_bully2()
-    make_silhouette_bully3()
-    make_silhouette_bully4()
-    print()
-
-    print("All 20 sprites generated successfully!")
+    sys.exit(build.main(sys.argv[1:], sources=[__file__]))
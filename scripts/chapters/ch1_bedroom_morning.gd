@@ -156,12 +156,20 @@ func _add_furniture(furniture_name: String, pos: Vector2, furniture_size: Vector
 	body.add_child(shape)
 
 	var visual := Sprite2D.new()
-	visual.texture = load(sprite_path)
+	visual.texture = _load_sprite(sprite_path)
 	visual.texture_filter = CanvasItem.TEXTURE_FILTER_NEAREST
 	body.add_child(visual)
 
 	add_child(body)
 
+## Sprite from the packed atlas (tools/generate_atlases.py writes an AtlasTexture
+## per sprite under assets/sprites/atlas/) if it was built, else the plain PNG.
+func _load_sprite(png_path: String) -> Texture2D:
+	var atlas_path := png_path.replace("res://assets/sprites/", "res://assets/sprites/atlas/").replace(".png", ".tres")
+	if ResourceLoader.exists(atlas_path):
+		return load(atlas_path)
+	return load(png_path)
+
 
 func _build_interactables():
 	# Door — bottom center (transition to kitchen)
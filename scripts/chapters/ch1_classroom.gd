@@ -451,8 +451,7 @@ func _auto_walk_player(target: Vector2):
 			if player.animated_sprite and player.animated_sprite.sprite_frames:
 				var anim: String = "walk_" + player.facing
 				if player.animated_sprite.sprite_frames.has_animation(anim):
-					if player.animated_sprite.animation != anim:
-						player.animated_sprite.play(anim)
+					player.play_animation(anim)
 
 			await get_tree().process_frame
 
@@ -460,7 +459,7 @@ func _auto_walk_player(target: Vector2):
 	if player.animated_sprite and player.animated_sprite.sprite_frames:
 		var idle: String = "idle_" + player.facing
 		if player.animated_sprite.sprite_frames.has_animation(idle):
-			player.animated_sprite.play(idle)
+			player.play_animation(idle)
 
 
 # =============================================================================
@@ -562,7 +561,9 @@ func _add_npc_sprite(npc_name: String, pos: Vector2, sprite_path: String, label_
 
 
 func _add_classmate(npc_name: String, pos: Vector2, sheet_key: String) -> AnimatedSprite2D:
-	var sheet: Texture2D = load(CLASSMATE_SHEETS[sheet_key])
+	# Look-alike classmates share one index texture through a palette-swap material
+	var swap := _palette_swap(CLASSMATE_SHEETS[sheet_key])
+	var sheet: Texture2D = swap.get_meta("index_texture") if swap != null else load(CLASSMATE_SHEETS[sheet_key])
 	if sheet == null:
 		return null
 
@@ -595,6 +596,7 @@ func _add_classmate(npc_name: String, pos: Vector2, sheet_key: String) -> Animat
 	npc.name = npc_name
 	npc.sprite_frames = frames
 	npc.texture_filter = CanvasItem.TEXTURE_FILTER_NEAREST
+	npc.material = swap
 	npc.scale = Vector2(0.5, 0.5)
 	npc.position = pos + Vector2(8, 8)
 	npc.z_index = 1
@@ -603,6 +605,13 @@ func _add_classmate(npc_name: String, pos: Vector2, sheet_key: String) -> Animat
 	return npc
 
 
+func _palette_swap(sheet_path: String) -> ShaderMaterial:
+	var path := "res://assets/sprites/palettes/%s_palette.tres" % sheet_path.get_file().trim_suffix("_spritesheet.png")
+	if not ResourceLoader.exists(path):
+		return null
+	return load(path) as ShaderMaterial
+
+
 func _classmate_atlas(sheet: Texture2D, col: int, row: int) -> AtlasTexture:
 	var at := AtlasTexture.new()
 	at.atlas = sheet
@@ -19,6 +19,8 @@ var tex_grass: Texture2D = preload("res://assets/sprites/tiles/floor_grass.png")
 var tex_concrete: Texture2D = preload("res://assets/sprites/tiles/floor_concrete.png")
 var tex_asphalt: Texture2D = preload("res://assets/sprites/tiles/floor_asphalt.png")
 var tex_dirt: Texture2D = preload("res://assets/sprites/tiles/floor_dirt.png")
+# Seeded variants of grass/dirt/asphalt/concrete in one atlas (tilesets/floor_variants)
+var floor_variants: TileSet = preload("res://assets/sprites/tiles/floor_variants.tres")
 var tex_brick: Texture2D = preload("res://assets/sprites/tiles/wall_brick.png")
 var tex_dark: Texture2D = preload("res://assets/sprites/tiles/wall_dark.png")
 var tex_tree: Texture2D = preload("res://assets/sprites/tiles/tree.png")
@@ -262,12 +264,12 @@ func _spawn_player(pos: Vector2):
 # MAP BASE — Ground fills per zone
 # =============================================================================
 func _build_map_base():
-	_fill("Base_Z1", 0, Z1_Y, MAP_W, 400, tex_concrete)
+	_fill_variants("Base_Z1", 0, Z1_Y, MAP_W, 400, "concrete", tex_concrete)
 	_fill("Base_Z2", 0, Z2_Y, MAP_W, 480, veg_grass)
 	# Scatter grass B & C variants for visual variety in the park
 	_scatter_grass_variants(Z2_Y, 480)
-	_fill("Base_Z3", 0, Z3_Y, MAP_W, 352, tex_concrete)
-	_fill("Base_Z4", 0, Z4_Y, MAP_W, 256, tex_concrete)
+	_fill_variants("Base_Z3", 0, Z3_Y, MAP_W, 352, "concrete", tex_concrete)
+	_fill_variants("Base_Z4", 0, Z4_Y, MAP_W, 256, "concrete", tex_concrete)
 
 
 # =============================================================================
@@ -316,7 +318,7 @@ func _build_zone1_residential():
 
 	# --- CARRETERA (rows 8-12) ---
 	_fill("Z1_CurbN", 0, zy + 128, MAP_W, T, tex_sidewalk_edge)
-	_fill("Z1_Road", 0, zy + 144, MAP_W, 64, tex_asphalt)
+	_fill_variants("Z1_Road", 0, zy + 144, MAP_W, 64, "asphalt", tex_asphalt)
 	_fill("Z1_RLine", 15 * T, zy + 160, 2 * T, T, tex_road_line)
 	_fill("Z1_Cross", 15 * T, zy + 144, 2 * T, 64, tex_crosswalk)
 	# Moving cars — upper lane drives RIGHT, lower lane drives LEFT
@@ -342,6 +344,9 @@ func _build_zone1_residential():
 	_deco_col("Z1_PP1", 6 * T, zy + 240, tex_trashcan)
 	_deco_col("Z1_PP2", 35 * T, zy + 240, tex_trashcan)
 	_deco_col("Z1_HY", 44 * T, zy + 240, tex_hydrant)
+	# Peatón acera sur
+	_crowd_walker("Z1_Crowd1", "senor_corbata", [
+		Vector2(8 * T, zy + 232), Vector2(16 * T, zy + 232)], 18.0)
 
 	# --- CALLEJÓN 1 (rows 16-19, right side, open bottom) ---
 	_wall("Z1_AllT", 39 * T, zy + 256, 6 * T, T, tex_dark)
@@ -495,6 +500,8 @@ func _build_zone2_park():
 	_pedestrian("Z2_Ped3", "res://assets/sprites/npcs/pedestrians/abuelo_gorra_spritesheet.png", [
 		Vector2(36 * T, zy + 9 * T), Vector2(40 * T, zy + 9 * T),
 		Vector2(40 * T, zy + 14 * T), Vector2(36 * T, zy + 14 * T)], 15.0)
+	_crowd_walker("Z2_Crowd1", "corredora", [
+		Vector2(18 * T, zy + 2 * T), Vector2(18 * T, zy + 20 * T)], 28.0)
 
 	# --- FAROLAS ---
 	_deco("Z2_FA1", 14 * T, zy + 3 * T, tex_streetlight)
@@ -618,10 +625,12 @@ func _build_zone3_commercial():
 	_pedestrian("Z3_Ped3", "res://assets/sprites/npcs/pedestrians/skater_spritesheet.png", [
 		Vector2(22 * T, zy + 7 * T), Vector2(35 * T, zy + 7 * T),
 		Vector2(35 * T, zy + 6 * T), Vector2(22 * T, zy + 6 * T)], 17.0)
+	_crowd_walker("Z3_Crowd1", "chico_bufanda", [
+		Vector2(46 * T, zy + 6 * T), Vector2(52 * T, zy + 6 * T)], 16.0)
 
 	# --- CARRETERA (rows 8-12) ---
 	_fill("Z3_CurbN", 0, zy + 8 * T, MAP_W, T, tex_sidewalk_edge)
-	_fill("Z3_Road", 0, zy + 9 * T, MAP_W, 3 * T, tex_asphalt)
+	_fill_variants("Z3_Road", 0, zy + 9 * T, MAP_W, 3 * T, "asphalt", tex_asphalt)
 	_fill("Z3_RLine", 15 * T, zy + 10 * T, 2 * T, T, tex_road_line)
 	_fill("Z3_Cross", 15 * T, zy + 9 * T, 2 * T, 3 * T, tex_crosswalk)
 	# Moving cars — upper lane RIGHT, lower lane LEFT
@@ -649,7 +658,7 @@ func _build_zone3_commercial():
 	# --- MURO SUR + CALLEJÓN 2 (rows 15-19) ---
 	_wall("Z3_WallL", 0, zy + 15 * T, 29 * T, 5 * T, tex_dark)
 	_wall("Z3_WallR", 32 * T, zy + 15 * T, MAP_W - 32 * T, 5 * T, tex_dark)
-	_fill("Z3_Alley", 29 * T, zy + 15 * T, 3 * T, 4 * T, tex_concrete)
+	_fill_variants("Z3_Alley", 29 * T, zy + 15 * T, 3 * T, 4 * T, "concrete", tex_concrete)
 	# Graffiti + enemy + secret in alley
 	_secret("ch1_graffiti_2", "graffiti", 30 * T, zy + 17 * T, "El arte salva")
 	_enemy_lone("Z3_Lone", 30 * T, zy + 17 * T + 8)
@@ -670,6 +679,13 @@ func _build_zone4_institute_exterior():
 	_npc("Z4_Al1", 9 * T, zy + T, Color(0.3, 0.4, 0.6))
 	_npc("Z4_Al2", 14 * T, zy + T, Color(0.4, 0.5, 0.4))
 	_npc("Z4_Al3", 21 * T, zy + T, Color(0.5, 0.4, 0.3))
+	# Alumnos que van y vienen delante de la verja
+	_crowd_walker("Z4_Crowd1", "chico_gafas", [
+		Vector2(25 * T, zy + 2 * T), Vector2(38 * T, zy + 2 * T)], 18.0)
+	_crowd_walker("Z4_Crowd2", "chica_melena", [
+		Vector2(40 * T, zy + T), Vector2(30 * T, zy + T)], 16.0)
+	_crowd_walker("Z4_Crowd3", "chico_botas", [
+		Vector2(15 * T, zy + 2 * T), Vector2(20 * T, zy + 2 * T)], 20.0)
 
 	# --- VERJA (rows 3-5) ---
 	# Top fence row 3 — gap at cols 0-2 for side passage
@@ -958,6 +974,50 @@ func _fill(n: String, x: int, y: int, w: int, h: int, tex: Texture2D):
 	add_child(r)
 
 
+## Tiled ground fill from the floor_variants TileSet (no collision): every
+## cell picks a variant and orientation of `kind` by its probability,
+## seeded by the node name so the map looks the same on every run.
+## Falls back to a plain _fill with `fallback` if the TileSet has no `kind`.
+func _fill_variants(n: String, x: int, y: int, w: int, h: int, kind: String, fallback: Texture2D):
+	var source_id := _variant_source(kind)
+	if source_id < 0:
+		_fill(n, x, y, w, h, fallback)
+		return
+	var source := floor_variants.get_source(source_id) as TileSetAtlasSource
+	var picks: Array = []
+	var weights: Array = []
+	var total := 0.0
+	for i in source.get_tiles_count():
+		var coords := source.get_tile_id(i)
+		for a in source.get_alternative_tiles_count(coords):
+			var alt := source.get_alternative_tile_id(coords, a)
+			total += source.get_tile_data(coords, alt).probability
+			picks.append([coords, alt]); weights.append(total)
+	var layer := TileMapLayer.new()
+	layer.name = n; layer.tile_set = floor_variants
+	layer.texture_filter = CanvasItem.TEXTURE_FILTER_NEAREST
+	layer.position = Vector2(x, y)
+	layer.z_index = -1
+	var rng := RandomNumberGenerator.new()
+	rng.seed = hash(n)
+	for r in h / T:
+		for c in w / T:
+			var k := mini(weights.bsearch(rng.randf() * total, false), picks.size() - 1)
+			layer.set_cell(Vector2i(c, r), source_id, picks[k][0], picks[k][1])
+	add_child(layer)
+
+
+## Source id of a floor kind in floor_variants (sources are named after it),
+## or -1 if it has no such source.
+func _variant_source(kind: String) -> int:
+	for i in floor_variants.get_source_count():
+		var id := floor_variants.get_source_id(i)
+		if floor_variants.get_source(id).resource_name == kind:
+			return id
+	push_error("floor_variants.tres has no '%s' source" % kind)
+	return -1
+
+
 ## StaticBody2D wall with tiled texture.
 func _wall(n: String, x: int, y: int, w: int, h: int, tex: Texture2D) -> StaticBody2D:
 	var b := StaticBody2D.new()
@@ -1079,14 +1139,19 @@ func _npc(n: String, x: int, y: int, color: Color):
 
 
 ## Walking pedestrian NPC (collision obstacle, walks between waypoints).
-func _pedestrian(n: String, sheet: String, points: Array[Vector2], spd: float = 25.0):
+func _pedestrian(n: String, sheet: String, points: Array[Vector2], spd: float = 25.0, sprite_scale: float = 0.65):
 	var p := CharacterBody2D.new()
 	p.set_script(pedestrian_script)
 	p.name = n
-	p.setup(sheet, points, spd)
+	p.setup(sheet, points, spd, sprite_scale)
 	add_child(p)
 
 
+## Walking NPC from a synthesized crowd sheet (tools/generate_crowd.py), 16x24 cells at full size.
+func _crowd_walker(n: String, stem: String, points: Array[Vector2], spd: float = 20.0):
+	_pedestrian(n, "res://assets/sprites/npcs/crowd/%s_spritesheet.png" % stem, points, spd, 1.0)
+
+
 ## Interactable door → scene transition.
 func _door(n: String, x: int, y: int, w: int, h: int, tex: Texture2D, target: String):
 	var vis := TextureRect.new()
@@ -31,31 +31,11 @@ func _ready():
 
 func _setup_sprite():
 	if spritesheet_path != "":
-		var sheet: Texture2D = load(spritesheet_path)
-		if sheet != null:
-			# Animated spritesheet: 48x96, 3 cols × 4 rows, 16x24 frames
-			# Cols: Idle, Anim1, Anim2 | Rows: Down, Up, Left, Right
+		var frames: SpriteFrames = _load_sprite_frames()
+		if frames != null:
 			_anim_sprite = AnimatedSprite2D.new()
 			_anim_sprite.name = "AnimSprite"
 			_anim_sprite.texture_filter = CanvasItem.TEXTURE_FILTER_NEAREST
-			var frames := SpriteFrames.new()
-			if frames.has_animation("default"):
-				frames.remove_animation("default")
-			const FW: int = 16
-			const FH: int = 24
-			var rows := {"down": 0, "up": 1, "left": 2, "right": 3}
-			for dir_name in rows:
-				var row: int = rows[dir_name]
-				var anim_name: String = "pulse_" + dir_name
-				frames.add_animation(anim_name)
-				frames.set_animation_speed(anim_name, 4)
-				frames.set_animation_loop(anim_name, true)
-				for col in [0, 1, 2, 1]:  # idle → pulse1 → pulse2 → pulse1
-					var at := AtlasTexture.new()
-					at.atlas = sheet
-					at.region = Rect2(col * FW, row * FH, FW, FH)
-					at.filter_clip = true
-					frames.add_frame(anim_name, at)
 			_anim_sprite.sprite_frames = frames
 			_anim_sprite.play("pulse_down")
 			add_child(_anim_sprite)
@@ -73,6 +53,38 @@ func _setup_sprite():
 			add_child(sprite)
 
 
+## SpriteFrames for spritesheet_path: the shared .tres baked next to the sheet
+## by tools/build_sprites.py, or built here from the sheet if it is missing.
+func _load_sprite_frames() -> SpriteFrames:
+	var frames_path := spritesheet_path.get_basename() + ".tres"
+	if ResourceLoader.exists(frames_path):
+		return load(frames_path)
+	var sheet: Texture2D = load(spritesheet_path)
+	if sheet == null:
+		return null
+	# Animated spritesheet: 48x96, 3 cols × 4 rows, 16x24 frames
+	# Cols: Idle, Anim1, Anim2 | Rows: Down, Up, Left, Right
+	var frames := SpriteFrames.new()
+	if frames.has_animation("default"):
+		frames.remove_animation("default")
+	const FW: int = 16
+	const FH: int = 24
+	var rows := {"down": 0, "up": 1, "left": 2, "right": 3}
+	for dir_name in rows:
+		var row: int = rows[dir_name]
+		var anim_name: String = "pulse_" + dir_name
+		frames.add_animation(anim_name)
+		frames.set_animation_speed(anim_name, 4)
+		frames.set_animation_loop(anim_name, true)
+		for col in [0, 1, 2, 1]:  # idle → pulse1 → pulse2 → pulse1
+			var at := AtlasTexture.new()
+			at.atlas = sheet
+			at.region = Rect2(col * FW, row * FH, FW, FH)
+			at.filter_clip = true
+			frames.add_frame(anim_name, at)
+	return frames
+
+
 func _physics_process(delta):
 	if frozen:
 		velocity = Vector2.ZERO
@@ -11,13 +11,16 @@ var facing: String = "down"
 var is_moving: bool = false
 
 var sheet_path: String = ""
+# 0.65 for the hand-drawn 32x32 pedestrian cells, 1.0 for the 16x24 crowd cells
+var sprite_scale: float = 0.65
 var animated_sprite: AnimatedSprite2D
 
 
-func setup(spritesheet: String, points: Array[Vector2], spd: float = 25.0):
+func setup(spritesheet: String, points: Array[Vector2], spd: float = 25.0, scale_factor: float = 0.65):
 	sheet_path = spritesheet
 	waypoints = points
 	walk_speed = spd
+	sprite_scale = scale_factor
 
 
 func _ready():
@@ -90,17 +93,38 @@ func _build_visual():
 	add_child(shape)
 
 	# Animated sprite from spritesheet
-	var sheet: Texture2D = load(sheet_path) if sheet_path != "" else null
-	if sheet == null:
+	var frames: SpriteFrames = _load_sprite_frames()
+	if frames == null:
 		return
 
+	animated_sprite = AnimatedSprite2D.new()
+	animated_sprite.name = "AnimatedSprite2D"
+	animated_sprite.sprite_frames = frames
+	animated_sprite.texture_filter = CanvasItem.TEXTURE_FILTER_NEAREST
+	animated_sprite.scale = Vector2(sprite_scale, sprite_scale)
+	animated_sprite.play("idle_down")
+	add_child(animated_sprite)
+
+
+## SpriteFrames for sheet_path: the shared .tres baked next to the sheet by
+## tools/build_sprites.py, or built here from the sheet if it is missing.
+func _load_sprite_frames() -> SpriteFrames:
+	if sheet_path == "":
+		return null
+	var frames_path := sheet_path.get_basename() + ".tres"
+	if ResourceLoader.exists(frames_path):
+		return load(frames_path)
+	var sheet: Texture2D = load(sheet_path)
+	if sheet == null:
+		return null
+
 	var frames := SpriteFrames.new()
 	if frames.has_animation("default"):
 		frames.remove_animation("default")
 
-	const FW: int = 32
-	const FH: int = 32
 	var dir_rows: Dictionary = {"down": 0, "up": 1, "left": 2, "right": 3}
+	# 3 columns x 4 rows: 32x32 cells for the hand-drawn sheets, 16x24 for crowd sheets
+	var cell := Vector2i(sheet.get_width() / 3, sheet.get_height() / 4)
 
 	for dir_name in ["down", "up", "left", "right"]:
 		var row: int = dir_rows[dir_name]
@@ -109,29 +133,22 @@ func _build_visual():
 		frames.add_animation(idle_name)
 		frames.set_animation_speed(idle_name, 6)
 		frames.set_animation_loop(idle_name, true)
-		frames.add_frame(idle_name, _atlas(sheet, 0, row))
+		frames.add_frame(idle_name, _atlas(sheet, 0, row, cell))
 
 		var walk_name: String = "walk_" + dir_name
 		frames.add_animation(walk_name)
 		frames.set_animation_speed(walk_name, 6)
 		frames.set_animation_loop(walk_name, true)
-		frames.add_frame(walk_name, _atlas(sheet, 0, row))  # idle
-		frames.add_frame(walk_name, _atlas(sheet, 1, row))  # step1
-		frames.add_frame(walk_name, _atlas(sheet, 0, row))  # idle
-		frames.add_frame(walk_name, _atlas(sheet, 2, row))  # step2
-
-	animated_sprite = AnimatedSprite2D.new()
-	animated_sprite.name = "AnimatedSprite2D"
-	animated_sprite.sprite_frames = frames
-	animated_sprite.texture_filter = CanvasItem.TEXTURE_FILTER_NEAREST
-	animated_sprite.scale = Vector2(0.65, 0.65)
-	animated_sprite.play("idle_down")
-	add_child(animated_sprite)
+		frames.add_frame(walk_name, _atlas(sheet, 0, row, cell))  # idle
+		frames.add_frame(walk_name, _atlas(sheet, 1, row, cell))  # step1
+		frames.add_frame(walk_name, _atlas(sheet, 0, row, cell))  # idle
+		frames.add_frame(walk_name, _atlas(sheet, 2, row, cell))  # step2
+	return frames
 
 
-func _atlas(sheet: Texture2D, col: int, row: int) -> AtlasTexture:
+func _atlas(sheet: Texture2D, col: int, row: int, cell: Vector2i) -> AtlasTexture:
 	var at := AtlasTexture.new()
 	at.atlas = sheet
-	at.region = Rect2(col * 32, row * 32, 32, 32)
+	at.region = Rect2(col * cell.x, row * cell.y, cell.x, cell.y)
 	at.filter_clip = true
 	return at
@@ -22,6 +22,8 @@ const KNOCKBACK_DURATION: float = 0.25
 
 var interact_indicator: Label = null
 var _debug_k_held: bool = false
+# Animations stored as mirrors of others (e.g. *_right of *_left), played with flip_h
+var _flipped_animations: PackedStringArray = PackedStringArray()
 
 
 func _ready():
@@ -122,13 +124,18 @@ func _handle_animation():
 		anim_name = "walk_" + facing
 
 	if animated_sprite.sprite_frames.has_animation(anim_name):
-		if animated_sprite.animation != anim_name:
-			animated_sprite.play(anim_name)
+		play_animation(anim_name)
 	else:
 		# Fallback: try idle_down as the safest default
 		if animated_sprite.sprite_frames.has_animation("idle_down"):
-			if animated_sprite.animation != "idle_down":
-				animated_sprite.play("idle_down")
+			play_animation("idle_down")
+
+
+## Play an animation with the flip_h its SpriteFrames asks for (mirrored directions).
+func play_animation(anim_name: String):
+	if animated_sprite.animation != anim_name:
+		animated_sprite.play(anim_name)
+	animated_sprite.flip_h = _flipped_animations.has(anim_name)
 
 
 # ---------------------------------------------------------------------------
@@ -267,6 +274,16 @@ func _setup_placeholder_animations():
 
 	animated_sprite.texture_filter = CanvasItem.TEXTURE_FILTER_NEAREST
 
+	# Shared SpriteFrames baked by tools/build_sprites.py next to the sheet
+	var frames_path := "res://assets/sprites/player/cristian_spritesheet.tres"
+	if ResourceLoader.exists(frames_path):
+		var frames: SpriteFrames = load(frames_path)
+		_flipped_animations = frames.get_meta("flip_h", PackedStringArray())
+		animated_sprite.sprite_frames = frames
+		animated_sprite.scale = Vector2(0.5, 0.5)
+		animated_sprite.play("idle_down")
+		return
+
 	var sheet: Texture2D = load("res://assets/sprites/player/cristian_spritesheet.png")
 	if sheet != null:
 		_setup_from_spritesheet(sheet)
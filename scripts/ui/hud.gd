@@ -46,9 +46,18 @@ func _find_player() -> Node:
 
 
 func _create_heart_textures():
-	_tex_full = load("res://assets/sprites/ui/heart_full.png")
-	_tex_half = load("res://assets/sprites/ui/heart_half.png")
-	_tex_empty = load("res://assets/sprites/ui/heart_empty.png")
+	_tex_full = _load_sprite("res://assets/sprites/ui/heart_full.png")
+	_tex_half = _load_sprite("res://assets/sprites/ui/heart_half.png")
+	_tex_empty = _load_sprite("res://assets/sprites/ui/heart_empty.png")
+
+
+## Sprite from the packed atlas (tools/generate_atlases.py writes an AtlasTexture
+## per sprite under assets/sprites/atlas/) if it was built, else the plain PNG.
+func _load_sprite(png_path: String) -> Texture2D:
+	var atlas_path := png_path.replace("res://assets/sprites/", "res://assets/sprites/atlas/").replace(".png", ".tres")
+	if ResourceLoader.exists(atlas_path):
+		return load(atlas_path)
+	return load(png_path)
 
 
 func _build_hearts(count: int):
@@ -72,11 +72,19 @@ func _physics_process(delta: float):
 
 
 func _setup_sprite():
-	var sheet: Texture2D = load(_spritesheet_path) if _spritesheet_path != "" else null
+	# Palette-swap material (tools/generate_variants.py): every car colour draws
+	# the same index texture and only its palette strip differs
+	var swap := _palette_swap(_spritesheet_path)
+	var sheet: Texture2D = null
+	if swap != null:
+		sheet = swap.get_meta("index_texture")
+	elif _spritesheet_path != "":
+		sheet = load(_spritesheet_path)
 	if sheet != null:
 		_anim_sprite = AnimatedSprite2D.new()
 		_anim_sprite.name = "CarSprite"
 		_anim_sprite.texture_filter = CanvasItem.TEXTURE_FILTER_NEAREST
+		_anim_sprite.material = swap
 		var frames := SpriteFrames.new()
 		if frames.has_animation("default"):
 			frames.remove_animation("default")
@@ -126,6 +134,13 @@ func _setup_sprite():
 		add_child(sp)
 
 
+func _palette_swap(sheet_path: String) -> ShaderMaterial:
+	var path := "res://assets/sprites/palettes/%s_palette.tres" % sheet_path.get_file().trim_suffix("_spritesheet.png")
+	if sheet_path == "" or not ResourceLoader.exists(path):
+		return null
+	return load(path) as ShaderMaterial
+
+
 func _setup_hitbox():
 	_hitbox = Area2D.new()
 	_hitbox.name = "CarHitbox"
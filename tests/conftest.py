@@ -0,0 +1,17 @@
+import os
+import shutil
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOOLS = os.path.join(ROOT, "tools")
+
+# the generators import pixelkit the same way (tools/ on sys.path)
+if TOOLS not in sys.path:
+    sys.path.insert(0, TOOLS)
+
+
+def copy_project(dst):
+    """Copy the checkout to dst as a build root (inputs and committed outputs, no build state)."""
+    shutil.copytree(ROOT, dst, dirs_exist_ok=True, ignore=shutil.ignore_patterns(
+        ".git", ".pixelkit", ".godot", "__pycache__", ".pytest_cache"))
+    return dst
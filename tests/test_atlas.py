@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from pixelkit import Canvas, atlas, godot
+
+
+def sprite(w, h, color, box=None):
+    """w x h sprite filled with color, or only inside box (x, y, w, h) on a clear canvas."""
+    img = Canvas(w, h)
+    x, y, bw, bh = box or (0, 0, w, h)
+    img.fill_rect(x, y, bw, bh, color)
+    return img
+
+
+def overlaps(a, b, extrude):
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    return (ax - extrude < bx + bw + extrude and bx - extrude < ax + aw + extrude
+            and ay - extrude < by + bh + extrude and by - extrude < ay + ah + extrude)
+
+
+def test_pack_power_of_two_without_overlap():
+    images = {"s%d" % i: sprite(8 + i % 3 * 4, 8 + i % 2 * 8, (i * 20, 40, 80, 255)) for i in range(12)}
+    packing = atlas.pack(images, extrude=1)
+    assert packing.width & (packing.width - 1) == 0
+    assert packing.height & (packing.height - 1) == 0
+    rects = list(packing.regions.values())
+    for i, a in enumerate(rects):
+        x, y, w, h = a
+        assert x >= 1 and y >= 1 and x + w + 1 <= packing.width and y + h + 1 <= packing.height
+        for b in rects[i + 1:]:
+            assert not overlaps(a, b, 1)
+
+
+def test_compose_extrudes_edges():
+    images = {"a": sprite(4, 4, (255, 0, 0, 255)), "b": sprite(4, 4, (0, 255, 0, 255))}
+    img, packing = atlas.compose(images, extrude=1)
+    for key, (x, y, w, h) in packing.regions.items():
+        block = img.pixels[y - 1:y + h + 1, x - 1:x + w + 1]
+        assert (block == images[key].pixels[0, 0]).all()
+
+
+def test_layout_is_deterministic():
+    images = {"s%d" % i: sprite(4 + i, 12 - i, (i, i, i, 255)) for i in range(8)}
+    assert atlas.pack(images) == atlas.pack(dict(reversed(list(images.items()))))
+
+
+def test_duplicates_share_a_region_and_mirrors_do_not():
+    left = sprite(6, 4, (255, 0, 0, 255), box=(0, 0, 2, 4))
+    images = {"a": left, "b": left.copy(), "c": Canvas.from_array(left.pixels[:, ::-1])}
+    packing = atlas.pack(images)
+    assert packing.regions["a"] == packing.regions["b"]
+    assert packing.regions["c"] != packing.regions["a"]
+    assert len(packing.stored) == 2
+
+
+def test_too_many_sprites_for_max_size():
+    with pytest.raises(ValueError):
+        atlas.pack({"s%d" % i: sprite(16, 16, (i, 0, 0, 255)) for i in range(8)}, max_size=32)
+
+
+def test_index_json_lists_every_region():
+    images = {"a": sprite(2, 2, (9, 9, 9, 255)), "b": sprite(3, 1, (7, 7, 7, 255))}
+    img, packing = atlas.compose(images)
+    index = json.loads(atlas.index_json("res://atlas.png", img.size, packing.regions))
+    assert index["texture"] == "res://atlas.png"
+    assert index["size"] == [packing.width, packing.height]
+    assert index["regions"] == {key: list(rect) for key, rect in packing.regions.items()}
+
+
+def test_trim_margins_restore_the_original_canvas():
+    images = {"dot": sprite(16, 16, (255, 255, 255, 255), box=(3, 5, 4, 2))}
+    packing = atlas.pack(images, trimmed=True)
+    region = packing.regions["dot"]
+    assert region[2:] == (4, 2)
+    assert packing.trimmed["dot"] == (3, 5, 16, 16)
+    tres = godot.atlas_texture_tres("res://atlas.png", region, trim=packing.trimmed["dot"])
+    # margin = (offset x, offset y, width lost, height lost) to the 16x16 canvas
+    assert "margin = Rect2(3, 5, 12, 14)" in tres
+    assert "flip_h" not in tres
+
+
+def test_untrimmed_sprites_have_no_margin():
+    packing = atlas.pack({"full": sprite(8, 8, (1, 2, 3, 255))}, trimmed=True)
+    assert packing.trimmed == {}
@@ -0,0 +1,108 @@
+"""Full builds through tools/build_sprites.py, each into its own copy of the project."""
+
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT, copy_project
+from pixelkit.cache import code_digest
+
+BUILD = os.path.join(ROOT, "tools", "build_sprites.py")
+
+
+def build(root, *args):
+    result = subprocess.run([sys.executable, BUILD, "--root", str(root)] + list(args),
+                            capture_output=True, text=True, cwd=ROOT)
+    assert result.returncode == 0, result.stdout + result.stderr
+    return result.stdout
+
+
+def outputs(root):
+    """{relative path: bytes} of every file under root, build state excluded."""
+    found = {}
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d != ".pixelkit"]
+        for name in files:
+            path = os.path.join(directory, name)
+            with open(path, "rb") as f:
+                found[os.path.relpath(path, root)] = f.read()
+    return found
+
+
+@pytest.fixture(scope="module")
+def serial(tmp_path_factory):
+    root = copy_project(tmp_path_factory.mktemp("serial"))
+    build(root, "-j1")
+    return root
+
+
+def test_up_to_date_build_writes_nothing(serial):
+    before = {path: os.stat(os.path.join(serial, path)).st_mtime_ns for path in outputs(serial)}
+    log = build(serial, "-j1")
+    assert "  0 rebuilt (0 files written)" in log
+    after = {path: os.stat(os.path.join(serial, path)).st_mtime_ns for path in outputs(serial)}
+    assert after == before
+
+
+def test_stale_output_is_rebuilt(serial):
+    path = os.path.join(serial, "assets", "sprites", "tiles", "floor_wood.png")
+    with open(path, "rb") as f:
+        data = f.read()
+    os.remove(path)
+    log = build(serial, "-j1", "--only", "tiles/floor_wood")
+    assert "1 rebuilt (1 files written)" in log
+    with open(path, "rb") as f:
+        assert f.read() == data
+
+
+def test_edited_static_input_rebuilds_its_asset(serial):
+    path = os.path.join(serial, "tools", "grids", "characters", "teacher.grid")
+    with open(path) as f:
+        grid = f.read()
+    with open(path, "w") as f:
+        f.write(grid + "# edited\n")
+    log = build(serial, "-j1", "--only", "npcs/teacher")
+    # the grid changed, the pixels did not
+    assert "1 rebuilt (0 files written)" in log
+    assert "0 rebuilt" in build(serial, "-j1", "--only", "npcs/teacher")
+    with open(path, "w") as f:
+        f.write(grid)
+
+
+def make(source):
+    scope = {}
+    exec(source, scope)
+    return scope["paint"]
+
+
+def test_code_digest_follows_code_not_comments():
+    one = make("def paint():\n    return 1  # one\n")
+    assert code_digest(one) == code_digest(make("def paint():\n\n    return 1  # uno\n"))
+    assert code_digest(one) != code_digest(make("def paint():\n    return 2\n"))
+
+
+def test_parallel_build_matches_serial(serial, tmp_path):
+    root = copy_project(tmp_path / "parallel")
+    build(root, "-j4")
+    assert outputs(root) == outputs(serial)
+
+
+def checkout(dst):
+    """Copy only the files git tracks, as a fresh clone of the working tree would have them."""
+    listed = subprocess.run(["git", "ls-files", "-z"], capture_output=True, cwd=ROOT, check=True)
+    for path in listed.stdout.decode().split("\0"):
+        if path and os.path.isfile(os.path.join(ROOT, path)):
+            os.makedirs(os.path.dirname(os.path.join(dst, path)), exist_ok=True)
+            shutil.copy2(os.path.join(ROOT, path), os.path.join(dst, path))
+    return dst
+
+
+def test_clean_checkout_build_changes_and_adds_nothing(tmp_path):
+    # every default output is committed, so building a clean tree only fills in .pixelkit
+    root = checkout(tmp_path / "clean")
+    before = outputs(root)
+    build(root, "-j1")
+    assert outputs(root) == before
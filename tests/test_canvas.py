@@ -0,0 +1,78 @@
+import pickle
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pixelkit import FLIP_LEFT_RIGHT, FLIP_TOP_BOTTOM, Canvas, ink
+
+
+def test_ink_accepts_hex_and_tuples():
+    assert ink("#ff8000") == bytes((255, 128, 0, 255))
+    assert ink("#ff800080") == bytes((255, 128, 0, 128))
+    assert ink((1, 2, 3)) == bytes((1, 2, 3, 255))
+    assert ink([1, 2, 3, 4]) == bytes((1, 2, 3, 4))
+
+
+def test_pixels_view_shares_the_buffer():
+    img = Canvas(3, 2)
+    img.pixels[1, 2] = (10, 20, 30, 40)
+    assert img.buf[(1 * 3 + 2) * 4:(1 * 3 + 2) * 4 + 4] == bytes((10, 20, 30, 40))
+    assert img.getpixel((2, 1)) == (10, 20, 30, 40)
+
+
+def test_putpixel_raises_and_put_clips():
+    img = Canvas(4, 4)
+    with pytest.raises(IndexError):
+        img.putpixel((4, 0), (255, 0, 0, 255))
+    img.put(4, 0, (255, 0, 0, 255))
+    img.put(-1, 2, (255, 0, 0, 255))
+    assert not img.pixels.any()
+    img.putpixel((-1, -1), (255, 0, 0, 255))
+    assert img.get(3, 3) == (255, 0, 0, 255)
+    assert img.get(9, 9, "off") == "off"
+
+
+def test_fill_rect_and_lines_clip():
+    img = Canvas(4, 4)
+    img.fill_rect(-2, 2, 4, 9, (9, 9, 9, 255))
+    assert img.pixels[2:, :2, 0].tolist() == [[9, 9], [9, 9]]
+    assert not img.pixels[:2].any() and not img.pixels[:, 2:].any()
+    img.hline(1, 3, 0, (1, 1, 1, 255))
+    img.vline(3, 1, 3, (2, 2, 2, 255))
+    assert img.pixels[0, 1:, 0].tolist() == [1, 1, 1]
+    assert img.pixels[1:, 3, 0].tolist() == [2, 2, 2]
+
+
+def test_matches_pil_image():
+    img = Canvas(5, 3, (0, 0, 0, 0))
+    img.fill_rect(1, 0, 3, 2, "#336699")
+    reference = Image.new("RGBA", (5, 3), (0, 0, 0, 0))
+    for x in range(1, 4):
+        for y in range(2):
+            reference.putpixel((x, y), (0x33, 0x66, 0x99, 255))
+    assert img.to_image().tobytes() == reference.tobytes()
+    assert Canvas.from_image(reference).tobytes() == img.tobytes()
+    assert img.getbbox() == reference.getbbox()
+
+
+def test_transpose_and_crop():
+    img = Canvas.from_array(np.arange(2 * 3 * 4, dtype=np.uint8).reshape(2, 3, 4))
+    assert np.array_equal(img.transpose(FLIP_LEFT_RIGHT).pixels, img.pixels[:, ::-1])
+    assert np.array_equal(img.transpose(FLIP_TOP_BOTTOM).pixels, img.pixels[::-1])
+    assert np.array_equal(img.crop((1, 0, 3, 1)).pixels, img.pixels[:1, 1:3])
+
+
+def test_from_grid_leaves_short_rows_to_the_background():
+    img = Canvas.from_grid(3, 2, [["#ff0000"], ["#00ff00", "#0000ff", "#ffffff"]], (0, 0, 0, 255))
+    assert img.getpixel((0, 0)) == (255, 0, 0, 255)
+    assert img.getpixel((1, 0)) == (0, 0, 0, 255)
+    assert img.getpixel((2, 1)) == (255, 255, 255, 255)
+
+
+def test_copy_and_pickle_are_independent():
+    img = Canvas(2, 2, (5, 5, 5, 255))
+    for other in (img.copy(), pickle.loads(pickle.dumps(img))):
+        assert other.tobytes() == img.tobytes()
+        other.put(0, 0, (0, 0, 0, 0))
+        assert img.getpixel((0, 0)) == (5, 5, 5, 255)
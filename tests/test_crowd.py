@@ -0,0 +1,79 @@
+import importlib.util
+import os
+import random
+
+import numpy as np
+import pytest
+
+from conftest import ROOT, TOOLS
+from pixelkit import crowd, grids, registry
+from pixelkit.primitives import palette_array
+
+
+@pytest.fixture(scope="module")
+def gen():
+    """tools/generate_crowd.py, registered into throwaway tables."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(registry, "ASSETS", {})
+        mp.setattr(registry, "OUTPUTS", {})
+        spec = importlib.util.spec_from_file_location("crowd_under_test", os.path.join(TOOLS, "generate_crowd.py"))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def library(gen):
+    return gen.library(ROOT)
+
+
+def test_library_has_every_part(gen, library):
+    assert library.slots == gen.SLOTS
+    assert library.styles["hair"] == ("buzz", "long", "short")
+    for slot in gen.SLOTS:
+        # 4 views of 24 rows, 3 poses of 16 columns
+        assert library.parts[slot].shape[1:] == (96, 48)
+
+
+def test_right_view_mirrors_the_left(library):
+    for parts in library.parts.values():
+        left, right = parts[:, 48:72], parts[:, 72:96]
+        for pose in range(3):
+            assert np.array_equal(right[..., pose * 16:(pose + 1) * 16], left[..., pose * 16:(pose + 1) * 16][..., ::-1])
+
+
+def test_batch_matches_one_sheet_at_a_time(gen, library):
+    picks, tables = crowd.random_batch(library, gen.PALETTE_SETS, 200, random.Random(1))
+    batch = crowd.synthesize(library, picks, tables)
+    assert batch.shape == (200, 96, 48, 4)
+    # distinct characters
+    assert len({(tuple(p), t.tobytes()) for p, t in zip(picks, tables)}) == 200
+    for i in (0, 57, 199):
+        one = crowd.synthesize(library, picks[i:i + 1], tables[i:i + 1])[0]
+        assert np.array_equal(one, batch[i])
+
+
+def test_random_batch_is_seeded(gen, library):
+    a = crowd.random_batch(library, gen.PALETTE_SETS, 50, random.Random(7))
+    b = crowd.random_batch(library, gen.PALETTE_SETS, 50, random.Random(7))
+    assert np.array_equal(a[0], b[0]) and np.array_equal(a[1], b[1])
+    with pytest.raises(ValueError, match="distinct characters"):
+        crowd.random_batch(library, {}, 10 ** 6, random.Random(7))
+
+
+def test_described_character_uses_its_palette_sets(gen, library):
+    description = gen.CROWD["chico_gafas"]
+    img = crowd.sheet(library, description, gen.PALETTE_SETS)
+    assert img.size == (48, 96)
+    colors = {bytes(c) for c in img.pixels.reshape(-1, 4) if c[3]}
+    for group, name in description["colors"].items():
+        ramp = gen.PALETTE_SETS[group][name]
+        assert any(bytes(c) in colors for c in palette_array(ramp))
+
+
+def test_unknown_slot_is_an_error(gen, tmp_path):
+    part = tmp_path / "hat_cap.grid"
+    with open(os.path.join(ROOT, gen.PART_FILES[0])) as f:
+        part.write_text(f.read())
+    with pytest.raises(grids.GridError, match="unknown slot 'hat'"):
+        crowd.load_library([str(part)], gen.SLOTS, gen.ROLES, gen.CELL)
@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+from conftest import ROOT
+from pixelkit import godot
+
+PLAIN = (False, False, False)
+FLIP_H = (True, False, False)
+ROTATED = (False, True, True)
+FLOOR_VARIANTS = os.path.join(ROOT, "assets", "sprites", "tiles", "floor_variants.tres")
+
+
+def test_res_path():
+    assert godot.res_path("assets/sprites/tiles/floor_wood.png") == "res://assets/sprites/tiles/floor_wood.png"
+
+
+def test_tileset_sources_and_alternatives():
+    sources = [("concrete", (0, 0), [[(PLAIN, 1.0)], [(PLAIN, 0.5), (FLIP_H, 0.25), (ROTATED, 0.25)]]),
+               ("asphalt", (0, 32), [[(PLAIN, 2)]])]
+    tres = godot.tileset_tres("res://floor.png", (32, 32), sources)
+    lines = tres.splitlines()
+    assert lines[0] == '[gd_resource type="TileSet" load_steps=4 format=3]'
+    assert 'resource_name = "concrete"' in lines and 'resource_name = "asphalt"' in lines
+    assert "margins = Vector2i(0, 32)" in lines
+    assert lines.count("texture_region_size = Vector2i(32, 32)") == 2
+    assert "0:0/0 = 0" in lines and "1:0/2 = 2" in lines
+    assert "1:0/1/flip_h = true" in lines
+    assert "1:0/2/flip_v = true" in lines and "1:0/2/transpose = true" in lines
+    assert not any(line.startswith("1:0/0/") and line.endswith("= true") for line in lines)
+    assert "1:0/1/probability = 0.25" in lines and "0:0/0/probability = 2.0" in lines
+    assert "1:0/next_alternative_id = 3" in lines
+    assert not any(line.startswith("0:0/next_alternative_id") for line in lines)
+    assert lines[-2:] == ['sources/0 = SubResource("TileSetAtlasSource_0")',
+                          'sources/1 = SubResource("TileSetAtlasSource_1")']
+    assert tres.endswith("\n")
+
+
+def test_tileset_rejects_flipped_base_tile():
+    with pytest.raises(ValueError):
+        godot.tileset_tres("res://floor.png", (32, 32), [("bad", (0, 0), [[(FLIP_H, 1.0)]])])
+
+
+def test_floor_variants_tileset_names_its_materials():
+    with open(FLOOR_VARIANTS) as f:
+        lines = f.read().splitlines()
+    names = [line for line in lines if line.startswith("resource_name")]
+    assert names == ['resource_name = "%s"' % m for m in ("grass", "dirt", "asphalt", "concrete")]
+    assert 'path="res://assets/sprites/tiles/floor_variants.png"' in lines[2]
+
+
+def test_four_way_rows():
+    animations = godot.four_way(3, {"walk": ([0, 1, 0, 2], 8)})
+    assert [a["name"] for a in animations] == ["walk_down", "walk_up", "walk_left", "walk_right"]
+    assert animations[2]["frames"] == [6, 7, 6, 8]
+    assert animations[0]["speed"] == 8
+
+
+def test_sprite_frames_lists_regions_and_animations():
+    regions = [(0, 0, 16, 24), (16, 0, 16, 24), (32, 0, 16, 24)]
+    animations = [{"name": "pulse_down", "speed": 4, "frames": [0, 2, 0]},
+                  {"name": "idle_down", "speed": 8, "loop": False, "frames": [0]}]
+    tres = godot.sprite_frames_tres("res://sheet.png", regions, animations)
+    lines = tres.splitlines()
+    assert lines[0] == '[gd_resource type="SpriteFrames" load_steps=4 format=3]'
+    assert '[ext_resource type="Texture2D" path="res://sheet.png" id="1_sheet"]' in lines
+    # only the regions an animation plays get an AtlasTexture
+    assert "region = Rect2(0, 0, 16, 24)" in lines and "region = Rect2(32, 0, 16, 24)" in lines
+    assert "region = Rect2(16, 0, 16, 24)" not in lines
+    assert lines.count("filter_clip = true") == 2
+    assert '"name": &"pulse_down",' in lines and '"speed": 4.0' in lines
+    assert tres.count('"texture": SubResource("AtlasTexture_0")') == 3
+    assert '"loop": false,' in lines
+    assert not any(line.startswith("metadata/") for line in lines)
+    assert tres.endswith("\n")
+
+
+def test_sprite_frames_lists_flipped_animations():
+    animations = [{"name": "idle_left", "speed": 8, "frames": [0], "flip_h": False},
+                  {"name": "idle_right", "speed": 8, "frames": [0], "flip_h": True}]
+    tres = godot.sprite_frames_tres("res://sheet.png", [(0, 0, 4, 4)], animations)
+    assert 'metadata/flip_h = PackedStringArray("idle_right")' in tres
+
+
+def test_trimmed_frame_gets_a_margin_back_to_its_cell():
+    tres = godot.sprite_frames_tres("res://sheet.png", [(9, 1, 28, 47)],
+                                    [{"name": "idle_down", "speed": 8, "frames": [0]}],
+                                    trims={0: (9, 1, 48, 48)})
+    # margin = (offset x, offset y, width lost, height lost)
+    assert "margin = Rect2(9, 1, 20, 1)" in tres.splitlines()
+
+
+def test_palette_material_keeps_its_index_texture():
+    tres = godot.palette_material_tres("res://swap.gdshader", "res://car_blue_palette.png", "res://car_index.png")
+    lines = tres.splitlines()
+    assert '[ext_resource type="Shader" path="res://swap.gdshader" id="1_shader"]' in lines
+    assert 'shader_parameter/palette = ExtResource("2_palette")' in lines
+    assert 'metadata/index_texture = ExtResource("3_index")' in lines
+    assert '[ext_resource type="Texture2D" path="res://car_index.png" id="3_index"]' in lines
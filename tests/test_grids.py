@@ -0,0 +1,97 @@
+import glob
+import os
+
+import pytest
+
+from conftest import ROOT
+from pixelkit import grids
+from pixelkit.grids import GridError
+
+TEXT = """# two-colour test sprite
+.  #00000000   # transparent
+O  #181425     # outline
+s  #ebc8a580
+
+.OO.   # row 0
+Os
+"""
+
+
+def write(tmp_path, text=TEXT):
+    path = tmp_path / "sprite.grid"
+    path.write_text(text)
+    return str(path)
+
+
+def test_compile_text():
+    grid = grids.compile_text(TEXT)
+    assert (grid.width, grid.height) == (4, 2)
+    assert grid.palette == [bytes((0, 0, 0, 0)), bytes((0x18, 0x14, 0x25, 255)), bytes((0xeb, 0xc8, 0xa5, 0x80))]
+    # short rows are filled with the background
+    assert grid.data == bytes((0, 1, 1, 0, 1, 2, 0, 0))
+
+
+@pytest.mark.parametrize("text, message", [
+    # a row right after the legend, with no blank line in between
+    (".  #00000000\nO  #181425\nOO\n", "expected a legend entry"),
+    # a row that looks like a legend entry is still caught as one
+    (".  #00000000\nO  #18142\n\nOO\n", "expected a legend entry"),
+    (".  #00000000\nO  #181425  outline\n\nOO\n", "expected a legend entry"),
+    (".  #00000000\nO  #181425\n", "no rows"),
+    ("# only a comment\n", "no legend"),
+    (".  #00000000\n.  #181425\n\n..\n", "defined twice"),
+    (".  #00000000\n\n.x\n", "'x' is not in the legend"),
+])
+def test_malformed_grids(text, message):
+    with pytest.raises(GridError, match=message):
+        grids.compile_text(text, "bad.grid")
+
+
+def test_errors_name_the_line():
+    with pytest.raises(GridError, match="bad.grid:3:"):
+        grids.compile_text(".  #00000000\nO  #181425\nOO\n", "bad.grid")
+
+
+def test_pack_round_trip():
+    grid = grids.compile_text(TEXT)
+    assert grids.unpack(grids.pack(grid)) == grid
+
+
+def test_cached_grid_is_not_parsed_again(tmp_path, monkeypatch):
+    path, cache = write(tmp_path), str(tmp_path / "cache")
+    first = grids.load(path, cache)
+    assert len(os.listdir(cache)) == 1
+
+    def fail(*args):
+        raise AssertionError("compiled again")
+    monkeypatch.setattr(grids, "compile_text", fail)
+    again = grids.load(path, cache)
+    assert again.buf == first.buf and again.palette == first.palette
+
+
+def test_corrupt_cache_blob_is_compiled_again(tmp_path):
+    path, cache = write(tmp_path), str(tmp_path / "cache")
+    expected = grids.load(path, cache)
+    (blob,) = [os.path.join(cache, name) for name in os.listdir(cache)]
+    for junk in (b"", b"PKG1\x04\x00", b"not a grid at all, just some bytes"):
+        with open(blob, "wb") as f:
+            f.write(junk)
+        img = grids.load(path, cache)
+        assert img.buf == expected.buf
+        with open(blob, "rb") as f:
+            assert grids.unpack(f.read()) == grids.compile_text(TEXT)
+
+
+def test_no_cache_dir_always_compiles(tmp_path):
+    img = grids.load(write(tmp_path))
+    assert img.size == (4, 2)
+    assert os.listdir(tmp_path) == ["sprite.grid"]
+
+
+def test_every_committed_grid_compiles():
+    paths = glob.glob(os.path.join(ROOT, "tools", "grids", "*", "*.grid"))
+    assert paths
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            grid = grids.compile_text(f.read(), path)
+        assert grid.width and grid.height
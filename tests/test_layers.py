@@ -0,0 +1,48 @@
+import numpy as np
+from PIL import Image
+
+from pixelkit import Canvas, layers
+from pixelkit.palette import IndexedCanvas
+
+RED = (255, 0, 0, 255)
+BLUE = (0, 0, 255, 255)
+
+
+def random_canvas(seed, w=8, h=8, alphas=(0, 255)):
+    rs = np.random.RandomState(seed)
+    pixels = rs.randint(0, 256, (h, w, 4)).astype(np.uint8)
+    pixels[..., 3] = rs.choice(alphas, (h, w))
+    return Canvas.from_array(pixels)
+
+
+def test_hard_edged_layers_compose_bit_for_bit():
+    bottom, top = random_canvas(1), random_canvas(2)
+    out = layers.compose((8, 8), [(bottom, (0, 0)), (top, (0, 0))])
+    opaque = top.pixels[..., 3:] == 255
+    expected = np.where(opaque, top.pixels, np.where(bottom.pixels[..., 3:] == 255, bottom.pixels, 0))
+    assert np.array_equal(out.pixels, expected)
+
+
+def test_translucent_pixels_match_pil():
+    bottom = random_canvas(3, alphas=(0, 90, 255))
+    top = random_canvas(4, alphas=(0, 60, 200, 255))
+    out = layers.over(bottom.copy(), top)
+    reference = Image.alpha_composite(bottom.to_image(), top.to_image())
+    diff = np.abs(out.pixels.astype(int) - np.asarray(reference, dtype=int))
+    # same blend up to rounding
+    assert diff.max() <= 1
+    assert np.array_equal(out.pixels[top.pixels[..., 3] == 255], top.pixels[top.pixels[..., 3] == 255])
+
+
+def test_offsets_are_clipped():
+    dot = Canvas(2, 2, RED)
+    out = layers.compose((4, 4), [(Canvas(4, 4, BLUE), (0, 0)), (dot, (3, -1)), (dot, (9, 9))])
+    assert out.getpixel((3, 0)) == RED
+    assert np.count_nonzero((out.pixels == RED).all(axis=-1)) == 1
+
+
+def test_indexed_layers_are_expanded():
+    part = IndexedCanvas(2, 1)
+    part.put(1, 0, RED)
+    out = layers.compose((3, 1), [(Canvas(3, 1, BLUE), (0, 0)), (part, (1, 0))])
+    assert [out.getpixel((x, 0)) for x in range(3)] == [BLUE, BLUE, RED]
@@ -0,0 +1,56 @@
+import hashlib
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from pixelkit import Canvas, build, registry
+from pixelkit.manifest import Manifest, image_stats, text_stats
+from pixelkit.registry import asset
+
+
+@pytest.fixture(autouse=True)
+def empty_registry(monkeypatch):
+    monkeypatch.setattr(registry, "ASSETS", {})
+    monkeypatch.setattr(registry, "OUTPUTS", {})
+
+
+def test_image_stats_come_from_the_buffer():
+    img = Canvas(4, 2)
+    img.fill_rect(0, 0, 2, 2, (255, 0, 0, 255))
+    img.put(3, 1, (0, 0, 255, 128))
+    stats = image_stats(img)
+    assert (stats["width"], stats["height"], stats["mode"]) == (4, 2, "P")
+    assert (stats["opaque"], stats["colors"]) == (5, 2)
+    assert image_stats(img.copy())["sha256"] == stats["sha256"]
+
+
+def test_text_stats():
+    digest = hashlib.sha256("héllo".encode("utf-8")).hexdigest()
+    assert text_stats("héllo") == {"sha256": digest, "bytes": 6, "mode": "text"}
+
+
+def test_record_replaces_the_previous_owner_of_an_output(tmp_path):
+    manifest = Manifest.for_root(str(tmp_path))
+    manifest.record(SimpleNamespace(name="test/a", output="out.png"), {"sha256": "1"})
+    manifest.record(SimpleNamespace(name="test/b", output="out.png"), {"sha256": "2"})
+    assert manifest.assets == {"test/b": {"sha256": "2", "output": "out.png"}}
+
+
+def test_two_builds_write_the_same_manifest(tmp_path):
+    asset("test/dot")(lambda: Canvas(2, 2, (9, 9, 9, 255)))
+    asset("test/frames", output="frames.tres")(lambda: "[resource]\n")
+    assets = registry.resolve(["test/dot", "test/frames"])
+    saved = []
+    for run in ("one", "two"):
+        root = str(tmp_path / run)
+        manifest = Manifest.for_root(root)
+        build.build(assets, root, log=lambda *a: None, manifest=manifest)
+        with open(manifest.path) as f:
+            saved.append(f.read())
+        with open(manifest.timings_path) as f:
+            timings = json.load(f)["assets"]
+        assert set(timings) == {"test/dot", "test/frames"}
+        assert all(t["written"] and t["render_ms"] >= 0 for t in timings.values())
+    assert saved[0] == saved[1]
+    assert "_ms" not in saved[0] and "written" not in saved[0]
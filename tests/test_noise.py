@@ -0,0 +1,90 @@
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from conftest import TOOLS
+from pixelkit import noise
+
+SEEDS = [1, 7, 123456789]
+
+
+@pytest.mark.parametrize("field", [
+    lambda seeds: noise.white((16, 16), seeds),
+    lambda seeds: noise.value_noise((32, 32), 4, seeds, octaves=3),
+    lambda seeds: noise.perlin((32, 32), 4, seeds, octaves=2),
+])
+def test_fields_depend_only_on_their_seed(field):
+    batch = field(SEEDS)
+    assert batch.shape[0] == len(SEEDS)
+    assert np.array_equal(batch, field(SEEDS))
+    for i, seed in enumerate(SEEDS):
+        assert np.array_equal(batch[i], field([seed])[0])
+    assert not np.array_equal(batch[0], batch[1])
+
+
+def test_fields_match_in_a_fresh_process():
+    code = ("import json, sys; sys.path.insert(0, %r); from pixelkit import noise; "
+            "print(json.dumps(noise.value_noise((16, 16), 4, %r, octaves=2).tolist()))" % (TOOLS, SEEDS))
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            env=dict(os.environ, PYTHONHASHSEED="random"))
+    assert result.returncode == 0, result.stderr
+    assert np.array_equal(np.array(json.loads(result.stdout)),
+                          noise.value_noise((16, 16), 4, SEEDS, octaves=2))
+
+
+def seam(a, b):
+    """Largest step between the last row of tile a and the first row of tile b."""
+    return np.abs(a[-1, :] - b[0, :]).max()
+
+
+def test_fields_tile():
+    field = noise.value_noise((32, 32), 4, SEEDS, octaves=2)
+    assert field.min() >= 0 and field.max() <= 1
+    for tile in field:
+        # wrapping around is no bigger a step than between two neighbouring pixels
+        assert seam(tile, tile) < 0.01
+        assert seam(tile.T, tile.T) < 0.01
+
+
+def test_shared_border_joins_every_variant():
+    joined = noise.value_noise((32, 32), 4, SEEDS, octaves=2, border=99)
+    apart = noise.value_noise((32, 32), 4, SEEDS, octaves=2)
+    assert seam(apart[0], apart[1]) > 0.1
+    for a in joined:
+        for b in joined:
+            # edge to edge, also flipped or transposed
+            assert seam(a, b) < 0.01
+            assert seam(a, b[:, ::-1]) < 0.01
+            assert seam(a.T, b) < 0.01
+    assert not np.allclose(joined[0], joined[1])
+
+
+def test_equalize_spreads_values_evenly():
+    ranks = noise.equalize(noise.perlin((16, 16), 4, SEEDS))
+    assert np.array_equal(np.sort(ranks[0].ravel()), np.arange(256) / 256)
+
+
+def test_threshold_masks_are_deterministic():
+    assert np.array_equal(noise.bayer(4), noise.bayer(4))
+    assert sorted(noise.bayer(4).ravel()) == [(i + 0.5) / 16 for i in range(16)]
+    with pytest.raises(ValueError):
+        noise.bayer(6)
+    blue = noise.blue_noise(16, seed=3)
+    noise.blue_noise.cache_clear()
+    assert np.array_equal(blue, noise.blue_noise(16, seed=3))
+    assert np.array_equal(np.sort(blue.ravel()), (np.arange(256) + 0.5) / 256)
+    masks = noise.masks((32, 32), blue, SEEDS)
+    assert np.array_equal(masks, noise.masks((32, 32), blue, SEEDS))
+    assert np.array_equal(masks[2], noise.masks((32, 32), blue, SEEDS[2:])[0])
+
+
+def test_quantize_counts_the_cutoffs_reached():
+    field = np.array([[0.1, 0.3, 0.5, 0.9]])
+    assert noise.quantize(field, (0.3, 0.75)).tolist() == [[0, 1, 1, 2]]
+    # a dither mask only moves values that sit near a cutoff
+    mask = np.array([[0.9, 0.1, 0.9, 0.1]])
+    assert noise.quantize(field, (0.3, 0.75), mask, 0.2).tolist() == [[0, 0, 1, 2]]
@@ -0,0 +1,62 @@
+import os
+
+import numpy as np
+
+from pixelkit import Canvas, output
+
+
+def red_square():
+    img = Canvas(4, 4)
+    img.fill_rect(1, 1, 2, 2, (255, 0, 0, 255))
+    return img
+
+
+def gradient():
+    """A canvas with more than 256 colours, so it is always written as RGBA."""
+    ys, xs = np.mgrid[0:32, 0:32]
+    pixels = np.stack([xs * 8, ys * 8, (xs + ys) * 4, np.full_like(xs, 255)], axis=-1)
+    return Canvas.from_array(pixels.astype(np.uint8))
+
+
+def test_write_if_changed(tmp_path):
+    path = str(tmp_path / "sub" / "file.txt")
+    assert output.write_if_changed(path, b"one")
+    mtime = os.stat(path).st_mtime_ns
+    assert not output.write_if_changed(path, b"one")
+    assert os.stat(path).st_mtime_ns == mtime
+    assert output.write_if_changed(path, b"two")
+    with open(path, "rb") as f:
+        assert f.read() == b"two"
+
+
+def test_atomic_write_leaves_no_temporary_files(tmp_path):
+    output.atomic_write(str(tmp_path / "a.bin"), b"data")
+    assert os.listdir(tmp_path) == ["a.bin"]
+
+
+def test_save_png_skips_same_pixels_encoded_differently(tmp_path):
+    path = str(tmp_path / "gradient.png")
+    img = gradient()
+    # the same pixels at another compression level, as an older encoder would have written them
+    img.to_image().save(path, format="PNG", compress_level=0)
+    with open(path, "rb") as f:
+        before = f.read()
+    assert before != output.encode_png(img)
+    assert not output.save_png(img, path)
+    with open(path, "rb") as f:
+        assert f.read() == before
+
+
+def test_save_png_rewrites_changed_pixels(tmp_path):
+    path = str(tmp_path / "square.png")
+    assert output.save_png(red_square(), path)
+    changed = red_square()
+    changed.put(0, 0, (0, 0, 255, 255))
+    assert output.save_png(changed, path)
+    assert output.same_pixels(path, changed)
+
+
+def test_save_text(tmp_path):
+    path = str(tmp_path / "frames.tres")
+    assert output.save_text("[resource]\n", path)
+    assert not output.save_text("[resource]\n", path)
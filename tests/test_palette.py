@@ -0,0 +1,80 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pixelkit import Canvas, output
+from pixelkit.palette import MAX_COLORS, IndexMap, IndexedCanvas, as_rgba, to_indexed
+
+CLEAR = (0, 0, 0, 0)
+RED = (255, 0, 0, 255)
+GLASS = (0, 0, 255, 128)
+
+
+def decode(data):
+    img = Image.open(io.BytesIO(data))
+    return img.mode, img.convert("RGBA").tobytes()
+
+
+def test_indexed_canvas_draws_like_a_canvas():
+    indexed, reference = IndexedCanvas(6, 4), Canvas(6, 4)
+    for img in (indexed, reference):
+        img.fill_rect(1, 1, 3, 9, RED)
+        img.hline(0, 5, 0, GLASS)
+        img.put(5, 3, RED)
+        img.put(6, 3, GLASS)
+    assert len(indexed.buf) == 6 * 4
+    assert indexed.palette == [bytes(CLEAR), bytes(RED), bytes(GLASS)]
+    assert indexed.to_canvas().tobytes() == reference.tobytes()
+    assert indexed.getpixel((5, 3)) == RED and indexed.get(9, 9, "off") == "off"
+
+
+def test_palette_png_keeps_alpha_in_trns():
+    img = IndexedCanvas(3, 1)
+    img.put(1, 0, GLASS)
+    img.put(2, 0, RED)
+    mode, rgba = decode(output.encode_png(img))
+    assert mode == "P"
+    assert rgba == img.to_canvas().tobytes()
+    assert img.to_image().info["transparency"] == bytes((0, 128))
+
+
+def test_rgba_canvas_with_few_colors_is_written_as_palette():
+    img = Canvas(4, 4)
+    img.fill_rect(0, 0, 2, 2, GLASS)
+    indexed = to_indexed(img)
+    assert indexed is not None and as_rgba(indexed).tobytes() == img.tobytes()
+    assert decode(output.encode_png(img)) == ("P", img.tobytes())
+
+
+def test_more_than_256_colors_stay_rgba():
+    pixels = np.zeros((1, MAX_COLORS + 1, 4), dtype=np.uint8)
+    pixels[0, :, 0] = np.arange(MAX_COLORS + 1) % 256
+    pixels[0, :, 1] = np.arange(MAX_COLORS + 1) // 256
+    pixels[..., 3] = 255
+    img = Canvas.from_array(pixels)
+    assert to_indexed(img) is None
+    assert decode(output.encode_png(img)) == ("RGBA", img.tobytes())
+    with pytest.raises(ValueError):
+        IndexedCanvas(1, 1, palette=[tuple(p) for p in pixels[0]])
+
+
+def test_index_map_is_written_as_gray_levels():
+    img = IndexMap(3, 1, palette=[CLEAR, RED, GLASS])
+    img.put(2, 0, GLASS)
+    mode, _ = decode(output.encode_png(img))
+    assert mode == "L"
+    assert img.rgba()[0, :, 0].tolist() == [0, 0, 2]
+
+
+def test_rgba_file_with_the_same_pixels_is_rewritten_as_palette(tmp_path):
+    path = str(tmp_path / "dot.png")
+    img = Canvas(4, 4)
+    img.fill_rect(1, 1, 2, 2, RED)
+    img.to_image().save(path, format="PNG")
+    assert output.same_pixels(path, img)
+    assert output.save_png(img, path)
+    with Image.open(path) as saved:
+        assert saved.mode == "P"
+    assert not output.save_png(img, path)
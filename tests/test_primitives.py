@@ -0,0 +1,82 @@
+import random
+
+import numpy as np
+
+from pixelkit import Canvas, primitives
+
+RED = (255, 0, 0, 255)
+BLUE = (0, 0, 255, 255)
+GREEN = (0, 255, 0, 255)
+
+
+def colors_of(img):
+    return {tuple(c) for c in img.pixels.reshape(-1, 4)}
+
+
+def test_uniform_depends_only_on_the_seed():
+    a, b = random.Random(42), random.Random(42)
+    draws = primitives.uniform(a, 100)
+    assert np.array_equal(draws, primitives.uniform(b, 100))
+    assert draws.min() >= 0 and draws.max() < 1
+    assert not np.array_equal(draws, primitives.uniform(random.Random(43), 100))
+
+
+def test_uniform_advances_the_stream_by_one_seed():
+    rng, reference = random.Random(7), random.Random(7)
+    first = primitives.uniform(rng, 10)
+    reference.getrandbits(64)
+    assert rng.getstate() == reference.getstate()
+    # the next batch is a new stream, not a repeat of the first
+    assert not np.array_equal(first, primitives.uniform(rng, 10))
+
+
+def test_solid_fills_match_the_canvas():
+    img, reference = Canvas(8, 8), Canvas(8, 8)
+    primitives.rect(img, 1, 2, 3, 4, RED)
+    primitives.hline(img, 0, 7, 7, BLUE)
+    primitives.vline(img, 7, 0, 7, GREEN)
+    reference.fill_rect(1, 2, 3, 4, RED)
+    reference.hline(0, 7, 7, BLUE)
+    reference.vline(7, 0, 7, GREEN)
+    assert img.tobytes() == reference.tobytes()
+
+
+def test_noise_fill_uses_only_weighted_colors():
+    img = Canvas(16, 16)
+    primitives.noise_fill(img, 0, 0, 16, 16, [RED, BLUE, GREEN], [1, 1, 0], rng=random.Random(1))
+    assert colors_of(img) == {RED, BLUE}
+    again = Canvas(16, 16)
+    primitives.noise_fill(again, 0, 0, 16, 16, [RED, BLUE, GREEN], [1, 1, 0], rng=random.Random(1))
+    assert again.tobytes() == img.tobytes()
+
+
+def test_random_fill_respects_mask_and_clipping():
+    img = Canvas(4, 4)
+    mask = np.zeros((4, 4), dtype=bool)
+    mask[1, 1] = mask[3, 3] = True
+    primitives.random_fill(img, 2, 2, 4, 4, (RED,), (1.0,), mask=mask, rng=random.Random(3))
+    # (1, 1) of the block lands on (3, 3); (3, 3) of the block is off the canvas
+    assert img.getpixel((3, 3)) == RED
+    assert np.count_nonzero(img.pixels[..., 3]) == 1
+
+
+def test_random_fill_none_leaves_pixels():
+    img = Canvas(4, 4, GREEN)
+    primitives.random_fill(img, 0, 0, 4, 4, (None,), (1.0,), rng=random.Random(3))
+    assert colors_of(img) == {GREEN}
+
+
+def test_dither_fill_without_density_is_a_checkerboard():
+    img = Canvas(4, 4)
+    primitives.dither_fill(img, 0, 0, 4, 4, RED, BLUE, density=0, rng=random.Random(5))
+    ys, xs = np.mgrid[0:4, 0:4]
+    expected = np.where(((xs + ys) % 2 == 0)[..., None], RED, BLUE)
+    assert np.array_equal(img.pixels, expected)
+
+
+def test_parity_dither_keeps_even_pixels_base():
+    img = Canvas(8, 8)
+    primitives.parity_dither(img, 0, 0, 8, 8, RED, BLUE, 0.5, rng=random.Random(9))
+    even = primitives.parity_mask(0, 0, 8, 8)
+    assert (img.pixels[even] == RED).all()
+    assert colors_of(img) == {RED, BLUE}
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from pixelkit import Canvas, recolor
+from pixelkit.palette import IndexedCanvas
+
+ROLES = {"body": ("#100000", "#200000", "#300000"), "glass": ("#0000ff80",)}
+BLUE_BODY = ("#000010", "#000020", "#000030")
+
+
+def sheet(cls=Canvas):
+    img = cls(6, 2)
+    for x, color in enumerate(ROLES["body"] + ROLES["glass"] + ("#ffffff",)):
+        img.put(x, 0, color)
+    return img
+
+
+def test_ramp_table_pairs_colours_step_by_step():
+    table = recolor.ramp_table(ROLES, {"body": BLUE_BODY})
+    assert table == dict(zip(ROLES["body"], BLUE_BODY))
+    with pytest.raises(KeyError, match="wheels"):
+        recolor.ramp_table(ROLES, {"wheels": BLUE_BODY})
+    with pytest.raises(ValueError, match="2 colours"):
+        recolor.ramp_table(ROLES, {"body": BLUE_BODY[:2]})
+
+
+def test_rgba_and_indexed_swaps_agree():
+    table = recolor.ramp_table(ROLES, {"body": BLUE_BODY, "glass": ("#00ff0080",)})
+    rgba = recolor.recolor(sheet(), table)
+    indexed = recolor.recolor(sheet(IndexedCanvas), table)
+    assert indexed.to_canvas().tobytes() == rgba.tobytes()
+    assert rgba.getpixel((0, 0)) == (0, 0, 16, 255)
+    assert rgba.getpixel((3, 0)) == (0, 255, 0, 128)
+    # colours outside the table are kept
+    assert rgba.getpixel((4, 0)) == (255, 255, 255, 255)
+    assert rgba.getpixel((0, 1)) == (0, 0, 0, 0)
+
+
+def test_indexed_swap_only_rewrites_the_palette():
+    base = sheet(IndexedCanvas)
+    variant = recolor.recolor(base, {"#100000": "#000010"})
+    assert variant.buf == base.buf and variant.buf is not base.buf
+    assert variant.palette[base.index("#100000")] == bytes((0, 0, 16, 255))
+
+
+def test_empty_table_copies():
+    img = sheet()
+    out = recolor.recolor(img, {})
+    assert out.tobytes() == img.tobytes() and out is not img
+
+
+def test_recolor_matches_a_per_pixel_swap():
+    rng = np.random.RandomState(0)
+    colors = rng.randint(0, 256, (12, 4)).astype(np.uint8)
+    img = Canvas.from_array(colors[rng.randint(0, 12, (16, 16))])
+    table = {tuple(colors[i]): tuple(colors[(i + 5) % 12]) for i in range(0, 12, 2)}
+    expected = Canvas(16, 16)
+    for y in range(16):
+        for x in range(16):
+            c = img.getpixel((x, y))
+            expected.putpixel((x, y), table.get(c, c))
+    assert recolor.recolor(img, table).tobytes() == expected.tobytes()
+
+
+def test_index_map_and_strip_rebuild_every_variant():
+    base = sheet(IndexedCanvas)
+    variant = recolor.recolor(base, recolor.ramp_table(ROLES, {"body": BLUE_BODY}))
+    indices = recolor.index_map(base)
+    assert indices.to_image().mode == "L"
+    assert indices.buf == recolor.index_map(variant).buf
+    for img in (base, variant):
+        strip = recolor.palette_strip(img)
+        assert strip.size == (16, 1)
+        # what palette_swap.gdshader does: look each index up in the strip
+        lookup = strip.pixels[0][indices.pixels]
+        assert lookup.tobytes() == img.to_canvas().tobytes()
+
+
+def test_palette_strip_grows_by_doubling():
+    img = IndexedCanvas(40, 1)
+    for x in range(40):
+        img.put(x, 0, (x, 0, 0, 255))
+    strip = recolor.palette_strip(img)
+    assert strip.size == (64, 1)
+    # index 0 is the transparent background
+    assert strip.getpixel((40, 0)) == (39, 0, 0, 255)
+    assert strip.getpixel((41, 0)) == (0, 0, 0, 0)
@@ -0,0 +1,124 @@
+import os
+
+import pytest
+
+from pixelkit import Canvas, build, registry
+from pixelkit.cache import BuildCache
+from pixelkit.registry import RegistryError, asset
+
+
+@pytest.fixture(autouse=True)
+def empty_registry(monkeypatch):
+    """Register into fresh tables so these tests do not see (or leave) other assets."""
+    monkeypatch.setattr(registry, "ASSETS", {})
+    monkeypatch.setattr(registry, "OUTPUTS", {})
+
+
+def dot(color=(255, 0, 0, 255)):
+    img = Canvas(2, 2)
+    img.put(0, 0, color)
+    return img
+
+
+def test_resolve_puts_dependencies_first():
+    asset("test/a")(lambda: dot())
+    asset("test/b", deps=("test/a",))(lambda a: a)
+    asset("test/c", deps=("test/b", "test/a"))(lambda b, a: b)
+    assert [entry.name for entry in registry.resolve(["test/c"])] == ["test/a", "test/b", "test/c"]
+
+
+def test_resolve_rejects_unknown_and_cyclic_dependencies():
+    asset("test/a", deps=("test/missing",))(lambda m: m)
+    with pytest.raises(RegistryError, match="needed by test/a"):
+        registry.resolve(["test/a"])
+    asset("test/x", deps=("test/y",))(lambda y: y)
+    asset("test/y", deps=("test/x",))(lambda x: x)
+    with pytest.raises(RegistryError, match="cycle"):
+        registry.resolve(["test/x"])
+
+
+def test_select_by_glob_and_tag():
+    asset("tiles/a", tags=("floor",))(lambda: dot())
+    asset("tiles/b")(lambda: dot())
+    asset("ui/c", tags=("floor",))(lambda: dot())
+    assert registry.select(["tiles/*"]) == ["tiles/a", "tiles/b"]
+    assert registry.select(tags=["floor"]) == ["tiles/a", "ui/c"]
+    assert registry.select(["tiles/*"], ["floor"]) == ["tiles/a"]
+    assert "tiles" in registry.ASSETS["tiles/b"].tags
+
+
+def test_generators_get_rng_and_root_when_they_ask(tmp_path):
+    seen = {}
+
+    @asset("test/params")
+    def make(rng, root):
+        seen.update(rng=rng.random(), root=root)
+        return dot()
+
+    entry = registry.ASSETS["test/params"]
+    build.render(entry, [], str(tmp_path))
+    first = seen["rng"]
+    build.render(entry, [], str(tmp_path))
+    assert seen == {"rng": first, "root": str(tmp_path)}
+
+
+def test_static_inputs_are_read_from_the_build_root(tmp_path):
+    sheet = "assets/sheet.png"
+
+    @asset("test/copy", static=(sheet,))
+    def make_copy(root):
+        return build.load_static(sheet, root)
+
+    entry = registry.ASSETS["test/copy"]
+    root = str(tmp_path)
+    with pytest.raises(build.BuildError, match=sheet):
+        build.build([entry], root, log=lambda *a: None)
+
+    os.makedirs(os.path.join(root, "assets"))
+    dot().save(os.path.join(root, sheet))
+    cache = BuildCache.for_root(root)
+    build.build([entry], root, log=lambda *a: None, cache=cache)
+    out = Canvas.open(os.path.join(root, entry.output))
+    assert out.getpixel((0, 0)) == (255, 0, 0, 255)
+
+    # a changed input changes the fingerprint, so the asset is rebuilt
+    dot((0, 0, 255, 255)).save(os.path.join(root, sheet))
+    build.build([entry], root, log=lambda *a: None, cache=cache)
+    assert Canvas.open(os.path.join(root, entry.output)).getpixel((0, 0)) == (0, 0, 255, 255)
+
+
+def producer(filename):
+    """A generator function that appears to come from another script."""
+    scope = {"dot": dot}
+    exec(compile("def make():\n    return dot()\n", filename, "exec"), scope)
+    return scope["make"]
+
+
+def test_two_scripts_cannot_write_the_same_file():
+    asset("npcs/lewis")(producer("one.py"))
+    with pytest.raises(RegistryError, match="declare one as a variant"):
+        asset("enemies/lewis", output="assets/sprites/npcs/lewis.png")(producer("two.py"))
+    with pytest.raises(RegistryError, match="registered by both"):
+        asset("npcs/lewis")(producer("two.py"))
+    # the same script registering again (e.g. reloaded) just replaces its entry
+    asset("npcs/lewis")(producer("one.py"))
+
+
+def test_variants_get_their_own_output():
+    asset("npcs/lewis")(producer("one.py"))
+    asset("npcs/lewis", variant="16x16")(producer("two.py"))
+    variant = registry.ASSETS["npcs/lewis@16x16"]
+    assert variant.output == "assets/sprites/npcs/lewis_16x16.png"
+    assert registry.OUTPUTS == {"assets/sprites/npcs/lewis.png": "npcs/lewis",
+                                "assets/sprites/npcs/lewis_16x16.png": "npcs/lewis@16x16"}
+    assert registry.select(["npcs/*"]) == ["npcs/lewis"]
+    assert registry.select(["npcs/*"], variants=True) == ["npcs/lewis", "npcs/lewis@16x16"]
+    assert registry.select(["npcs/lewis@16x16"]) == ["npcs/lewis@16x16"]
+
+
+def test_the_generator_scripts_share_no_outputs():
+    # loading every script registers every asset; a clash would raise here
+    build.load_generators(build.GENERATORS)
+    outputs = [entry.output for entry in registry.ASSETS.values() if entry.output]
+    assert len(outputs) > 100
+    assert len(outputs) == len(set(outputs)) == len(registry.OUTPUTS)
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from pixelkit import Canvas, shading
+
+BODY = (26, 26, 26, 255)
+RIM = (42, 42, 42, 255)
+DARK = (18, 18, 18, 255)
+
+
+def paint_loop(img, rows):
+    """The per-pixel paint_shape the mask version replaced (light from the right and top)."""
+    filled = {(x, y) for y, row in enumerate(rows) for x, ch in enumerate(row) if ch == "x"}
+    for x, y in filled:
+        img.putpixel((x, y), BODY)
+    for x, y in filled:
+        if (x + 1, y) not in filled or ((x, y - 1) not in filled and y > 0):
+            img.putpixel((x, y), RIM)
+    for x, y in filled:
+        if all((x + dx, y + dy) in filled for dx in (-2, 0, 2) for dy in (-2, 0, 2) if dx or dy):
+            img.putpixel((x, y), DARK)
+
+
+def blob(seed, size=16):
+    """String rows of a random filled blob touching the top edge."""
+    rs = np.random.RandomState(seed)
+    ys, xs = np.mgrid[0:size, 0:size]
+    cx, cy, r = rs.randint(5, 11), rs.randint(3, 9), rs.randint(4, 8)
+    inside = (xs - cx) ** 2 + (ys - cy) ** 2 <= r * r
+    inside |= rs.random_sample((size, size)) < 0.1
+    return ["".join("x" if v else "." for v in row) for row in inside]
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_matches_the_per_pixel_loop(seed):
+    rows = blob(seed)
+    img, reference = Canvas(16, 16), Canvas(16, 16)
+    shading.paint_shape(img, rows, BODY, RIM, DARK)
+    paint_loop(reference, rows)
+    assert img.tobytes() == reference.tobytes()
+
+
+def test_light_direction_picks_the_rim_side():
+    mask = np.zeros((6, 6), dtype=bool)
+    mask[1:5, 1:5] = True
+    left = shading.rim_mask(mask, light=(-1, 0))
+    assert left[1:5, 1].all() and not left[:, 2:].any()
+    top = shading.rim_mask(mask, light=(0, -1))
+    assert top[1, 1:5].all() and not top[2:].any()
+    assert not shading.rim_mask(mask, light=(0, 0)).any()
+
+
+def test_shade_mask_works_on_a_stack():
+    masks = np.stack([shading.mask_from_rows(blob(seed), 16, 16) for seed in range(4)])
+    stacked = shading.shade_mask(masks)
+    for mask, roles in zip(masks, stacked):
+        assert np.array_equal(roles, shading.shade_mask(mask))
+    assert set(np.unique(stacked)) <= {0, 1, 2, 3}
+
+
+def test_core_needs_the_whole_neighbourhood():
+    mask = np.ones((5, 5), dtype=bool)
+    core = shading.core_mask(mask)
+    assert core[2, 2] and core.sum() == 1
+    mask[0, 4] = False
+    assert not shading.core_mask(mask).any()
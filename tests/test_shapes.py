@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from pixelkit import Canvas, shapes
+
+HEART = (
+    ".xx.xx.",
+    "xwxxxxx",
+    "xxxxxxb",
+    ".xxxxx.",
+    "..xxx",
+    "...x...",
+)
+RED = (255, 0, 0, 255)
+WHITE = (255, 255, 255, 255)
+DARK = (80, 0, 0, 255)
+
+
+def filled_cells(rows, legend):
+    return {(x, y) for y, row in enumerate(rows) for x, ch in enumerate(row) if ch in legend}
+
+
+def test_roles_and_mask_match_the_rows():
+    roles = shapes.roles(HEART, "xwb")
+    assert roles.shape == (6, 7)
+    assert roles[1, 1] == 2 and roles[2, 6] == 3 and roles[0, 1] == 1 and roles[0, 0] == 0
+    # short rows are padded with empty cells
+    assert not roles[4, 5:].any()
+    mask = shapes.mask(HEART, "xwb")
+    assert set(zip(*np.nonzero(mask)[::-1])) == filled_cells(HEART, "xwb")
+    assert shapes.mask(HEART, "x", width=3, height=2).shape == (2, 3)
+
+
+def test_compiled_shapes_are_memoized_and_read_only():
+    first = shapes.mask(list(HEART))
+    assert shapes.mask(HEART) is first
+    with pytest.raises(ValueError):
+        first[0, 0] = True
+
+
+def test_shift_fills_past_the_edges():
+    mask = np.eye(3, dtype=bool)
+    # out[y, x] = mask[y + dy, x + dx]
+    assert shapes.shift(mask, 1, 0).tolist() == [[False] * 3, [True, False, False], [False, True, False]]
+    assert shapes.shift(mask, -1, 0)[1].tolist() == [False, False, True]
+    assert shapes.shift(mask, -1, 0, fill=True)[:, 0].all()
+    assert shapes.shift(mask, 0, 5, fill=True).all()
+
+
+def test_outline_matches_the_neighbour_walk():
+    cells = filled_cells(HEART, "xwb")
+    for neighbours in (shapes.EDGE_4, shapes.EDGE_8):
+        expected = {(x, y) for x, y in cells
+                    if any((x + dx, y + dy) not in cells for dx, dy in neighbours)}
+        edge = shapes.outline(shapes.mask(HEART, "xwb"), neighbours)
+        assert set(zip(*np.nonzero(edge)[::-1])) == expected
+
+
+def test_paint_zones_uses_the_first_matching_zone():
+    img = Canvas(7, 6)
+    shape = shapes.mask(HEART, "xwb")
+    top = np.zeros(shape.shape, dtype=bool)
+    top[:2] = True
+    shapes.paint_zones(img, shape, [(top, WHITE), (np.ones(shape.shape, dtype=bool), DARK)], RED)
+    assert img.getpixel((1, 0)) == WHITE and img.getpixel((3, 5)) == DARK
+    assert img.getpixel((0, 0)) == (0, 0, 0, 0)
+
+
+def test_paint_roles_leaves_other_cells_alone():
+    img = Canvas(7, 6, RED)
+    shapes.paint_roles(img, shapes.roles(HEART, "xwb"), {2: WHITE, 3: DARK})
+    assert img.getpixel((1, 1)) == WHITE and img.getpixel((6, 2)) == DARK
+    assert img.getpixel((2, 2)) == RED
@@ -0,0 +1,138 @@
+import os
+
+import numpy as np
+import pytest
+
+from conftest import ROOT
+from pixelkit import Canvas, godot, sheets
+
+WHITE = (255, 255, 255, 255)
+PLAYER_SHEET = os.path.join(ROOT, "assets", "sprites", "player", "cristian_spritesheet.png")
+
+
+def frame(seed, w=6, h=8):
+    """Asymmetric random frame, so it differs from its own mirror."""
+    pixels = np.random.RandomState(seed).randint(0, 256, (h, w, 4)).astype(np.uint8)
+    pixels[..., 3] = 255
+    return Canvas.from_array(pixels)
+
+
+def mirror(img):
+    return Canvas.from_array(img.pixels[:, ::-1])
+
+
+def test_sheet_size_and_regions():
+    assert sheets.sheet_size(3, 4, (48, 48)) == (144, 192)
+    assert sheets.sheet_size(3, 4, (16, 24), padding=2, extrude=1) == (3 * 18 + 2 * 2, 4 * 26 + 3 * 2)
+    regions = sheets.grid_regions(2, 2, (4, 5), padding=2, extrude=1)
+    assert regions == [(1, 1, 4, 5), (9, 1, 4, 5), (1, 10, 4, 5), (9, 10, 4, 5)]
+
+
+def test_assemble_anchors_frames_bottom_centre():
+    dot = Canvas(4, 4)
+    dot.put(1, 3, WHITE)
+    sheet = sheets.assemble([dot, None, dot], 2, (6, 6))
+    assert sheet.size == sheets.sheet_size(2, 2, (6, 6))
+    # the 4x4 frame sits at (1, 2) of its 6x6 cell
+    assert sheet.getpixel((2, 5)) == WHITE
+    assert sheet.getpixel((2, 11)) == WHITE
+    assert not sheet.pixels[:6, 6:].any()
+
+
+def test_assemble_scales_and_extrudes():
+    f = frame(1, w=2, h=3)
+    sheet = sheets.assemble([f, f], 2, (4, 6), padding=1, extrude=1, scale=2)
+    (x, y, w, h), (x2, _, _, _) = sheets.grid_regions(2, 1, (4, 6), padding=1, extrude=1)
+    cell = sheet.pixels[y:y + h, x:x + w]
+    assert np.array_equal(cell, f.pixels.repeat(2, axis=0).repeat(2, axis=1))
+    # the extruded border copies the cell edge; the padding column stays empty
+    assert np.array_equal(sheet.pixels[y - 1, x:x + w], cell[0])
+    assert np.array_equal(sheet.pixels[y:y + h, x - 1], cell[:, 0])
+    assert not sheet.pixels[:, x + w + 1:x2 - 1].any()
+
+
+def test_frame_larger_than_its_cell_is_an_error():
+    with pytest.raises(ValueError, match="does not fit"):
+        sheets.assemble([frame(1, w=8)], 1, (6, 8))
+
+
+def test_exact_copies_are_stored_once():
+    a, b = frame(1), frame(2)
+    unique, refs = sheets.dedupe([a, b, a.copy(), None])
+    assert len(unique) == 2
+    assert refs == [(0, False), (1, False), (0, False), None]
+
+
+def test_mirrored_animation_is_played_flipped():
+    left = [frame(1), frame(2)]
+    right = [mirror(f) for f in left]
+    animations = [{"name": "walk_left", "frames": [0, 1]}, {"name": "walk_right", "frames": [2, 3]}]
+    unique, refs = sheets.dedupe(left + right, animations)
+    assert len(unique) == 2
+    assert refs[2:] == [(0, True), (1, True)]
+    remapped = sheets.remap(animations, refs)
+    assert [a["flip_h"] for a in remapped] == [False, True]
+    assert remapped[1]["frames"] == [0, 1]
+
+
+def test_partly_mirrored_animation_keeps_its_frames():
+    # one frame that is not an exact mirror keeps the whole animation stored
+    left = [frame(1), frame(2)]
+    right = [mirror(left[0]), frame(3)]
+    animations = [{"name": "walk_left", "frames": [0, 1]}, {"name": "walk_right", "frames": [2, 3]}]
+    unique, refs = sheets.dedupe(left + right, animations)
+    assert len(unique) == 4
+    assert all(not flip for _, flip in refs)
+    assert not any(a["flip_h"] for a in sheets.remap(animations, refs))
+
+
+def test_mirrors_can_be_disabled():
+    a = frame(1)
+    unique, refs = sheets.dedupe([a, mirror(a)], mirrors=False)
+    assert len(unique) == 2
+    assert refs == [(0, False), (1, False)]
+
+
+def test_symmetric_frame_is_a_copy_not_a_mirror():
+    half = frame(1, w=3)
+    sym = Canvas.from_array(np.concatenate([half.pixels, half.pixels[:, ::-1]], axis=1))
+    _, refs = sheets.dedupe([sym, sym.copy()])
+    assert refs == [(0, False), (0, False)]
+
+
+def test_matches_are_checked_pixel_by_pixel(monkeypatch):
+    # a hash that says every frame is the same must not fold different frames
+    monkeypatch.setattr(sheets, "_key", lambda pixels: (0, 0, b""))
+    frames = [frame(1), frame(2), frame(3)]
+    unique, refs = sheets.dedupe(frames + [mirror(frames[1])])
+    assert len(unique) == 4
+    assert [j for j, _ in refs] == [0, 1, 2, 3]
+
+
+def test_remap_rejects_mixed_animations():
+    animations = [{"name": "mixed", "frames": [0, 1]}]
+    refs = [(0, False), (1, True)]
+    with pytest.raises(ValueError):
+        sheets.remap(animations, refs)
+
+
+def test_player_sheet_right_row_plays_the_left_one_flipped():
+    sheet = Canvas.open(PLAYER_SHEET)
+    cells = [sheet.crop((x, y, x + w, y + h)) for x, y, w, h in sheets.grid_regions(3, 4, (48, 48))]
+    animations = godot.four_way(3, {"idle": ([0], 8), "walk": ([0, 1, 0, 2], 8)})
+    unique, refs = sheets.dedupe(cells, animations)
+    assert len(unique) == 9
+    flipped = [a["name"] for a in sheets.remap(animations, refs) if a["flip_h"]]
+    assert flipped == ["idle_right", "walk_right"]
+
+
+def test_trim_regions_keep_the_cell_placement():
+    dot = Canvas(4, 4)
+    dot.put(1, 3, WHITE)
+    sheet = sheets.assemble([dot, None, dot], 2, (6, 6))
+    regions, trims = sheets.trim_regions(sheet, sheets.grid_regions(2, 2, (6, 6)))
+    # bottom-centre anchored: the dot lands at (2, 5) of its cell
+    assert regions[0] == (2, 5, 1, 1) and trims[0] == (2, 5, 6, 6)
+    assert regions[2] == (2, 11, 1, 1) and trims[2] == (2, 5, 6, 6)
+    # empty cells keep their full region and no trim
+    assert regions[1] == (6, 0, 6, 6) and 1 not in trims
@@ -0,0 +1,82 @@
+import json
+import os
+
+import numpy as np
+
+from conftest import ROOT
+from pixelkit import Canvas, tiling
+from pixelkit.tiling import WrapCanvas
+
+WHITE = (255, 255, 255, 255)
+BLACK = (0, 0, 0, 255)
+SEAMS = os.path.join(ROOT, "assets", "sprites", "tiles", "seams.json")
+
+
+def grain(seed):
+    pixels = np.random.RandomState(seed).randint(0, 256, (16, 16, 4)).astype(np.uint8)
+    pixels[..., 3] = 255
+    return Canvas.from_array(pixels)
+
+
+def test_drawing_wraps_around_the_edges():
+    img = WrapCanvas(4, 4, BLACK)
+    img.put(5, -1, WHITE)
+    assert img.getpixel((1, 3)) == WHITE
+    assert img.get(-3, 7) == WHITE
+    img.fill_rect(3, 3, 2, 2, WHITE)
+    lit = {(x, y) for y in range(4) for x in range(4) if img.getpixel((x, y)) == WHITE}
+    assert lit == {(3, 3), (0, 3), (3, 0), (0, 0), (1, 3)}
+
+
+def test_wrap_survives_copy():
+    img = WrapCanvas(4, 4, BLACK).copy()
+    img.put(4, 0, WHITE)
+    assert isinstance(img, WrapCanvas) and img.getpixel((0, 0)) == WHITE
+
+
+def test_edge_contrast_compares_opposite_edges():
+    img = Canvas(4, 4, BLACK)
+    img.fill_rect(3, 0, 1, 4, WHITE)
+    # last column white against a black first column; first and last rows match
+    assert tiling.edge_contrast([img]).tolist() == [[765.0, 0.0]]
+
+
+def test_a_gradient_breaks_at_its_wrap_line():
+    # the stripe on column 0 draws two equally strong lines: the wrap line and the one inside
+    stripe = Canvas(16, 16, BLACK)
+    stripe.fill_rect(0, 0, 1, 16, WHITE)
+    assert tiling.seam_contrast([stripe])[0].tolist() == [1.0, 0.0]
+    ramp = Canvas(16, 16, BLACK)
+    for y in range(16):
+        ramp.fill_rect(0, y, 16, 1, (16 * y, 16 * y, 16 * y, 255))
+    # steps of 16 inside, one step of 240 back to the top
+    assert tiling.seam_contrast([ramp])[0].tolist() == [0.0, 15.0]
+
+
+def test_seam_scores_are_batched():
+    tiles = [grain(1), grain(2), Canvas(16, 16, BLACK)]
+    batch = tiling.seam_contrast(tiles)
+    assert batch.shape == (3, 2)
+    for tile, row in zip(tiles, batch):
+        assert np.array_equal(tiling.seam_contrast([tile])[0], row)
+
+
+def test_joint_contrast_takes_the_worst_pair():
+    dark, light = Canvas(16, 16, BLACK), Canvas(16, 16, (40, 40, 40, 255))
+    for img in (dark, light):
+        img.fill_rect(7, 7, 2, 2, WHITE)
+    assert tiling.joint_contrast([dark, dark]).tolist() == [0.0, 0.0]
+    # a flat step between two tiles is weaker than their own bright spot, but it is there
+    assert (tiling.joint_contrast([dark, light]) > 0).all()
+    assert np.array_equal(tiling.joint_contrast([dark, light]), tiling.joint_contrast([light, dark]))
+
+
+def test_report_checks_both_axes_of_every_tile():
+    with open(SEAMS) as f:
+        report = json.load(f)
+    limit = report["limit"]
+    for name, tile in report["tiles"].items():
+        assert tile["seamless"] == [s <= limit for s in tile["seam"]], name
+    # the baseboard meets the top of the next wall
+    assert report["tiles"]["tiles/wall_house"]["seamless"] == [True, False]
+    assert report["tiles"]["tiles/wall_brick"]["seamless"] == [True, True]
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Build entry point for every generated sprite in "Versos de Heroe".
+
+    python3 tools/build_sprites.py                      # everything
+    python3 tools/build_sprites.py --only 'tiles/*'     # by name glob
+    python3 tools/build_sprites.py --tag ui --list      # by tag, dry run
+    python3 tools/build_sprites.py --root /tmp/vdh      # into another project root
+"""
+
+import sys
+
+from pixelkit import build
+
+if __name__ == "__main__":
+    sys.exit(build.main(sys.argv[1:]))
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Texture atlases for "Versos de Heroe".
+Packs the generated tiles, UI sprites and collectibles into power-of-two
+atlases (pixelkit.atlas, MaxRects with 1px extrusion, duplicate sprites
+stored once). For every atlas this writes
+assets/sprites/atlas/<atlas>.png, a JSON index and one AtlasTexture .tres
+per sprite (assets/sprites/atlas/<sprite name>.tres). The standalone
+PNGs are still built: floors drawn with TextureRect.STRETCH_TILE need a
+texture of their own, since an AtlasTexture cannot repeat.
+"""
+
+import sys
+
+from pixelkit import atlas, build, godot, registry
+from pixelkit.registry import asset
+
+# Generators whose sprites are packed, loaded here so this script also runs on its own
+build.load_generators(["assets/sprites/tiles/generate_tiles.py", "generate_sprites.py"])
+
+EXTRUDE = 1
+MAX_SIZE = 2048
+
+# atlas -> name globs of the sprites it packs
+ATLASES = {
+    "tiles": ["tiles/*"],
+    "ui": ["ui/*", "collectibles/*"],
+}
+# atlases whose sprites are cropped to their alpha bounding box (the mostly
+# transparent projectiles and silhouettes); the AtlasTexture margin restores
+# their original size
+TRIMMED = ("ui",)
+
+
+def register_atlas(name, patterns):
+    members = registry.select(patterns)
+    atlas_name = "atlas/" + name
+    texture = godot.res_path(registry.default_output(atlas_name))
+    trimmed = name in TRIMMED
+
+    @asset(atlas_name, tags=("atlas",), deps=members)
+    def make_atlas(*images):
+        img, _ = atlas.compose(dict(zip(members, images)), EXTRUDE, MAX_SIZE, trimmed)
+        return img
+
+    # the index and the .tres redo the (cheap) packing from the sprites themselves
+    @asset(atlas_name + "_index", output="assets/sprites/atlas/%s.json" % name,
+           tags=("atlas",), deps=(atlas_name,) + tuple(members))
+    def make_index(atlas_img, *images):
+        packing = atlas.pack(dict(zip(members, images)), EXTRUDE, MAX_SIZE, trimmed)
+        return atlas.index_json(texture, atlas_img.size, packing.regions, trim=packing.trimmed)
+
+    for member in members:
+        register_region(atlas_name, texture, member, members, trimmed)
+
+
+def register_region(atlas_name, texture, member, members, trimmed):
+    @asset("atlas/" + member, output="assets/sprites/atlas/%s.tres" % member,
+           tags=("atlas",), deps=(atlas_name,) + tuple(members))
+    def make_region(atlas_img, *images):
+        packing = atlas.pack(dict(zip(members, images)), EXTRUDE, MAX_SIZE, trimmed)
+        return godot.atlas_texture_tres(texture, packing.regions[member], trim=packing.trimmed.get(member))
+    return make_region
+
+
+for _name, _patterns in ATLASES.items():
+    register_atlas(_name, _patterns)
+
+
+if __name__ == "__main__":
+    sys.exit(build.main(sys.argv[1:], sources=[__file__]))
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Crowd NPCs for "Versos de Heroe".
+Background classmates and pedestrians are synthesized from the part library
+in tools/grids/parts/ (hair, face, torso, legs and shoes styles cut from
+Cristian's layers, pixelkit.crowd) and the palette sets below, taken from
+the hand-drawn NPCs. Each entry of CROWD is written as a 16x24 walk sheet
+(3 cols: idle, step 1, step 2 x 4 rows: down, up, left, right) with the
+SpriteFrames .tres that pedestrian.gd loads next to it.
+
+Any number of other characters come from the same library in one call:
+
+    picks, tables = crowd.random_batch(library(root), PALETTE_SETS, 5000, rng)
+    sheets = crowd.synthesize(library(root), picks, tables)  # (5000, 96, 48, 4)
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+from pixelkit import build, crowd, godot, grids, sheets
+from pixelkit.registry import asset, default_output
+
+PART_DIR = "tools/grids/parts"
+# <slot>_<style>.grid files of the library; their text is part of every crowd sheet's fingerprint
+PART_FILES = tuple("%s/%s.grid" % (PART_DIR, part) for part in (
+    "face_base", "face_glasses", "hair_buzz", "hair_long", "hair_short", "legs_shorts",
+    "legs_trousers", "shoes_boots", "shoes_shoes", "torso_hoodie", "torso_scarf", "torso_striped"))
+SLOTS = ("legs", "shoes", "torso", "face", "hair")  # drawing order, bottom first
+CELL = (16, 24)
+
+# Template palette of the part grids (Cristian's colours plus the accent),
+# one ramp per colour group, dark to light
+ROLES = {
+    "outline": ("#181425",),
+    "hair": ("#4a2a14", "#6b4226", "#8b5a34"),
+    "skin": ("#d4a878", "#f2c8a0", "#ffe0c0"),
+    "eyes": ("#2b1b0e", "#ffffff"),
+    "shirt": ("#2a4070", "#3b5998", "#5b79b8"),
+    "accent": ("#8c2f39", "#b8444f"),
+    "trousers": ("#1b1b2b", "#2b2b3b"),
+    "shoes": ("#3a2510", "#5a3b20"),
+}
+
+# ---------------------------------------------------------------------------
+# Palette sets: group -> {name: ramp}, from the hand-drawn characters
+# ---------------------------------------------------------------------------
+PALETTE_SETS = {
+    "hair": {
+        "cristian": ("#4a2a14", "#6b4226", "#8b5a34"),
+        "lewis": ("#1e120a", "#2a1a10", "#412d1e"),
+        "robert": ("#412d1c", "#5a4128", "#735537"),
+        "mike": ("#372819", "#503c28", "#695037"),
+        "lucy": ("#50301c", "#6b4226", "#8c5f3c"),
+        "student": ("#463220", "#644b32", "#826446"),
+        "teacher": ("#5f5f5f", "#808080", "#a0a0a0"),
+        "grandma": ("#9b9b9b", "#c0c0c0", "#d7d7d7"),
+    },
+    "skin": {
+        "cristian": ("#d4a878", "#f2c8a0", "#ffe0c0"),
+        "classmates": ("#c8a078", "#ebc8a5", "#fae1c3"),
+        "ahmed": ("#6c482d", "#916644", "#a57852"),
+        "carlos": ("#d7aa84", "#f5cda5", "#ffdcb6"),
+        "wei": ("#a07a58", "#c69e76", "#d7af87"),
+    },
+    "eyes": {
+        "cristian": ("#2b1b0e", "#ffffff"),
+        "classmates": ("#1e1928", "#ffffff"),
+        "lucy": ("#5a8250", "#ffffff"),
+    },
+    "shirt": {
+        "cristian": ("#2a4070", "#3b5998", "#5b79b8"),
+        "lewis": ("#aa2222", "#cc3333", "#dd5555"),
+        "joan": ("#227722", "#339933", "#44bb44"),
+        "joan_cap": ("#183082", "#2244aa", "#375abe"),
+        "robert": ("#aa5522", "#cc7733", "#ddaa55"),
+        "mike": ("#aaaa22", "#cccc33", "#dddd55"),
+        "lucy": ("#bb6688", "#dd88aa", "#ffaacc"),
+        "lucy_skirt": ("#6e508c", "#8866aa", "#a07dc3"),
+        "student": ("#cdcdcd", "#ebebeb", "#f8f8f8"),
+        "grandma": ("#886633", "#aa7744", "#cc9966"),
+    },
+    "accent": {
+        "teacher_tie": ("#8c1e1e", "#b42828"),
+        "lewis": ("#aa2222", "#cc3333"),
+        "joan": ("#227722", "#339933"),
+        "joan_cap": ("#183082", "#2244aa"),
+        "mike": ("#aaaa22", "#cccc33"),
+        "lucy": ("#bb6688", "#dd88aa"),
+        "student": ("#cdcdcd", "#ebebeb"),
+    },
+    "trousers": {
+        "cristian": ("#1b1b2b", "#2b2b3b"),
+        "lewis": ("#231e2d", "#322d3c"),
+        "joan": ("#3c3c5f", "#505078"),
+        "robert": ("#322d26", "#464137"),
+        "mike": ("#2d2d41", "#41415a"),
+        "teacher": ("#55555a", "#6e6e73"),
+        "student": ("#2a3269", "#3c468c"),
+    },
+    "shoes": {
+        "cristian": ("#3a2510", "#5a3b20"),
+        "lewis": ("#281912", "#3c281e"),
+        "joan": ("#322319", "#463228"),
+        "robert": ("#2a1e16", "#3c2d23"),
+        "lucy": ("#412a1e", "#5a3c2d"),
+        "teacher": ("#231c16", "#322823"),
+        "student": ("#2d2016", "#413226"),
+    },
+}
+
+# ---------------------------------------------------------------------------
+# Named crowd characters: one style per slot and palette set names, written
+# to assets/sprites/npcs/crowd/<name>_spritesheet.png
+# ---------------------------------------------------------------------------
+CROWD = {
+    "chica_melena": {
+        "hair": "long", "face": "base", "torso": "striped", "legs": "trousers", "shoes": "shoes",
+        "colors": {"hair": "lucy", "skin": "carlos", "eyes": "lucy", "shirt": "lucy_skirt",
+                   "accent": "student", "trousers": "student", "shoes": "lucy"},
+    },
+    "chico_gafas": {
+        "hair": "short", "face": "glasses", "torso": "hoodie", "legs": "trousers", "shoes": "shoes",
+        "colors": {"hair": "lewis", "skin": "wei", "eyes": "classmates", "shirt": "joan",
+                   "trousers": "mike", "shoes": "joan"},
+    },
+    "chico_bufanda": {
+        "hair": "buzz", "face": "base", "torso": "scarf", "legs": "trousers", "shoes": "boots",
+        "colors": {"hair": "robert", "skin": "ahmed", "eyes": "classmates", "shirt": "student",
+                   "accent": "lewis", "trousers": "robert", "shoes": "robert"},
+    },
+    "corredora": {
+        "hair": "long", "face": "base", "torso": "striped", "legs": "shorts", "shoes": "shoes",
+        "colors": {"hair": "mike", "skin": "classmates", "eyes": "classmates", "shirt": "mike",
+                   "accent": "joan_cap", "trousers": "joan", "shoes": "student"},
+    },
+    "senor_corbata": {
+        "hair": "short", "face": "glasses", "torso": "scarf", "legs": "trousers", "shoes": "shoes",
+        "colors": {"hair": "teacher", "skin": "classmates", "eyes": "classmates", "shirt": "student",
+                   "accent": "teacher_tie", "trousers": "teacher", "shoes": "teacher"},
+    },
+    "chico_botas": {
+        "hair": "buzz", "face": "base", "torso": "hoodie", "legs": "shorts", "shoes": "boots",
+        "colors": {"hair": "student", "skin": "cristian", "eyes": "cristian", "shirt": "robert",
+                   "trousers": "lewis", "shoes": "lewis"},
+    },
+}
+
+SHEET_ANIMATIONS = godot.four_way(3, {"idle": ([0], 6), "walk": ([0, 1, 0, 2], 6)})
+
+
+@lru_cache(maxsize=None)
+def library(root):
+    """The part library under a project root, loaded once per build process."""
+    return crowd.load_library([os.path.join(root, path) for path in PART_FILES], SLOTS, ROLES, CELL,
+                              grids.cache_dir_for(root))
+
+
+def register_character(stem, description):
+    name = "npcs/crowd/%s_spritesheet" % stem
+
+    @asset(name, tags=("characters", "npc", "crowd"), static=PART_FILES)
+    def make_sheet(root):
+        return crowd.sheet(library(root), description, PALETTE_SETS)
+
+    @asset("npcs/crowd/%s_frames" % stem, output=default_output(name)[:-len(".png")] + ".tres",
+           tags=("characters", "npc", "crowd", "godot"))
+    def make_sprite_frames():
+        return godot.sprite_frames_tres(godot.res_path(default_output(name)),
+                                        sheets.grid_regions(3, 4, CELL), SHEET_ANIMATIONS)
+    return make_sheet
+
+
+for _stem, _description in CROWD.items():
+    register_character(_stem, _description)
+
+
+if __name__ == "__main__":
+    sys.exit(build.main(sys.argv[1:], sources=[__file__]))
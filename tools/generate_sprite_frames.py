@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+SpriteFrames resources for the hand-drawn spritesheets of "Versos de Heroe".
+The pedestrian sheets in assets/sprites/npcs/pedestrians/ are drawn by hand
+(3 cols: idle, step 1, step 2 x 4 rows: down, up, left, right, 32x32 cells).
+This script only writes the <sheet>.tres next to each one, which
+pedestrian.gd loads instead of building AtlasTextures per instance.
+The same goes for the player sheet (48x48 cells, read by player.gd) and the
+enemy sheets (3 pulse frames per direction, 16x24 cells, read by
+enemy_base.gd). Their regions are trimmed to the opaque pixels of the
+committed PNG, which is part of each fingerprint. Player animations whose
+cells are verified mirrors of others are written once and listed in the
+resource's flip_h metadata.
+"""
+
+import sys
+
+from pixelkit import build, godot, sheets
+from pixelkit.registry import asset
+
+PEDESTRIAN_DIR = "assets/sprites/npcs/pedestrians"
+# <name>_spritesheet.png in PEDESTRIAN_DIR; names as in the res:// paths of the scripts
+PEDESTRIANS = ("abuelo_gorra", "chica_mochila", "hombre_traje", "mujer_perro",
+               "niño_balon", "runner", "señora_bolsa", "skater")
+PEDESTRIAN_CELL = (32, 32)
+PLAYER_SHEET = "assets/sprites/player/cristian_spritesheet.png"
+PLAYER_CELL = (48, 48)
+ENEMY_SHEETS = ("miedo", "tristeza", "soledad")
+ENEMY_CELL = (16, 24)
+
+
+def register_pedestrian(stem):
+    sheet_path = "%s/%s_spritesheet.png" % (PEDESTRIAN_DIR, stem)
+    output = sheet_path[:-len(".png")] + ".tres"
+
+    # idle = col 0, walk = idle/step1/idle/step2 at 6 fps
+    @asset("pedestrians/%s_frames" % stem, output=output, tags=("npc", "godot"))
+    def make_sprite_frames():
+        regions = sheets.grid_regions(3, 4, PEDESTRIAN_CELL)
+        animations = godot.four_way(3, {"idle": ([0], 6), "walk": ([0, 1, 0, 2], 6)})
+        return godot.sprite_frames_tres(godot.res_path(sheet_path), regions, animations)
+    return make_sprite_frames
+
+
+def mirrored_regions(sheet, regions, animations):
+    """Fold animations whose cells all mirror earlier ones (sheets.dedupe) into flip_h.
+
+    Returns (regions, animations) over the stored cells only; every stored
+    cell keeps the region of its first occurrence in the sheet.
+    """
+    cells = [sheet.crop((x, y, x + w, y + h)) for x, y, w, h in regions]
+    unique, refs = sheets.dedupe(cells, animations)
+    first = {}
+    for i, (j, flip) in enumerate(refs):
+        if not flip:
+            first.setdefault(j, i)
+    return [regions[first[j]] for j in range(len(unique))], sheets.remap(animations, refs)
+
+
+def register_sheet(name, sheet_path, cell, cycles, tags, mirrors=False):
+    @asset(name, output=sheet_path[:-len(".png")] + ".tres", tags=tags + ("godot",), static=(sheet_path,))
+    def make_sprite_frames(root):
+        sheet = build.load_static(sheet_path, root)
+        if tuple(sheet.size) != sheets.sheet_size(3, 4, cell):
+            raise ValueError("%s is not a 3x4 grid of %dx%d cells" % ((sheet_path,) + cell))
+        regions, animations = sheets.grid_regions(3, 4, cell), godot.four_way(3, cycles)
+        if mirrors:
+            regions, animations = mirrored_regions(sheet, regions, animations)
+        regions, trims = sheets.trim_regions(sheet, regions)
+        return godot.sprite_frames_tres(godot.res_path(sheet_path), regions, animations, trims=trims)
+    return make_sprite_frames
+
+
+# idle = col 0, walk = idle/step1/idle/step2 at 8 fps, as in player.gd; the
+# right row is painted as the exact mirror of the left one, so *_right play
+# the left cells with flip_h (player.gd play_animation)
+register_sheet("player/cristian_frames", PLAYER_SHEET, PLAYER_CELL,
+               {"idle": ([0], 8), "walk": ([0, 1, 0, 2], 8)}, ("characters",), mirrors=True)
+
+# pulse = idle, pulse 1, pulse 2, pulse 1 at 4 fps, as in enemy_base.gd
+for _name in ENEMY_SHEETS:
+    register_sheet("enemies/%s_frames" % _name, "assets/sprites/enemies/%s_spritesheet.png" % _name, ENEMY_CELL,
+                   {"pulse": ([0, 1, 2, 1], 4)}, ("characters", "enemy"))
+
+for _stem in PEDESTRIANS:
+    register_pedestrian(_stem)
+
+
+if __name__ == "__main__":
+    sys.exit(build.main(sys.argv[1:], sources=[__file__]))
@@ -3,14 +3,16 @@
 Sprite generator for "Versos de Heroe" - 2D RPG about bullying.
 Generates 16x16 pixel art sprites for enemies and NPCs using Pillow.
 All sprites are drawn pixel by pixel.
+Registered as "16x16" variants of the 16x24 set in generate_character_sprites.py,
+written next to it as <name>_16x16.png.
 """
 
-from PIL import Image
 import os
+import sys
 
-# --- Output directories ---
-ENEMY_DIR = "/Users/macbook/Flat101/godtest/vdh-godot/assets/sprites/enemies"
-NPC_DIR = "/Users/macbook/Flat101/godtest/vdh-godot/assets/sprites/npcs"
+from pixelkit import Canvas, build
+from pixelkit.manifest import Manifest
+from pixelkit.registry import asset
 
 # --- Color constants ---
 T = (0, 0, 0, 0)  # Transparent
@@ -40,32 +42,24 @@ TIE_RED = (180, 40, 40, 255)
 
 def make_image():
     """Create a new 16x16 RGBA image filled with transparency."""
-    return Image.new("RGBA", (16, 16), T)
+    return Canvas(16, 16, T)
 
 
 def px(img, x, y, color):
     """Set a single pixel, bounds-checked."""
-    if 0 <= x < 16 and 0 <= y < 16:
-        img.putpixel((x, y), color)
+    img.put(x, y, color)
 
 
 def fill_rect(img, x0, y0, w, h, color):
     """Fill a rectangle of pixels."""
-    for yy in range(y0, y0 + h):
-        for xx in range(x0, x0 + w):
-            px(img, xx, yy, color)
-
-
-def save(img, path):
-    """Save image and print confirmation."""
-    img.save(path)
-    print(f"  Saved: {path}")
+    img.fill_rect(x0, y0, w, h, color)
 
 
 # =============================================================================
 # ENEMY SPRITES
 # =============================================================================
 
+@asset("enemies/enemy_fear", variant="16x16", size=(16, 16), tags=("characters", "enemy"))
 def generate_enemy_fear():
     """Fear: Purple ghostly figure, wispy/smoke shape, glowing white eyes."""
     img = make_image()
@@ -220,9 +214,10 @@ def generate_enemy_fear():
     px(img, 6, 15, PURPLE_EDGE)
     px(img, 8, 15, PURPLE_EDGE)
 
-    save(img, os.path.join(ENEMY_DIR, "enemy_fear.png"))
+    return img
 
 
+@asset("enemies/enemy_sadness", variant="16x16", size=(16, 16), tags=("characters", "enemy"))
 def generate_enemy_sadness():
     """Sadness: Blue teardrop entity, drooping form, single dim eye, dripping."""
     img = make_image()
@@ -365,9 +360,10 @@ def generate_enemy_sadness():
     px(img, 6, 15, BLUE_EDGE)
     px(img, 9, 15, BLUE_EDGE)
 
-    save(img, os.path.join(ENEMY_DIR, "enemy_sadness.png"))
+    return img
 
 
+@asset("enemies/enemy_loneliness", variant="16x16", size=(16, 16), tags=("characters", "enemy"))
 def generate_enemy_loneliness():
     """Loneliness: Gray shadow figure, barely visible, humanoid, hollow eyes, fading."""
     img = make_image()
@@ -481,13 +477,14 @@ def generate_enemy_loneliness():
     px(img, 7, 14, (65, 65, 75, 30))
     px(img, 8, 14, (65, 65, 75, 30))
 
-    save(img, os.path.join(ENEMY_DIR, "enemy_loneliness.png"))
+    return img
 
 
 # =============================================================================
 # NPC SPRITES
 # =============================================================================
 
+@asset("npcs/lewis", variant="16x16", size=(16, 16), tags=("characters", "npc"))
 def generate_lewis():
     """Lewis: Bully leader. Red shirt, spiky dark hair, mean expression, bigger."""
     img = make_image()
@@ -653,9 +650,10 @@ def generate_lewis():
     px(img, 11, 15, SHOE_BLACK)
     px(img, 12, 15, SHOE_BLACK)
 
-    save(img, os.path.join(NPC_DIR, "lewis.png"))
+    return img
 
 
+@asset("npcs/joan", variant="16x16", size=(16, 16), tags=("characters", "npc"))
 def generate_joan():
     """Joan: Bully. Green shirt, cap, smirking."""
     img = make_image()
@@ -790,9 +788,10 @@ def generate_joan():
     px(img, 10, 15, SHOE_BLACK)
     px(img, 11, 15, SHOE_BLACK)
 
-    save(img, os.path.join(NPC_DIR, "joan.png"))
+    return img
 
 
+@asset("npcs/robert", variant="16x16", size=(16, 16), tags=("characters", "npc"))
 def generate_robert():
     """Robert: Bully. Orange shirt, stocky build."""
     img = make_image()
@@ -943,9 +942,10 @@ def generate_robert():
     px(img, 11, 15, SHOE_BLACK)
     px(img, 12, 15, SHOE_BLACK)
 
-    save(img, os.path.join(NPC_DIR, "robert.png"))
+    return img
 
 
+@asset("npcs/mike", variant="16x16", size=(16, 16), tags=("characters", "npc"))
 def generate_mike():
     """Mike: Bully. Yellow shirt, tall and thin."""
     img = make_image()
@@ -1048,9 +1048,10 @@ def generate_mike():
     px(img, 9, 15, SHOE_BLACK)
     px(img, 10, 15, SHOE_BLACK)
 
-    save(img, os.path.join(NPC_DIR, "mike.png"))
+    return img
 
 
+@asset("npcs/lucy", variant="16x16", size=(16, 16), tags=("characters", "npc"))
 def generate_lucy():
     """Lucy: Friendly classmate. Pink top, brown hair, kind eyes."""
     img = make_image()
@@ -1188,9 +1189,10 @@ def generate_lucy():
     px(img, 9, 15, SHOE_BROWN)
     px(img, 10, 15, SHOE_BROWN)
 
-    save(img, os.path.join(NPC_DIR, "lucy.png"))
+    return img
 
 
+@asset("npcs/teacher", variant="16x16", size=(16, 16), tags=("characters", "npc"))
 def generate_teacher():
     """Teacher (Don Peter): White shirt, glasses, gray hair, tie."""
     img = make_image()
@@ -1324,9 +1326,10 @@ def generate_teacher():
     px(img, 10, 15, SHOE_BLACK)
     px(img, 11, 15, SHOE_BLACK)
 
-    save(img, os.path.join(NPC_DIR, "teacher.png"))
+    return img
 
 
+@asset("npcs/grandma", variant="16x16", size=(16, 16), tags=("characters", "npc"))
 def generate_grandma():
     """Grandma (Abuela): White/gray hair, warm shawl, kind face, slightly hunched."""
     img = make_image()
@@ -1458,9 +1461,10 @@ def generate_grandma():
     px(img, 9, 15, SHOE_BROWN)
     px(img, 10, 15, SHOE_BROWN)
 
-    save(img, os.path.join(NPC_DIR, "grandma.png"))
+    return img
 
 
+@asset("npcs/student_generic", variant="16x16", size=(16, 16), tags=("characters", "npc"))
 def generate_student_generic():
     """Generic student: White shirt, neutral expression, brown hair."""
     img = make_image()
@@ -1583,64 +1587,42 @@ def generate_student_generic():
     px(img, 9, 15, SHOE_BLACK)
     px(img, 10, 15, SHOE_BLACK)
 
-    save(img, os.path.join(NPC_DIR, "student_generic.png"))
+    return img
 
 
 # =============================================================================
 # MAIN
 # =============================================================================
 
-def main():
-    os.makedirs(ENEMY_DIR, exist_ok=True)
-    os.makedirs(NPC_DIR, exist_ok=True)
-
-    print("=== Generating Enemy Sprites ===")
-    generate_enemy_fear()
-    generate_enemy_sadness()
-    generate_enemy_loneliness()
-
-    print("\n=== Generating NPC Sprites ===")
-    generate_lewis()
-    generate_joan()
-    generate_robert()
-    generate_mike()
-    generate_lucy()
-    generate_teacher()
-    generate_grandma()
-    generate_student_generic()
-
-    print("\n=== All sprites generated successfully! ===")
+def main(argv=None):
+    args = build.parse_args(argv, variants=True)
+    status = build.run(args, sources=[__file__])
+    if status or args.list:
+        return status
+    records = Manifest.for_root(args.root).by_output()
 
-    # Verification
+    # Verification (from the build manifest, no PNG decoding)
     print("\n=== Verification ===")
-    enemies = ["enemy_fear.png", "enemy_sadness.png", "enemy_loneliness.png"]
-    npcs = ["lewis.png", "joan.png", "robert.png", "mike.png",
-            "lucy.png", "teacher.png", "grandma.png", "student_generic.png"]
+    enemies = ["enemy_fear_16x16.png", "enemy_sadness_16x16.png", "enemy_loneliness_16x16.png"]
+    npcs = ["lewis_16x16.png", "joan_16x16.png", "robert_16x16.png", "mike_16x16.png",
+            "lucy_16x16.png", "teacher_16x16.png", "grandma_16x16.png", "student_generic_16x16.png"]
 
     all_ok = True
-    for f in enemies:
-        path = os.path.join(ENEMY_DIR, f)
-        if os.path.exists(path):
-            img = Image.open(path)
-            print(f"  [OK] {f} - {img.size[0]}x{img.size[1]} - mode: {img.mode}")
-        else:
-            print(f"  [FAIL] {f} - NOT FOUND")
-            all_ok = False
-
-    for f in npcs:
-        path = os.path.join(NPC_DIR, f)
-        if os.path.exists(path):
-            img = Image.open(path)
-            print(f"  [OK] {f} - {img.size[0]}x{img.size[1]} - mode: {img.mode}")
-        else:
-            print(f"  [FAIL] {f} - NOT FOUND")
-            all_ok = False
+    for folder, names in (("enemies", enemies), ("npcs", npcs)):
+        for f in names:
+            rec = records.get("assets/sprites/%s/%s" % (folder, f))
+            if rec and os.path.exists(os.path.join(args.root, rec["output"])):
+                print(f"  [OK] {f} - {rec['width']}x{rec['height']} - mode: {rec['mode']}")
+            else:
+                print(f"  [FAIL] {f} - NOT FOUND")
+                all_ok = False
 
     if all_ok:
         print("\nAll 11 sprites verified successfully!")
     else:
         print("\nSome sprites failed to generate!")
+    return 0 if all_ok else 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Palette-swap variants for "Versos de Heroe".
+Cars and look-alike classmates are one hand-drawn base sheet recoloured:
+each base lists its colour roles (ramps, dark to light) and each variant the
+roles it changes (pixelkit.recolor). The base sheets are read from the
+build root and their content is part of every variant's fingerprint. A new
+crowd NPC or car is one more line in VARIANTS, no new drawing.
+
+For swapping at runtime, each base is also written as an 8-bit index texture
+(assets/sprites/palettes/<base>_index.png) and each sheet, base included, as
+a palette strip <sheet>_palette.png with a ShaderMaterial <sheet>_palette.tres
+for the palette_swap.gdshader lookup. Instances of every variant then share
+the one index texture and differ only in a few-pixel palette.
+"""
+
+import os
+import sys
+
+from pixelkit import build, godot, palette, recolor, registry
+from pixelkit.registry import asset
+
+PALETTE_DIR = "assets/sprites/palettes"
+SHADER = PALETTE_DIR + "/palette_swap.gdshader"
+
+# ---------------------------------------------------------------------------
+# Bases: hand-drawn sheet and its colour roles
+# ---------------------------------------------------------------------------
+BASES = {
+    "car": ("assets/sprites/vehicles/car_red_spritesheet.png", {
+        "body": ("#9b1916", "#b4231e", "#d2372d", "#eb5041"),
+    }),
+    "classmate": ("assets/sprites/npcs/classmates/ahmed_spritesheet.png", {
+        "hair": ("#08060a", "#0c0a10", "#120f16", "#18141c", "#201c23", "#2a262d"),
+        "skin": ("#48301e", "#5a3c26", "#6c482d", "#7d5537", "#916644", "#a57852"),
+        "eyes": ("#16120c", "#231c14", "#372d23"),
+        "mouth": ("#8c4b36", "#a05f48"),
+        "shirt": ("#0e3a12", "#144b1a", "#1c5f23", "#26762d", "#328c3a", "#41a54b"),
+        "trousers": ("#161626", "#202034", "#2a2a44", "#373755"),
+        "shoes": ("#1c1a18", "#2a2826", "#3a3734"),
+    }),
+}
+
+# ---------------------------------------------------------------------------
+# Variants: asset name -> (base, {role: new ramp})
+# ---------------------------------------------------------------------------
+VARIANTS = {
+    "vehicles/car_blue_spritesheet": ("car", {
+        "body": ("#16327d", "#1e419b", "#2d5ab9", "#4173d2"),
+    }),
+    "vehicles/car_white_spritesheet": ("car", {
+        "body": ("#aaafb6", "#c3c8cd", "#d7dce1", "#ebeef0"),
+    }),
+    "vehicles/car_black_spritesheet": ("car", {
+        "body": ("#16161c", "#1e1e23", "#303037", "#44444b"),
+    }),
+    "npcs/classmates/carlos_spritesheet": ("classmate", {
+        "hair": ("#2a1e12", "#3e2d1c", "#553e26", "#6c4e30", "#82623c", "#9b7348"),
+        "skin": ("#aa805f", "#c39673", "#d7aa84", "#e8bc94", "#f5cda5", "#ffdcb6"),
+        "eyes": ("#3c2312", "#5a371c", "#785028"),
+        "mouth": ("#af6e5c", "#c3826e"),
+        "shirt": ("#878480", "#9b9894", "#afaca8", "#c3c0bc", "#d7d4d0", "#ebe8e4"),
+        "trousers": ("#1a1a30", "#24243e", "#30304e", "#3c3c5f"),
+        "shoes": ("#201e1c", "#302d2a", "#413e3a"),
+    }),
+    "npcs/classmates/wei_spritesheet": ("classmate", {
+        "hair": ("#06050a", "#0a080e", "#0f0c12", "#141219", "#1c1920", "#26232a"),
+        "skin": ("#76583e", "#8c694b", "#a07a58", "#b48c66", "#c69e76", "#d7af87"),
+        "mouth": ("#af6e5c", "#c3826e"),
+        "shirt": ("#7a6612", "#967d19", "#af9420", "#c8a828", "#e1be32", "#f5d241"),
+        "trousers": ("#18182a", "#222238", "#2d2d48", "#3a3a5a"),
+        "shoes": ("#1e1c1a", "#2c2a28", "#3c3a37"),
+    }),
+}
+
+
+def load_indexed(path, root):
+    """The base sheet at path under root as an IndexedCanvas."""
+    indexed = palette.to_indexed(build.load_static(path, root))
+    if indexed is None:
+        raise ValueError("%s has more than %d colours" % (path, palette.MAX_COLORS))
+    return indexed
+
+
+def sheet_stem(path):
+    return os.path.basename(path).replace("_spritesheet.png", "")
+
+
+def register_variant(name, base, ramps):
+    path, roles = BASES[base]
+    table = recolor.ramp_table(roles, ramps)
+
+    @asset(name, tags=("recolor", base), static=(path,))
+    def make_variant(root):
+        return recolor.recolor(load_indexed(path, root), table)
+
+    register_palette(base, sheet_stem(registry.default_output(name)), path, table)
+    return make_variant
+
+
+def register_base(base):
+    path, _ = BASES[base]
+
+    @asset("palettes/%s_index" % base, tags=("recolor", "palette", base), static=(path,))
+    def make_index(root):
+        return recolor.index_map(load_indexed(path, root))
+
+    register_palette(base, sheet_stem(path), path, {})
+    return make_index
+
+
+def register_palette(base, stem, path, table):
+    name = "palettes/%s_palette" % stem
+
+    @asset(name, tags=("recolor", "palette", base), static=(path,))
+    def make_palette(root):
+        return recolor.palette_strip(recolor.recolor(load_indexed(path, root), table))
+
+    @asset(name + "_material", output="%s/%s_palette.tres" % (PALETTE_DIR, stem),
+           tags=("recolor", "palette", base))
+    def make_material():
+        return godot.palette_material_tres(godot.res_path(SHADER),
+                                           godot.res_path(registry.default_output(name)),
+                                           godot.res_path(registry.default_output("palettes/%s_index" % base)))
+    return make_palette
+
+
+@asset("palettes/palette_swap", output=SHADER, tags=("recolor", "palette"))
+def make_palette_swap_shader():
+    return godot.PALETTE_SWAP_SHADER
+
+
+for _base in BASES:
+    register_base(_base)
+for _name, (_base, _ramps) in VARIANTS.items():
+    register_variant(_name, _base, _ramps)
+
+
+if __name__ == "__main__":
+    sys.exit(build.main(sys.argv[1:], sources=[__file__]))
@@ -0,0 +1,8 @@
+"""
+pixelkit — shared drawing engine for the "Versos de Heroe" sprite generators.
+"""
+
+from .canvas import FLIP_LEFT_RIGHT, FLIP_TOP_BOTTOM, Canvas, ink
+from .palette import IndexedCanvas
+
+__all__ = ["Canvas", "IndexedCanvas", "ink", "FLIP_LEFT_RIGHT", "FLIP_TOP_BOTTOM"]
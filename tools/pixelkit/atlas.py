@@ -0,0 +1,157 @@
+"""
+Texture atlas packing.
+MaxRects bin packing (best short side fit) into the smallest power-of-two
+texture that holds every sprite. Each sprite is surrounded by `extrude`
+pixels copied from its own edge so filtering and subpixel positions never
+sample a neighbour. Sprites that are exact copies of another are stored once
+(sheets.dedupe) and their keys share its region; mirrors are kept apart,
+since an AtlasTexture cannot flip. Optionally each sprite is first cropped
+to its alpha bounding box, recording where it sat in its original canvas.
+Layouts depend only on the sprites, so the atlas PNG, its JSON index and its
+AtlasTexture resources can be produced separately and always agree.
+"""
+
+import json
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from .canvas import Canvas
+from .sheets import dedupe
+
+
+class MaxRects:
+    """Free-rectangle bin of a fixed size."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.free = [(0, 0, width, height)]
+
+    def insert(self, w, h):
+        """Place a w x h rectangle; return its (x, y) or None if it does not fit."""
+        best = None
+        for fx, fy, fw, fh in self.free:
+            if w <= fw and h <= fh:
+                key = (min(fw - w, fh - h), max(fw - w, fh - h), fy, fx)
+                if best is None or key < best:
+                    best = key
+        if best is None:
+            return None
+        x, y = best[3], best[2]
+        self._split(x, y, w, h)
+        return x, y
+
+    def _split(self, ux, uy, uw, uh):
+        pieces = []
+        for rect in self.free:
+            fx, fy, fw, fh = rect
+            if ux >= fx + fw or ux + uw <= fx or uy >= fy + fh or uy + uh <= fy:
+                pieces.append(rect)
+                continue
+            if ux > fx:
+                pieces.append((fx, fy, ux - fx, fh))
+            if ux + uw < fx + fw:
+                pieces.append((ux + uw, fy, fx + fw - ux - uw, fh))
+            if uy > fy:
+                pieces.append((fx, fy, fw, uy - fy))
+            if uy + uh < fy + fh:
+                pieces.append((fx, uy + uh, fw, fy + fh - uy - uh))
+        self.free = [a for i, a in enumerate(pieces)
+                     if not any(_contains(b, a) and (b != a or j < i) for j, b in enumerate(pieces) if j != i)]
+
+
+def _contains(outer, inner):
+    ox, oy, ow, oh = outer
+    ix, iy, iw, ih = inner
+    return ox <= ix and oy <= iy and ix + iw <= ox + ow and iy + ih <= oy + oh
+
+
+def _pot_sizes(min_w, min_h, area, max_size):
+    """Power-of-two (w, h) candidates, smallest area first, squarer first."""
+    sides = [1 << i for i in range(max_size.bit_length()) if (1 << i) <= max_size]
+    sizes = [(w, h) for w in sides for h in sides
+             if w >= min_w and h >= min_h and w * h >= area]
+    return sorted(sizes, key=lambda s: (s[0] * s[1], abs(s[0] - s[1]), -s[0]))
+
+
+@lru_cache(maxsize=None)
+def _layout(items, extrude, max_size):
+    padded = [(key, w + 2 * extrude, h + 2 * extrude) for key, w, h in items]
+    order = sorted(padded, key=lambda it: (-max(it[1], it[2]), -it[1] * it[2], it[0]))
+    area = sum(w * h for _, w, h in padded)
+    min_w = max(w for _, w, _ in padded)
+    min_h = max(h for _, _, h in padded)
+    for width, height in _pot_sizes(min_w, min_h, area, max_size):
+        bin_ = MaxRects(width, height)
+        regions = {}
+        for key, w, h in order:
+            pos = bin_.insert(w, h)
+            if pos is None:
+                break
+            regions[key] = (pos[0] + extrude, pos[1] + extrude, w - 2 * extrude, h - 2 * extrude)
+        else:
+            return width, height, regions
+    raise ValueError("%d sprites do not fit a %dx%d atlas" % (len(items), max_size, max_size))
+
+
+def layout(sizes, extrude=1, max_size=2048):
+    """Pack {key: (w, h)}; return (width, height, {key: (x, y, w, h)}) of the sprite areas."""
+    items = tuple(sorted((key, w, h) for key, (w, h) in sizes.items()))
+    width, height, regions = _layout(items, extrude, max_size)
+    return width, height, dict(regions)
+
+
+# regions: {key: (x, y, w, h)} for every key; stored: {region: sprite drawn
+# there}; trimmed: {key: (x, y, original w, original h)}, where the region
+# content sits in the original canvas, for the keys trimming shrank
+Packing = namedtuple("Packing", "width height regions stored trimmed")
+
+
+def trim(img):
+    """Crop img to its alpha bounding box; return (sprite, (x, y, original w, original h)).
+
+    A fully transparent image keeps its top-left pixel.
+    """
+    left, top, right, bottom = img.getbbox() or (0, 0, 1, 1)
+    return img.crop((left, top, right, bottom)), (left, top, img.width, img.height)
+
+
+def pack(images, extrude=1, max_size=2048, trimmed=False):
+    """Packing of {key: Canvas} storing duplicate sprites once, optionally trimmed first."""
+    keys = sorted(images)
+    sprites = [images[k] for k in keys]
+    offsets = {}
+    if trimmed:
+        cropped = [trim(img) for img in sprites]
+        sprites = [sprite for sprite, _ in cropped]
+        offsets = {key: placement for key, (sprite, placement) in zip(keys, cropped)
+                   if sprite.size != placement[2:]}
+    unique, refs = dedupe(sprites, mirrors=False)
+    width, height, placed = layout({i: img.size for i, img in enumerate(unique)}, extrude, max_size)
+    regions = {key: placed[i] for key, (i, _) in zip(keys, refs)}
+    stored = {placed[i]: img for i, img in enumerate(unique)}
+    return Packing(width, height, regions, stored, offsets)
+
+
+def compose(images, extrude=1, max_size=2048, trimmed=False):
+    """Pack {key: Canvas} into one Canvas; return (atlas, Packing)."""
+    packing = pack(images, extrude, max_size, trimmed)
+    atlas = Canvas(packing.width, packing.height)
+    for (x, y, w, h), img in packing.stored.items():
+        block = img.pixels
+        if extrude:
+            block = np.pad(block, ((extrude, extrude), (extrude, extrude), (0, 0)), mode="edge")
+        atlas.pixels[y - extrude:y + h + extrude, x - extrude:x + w + extrude] = block
+    return atlas, packing
+
+
+def index_json(texture, size, regions, **fields):
+    """JSON index of an atlas: texture path, size and the region of every sprite.
+
+    Extra keyword fields (e.g. trim placements) are added at the top level.
+    """
+    data = dict(fields, texture=texture, size=list(size),
+                regions={key: list(rect) for key, rect in sorted(regions.items())})
+    return json.dumps(data, indent=1, sort_keys=True) + "\n"
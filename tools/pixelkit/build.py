@@ -0,0 +1,261 @@
+"""
+Build orchestrator for the registered sprite generators.
+Loads the generator scripts, resolves the selected assets and their
+dependencies, renders them in dependency order and writes the PNGs under a
+configurable project root, which is also where hand-made inputs are read.
+Assets whose fingerprint (pixelkit.cache) has not changed since the last
+build are skipped; the rest are rendered in a process pool, one dependency
+wave at a time. Every asset draws from its own RNG
+stream seeded from its name, so the output does not depend on worker count
+or order.
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import output, registry
+from .cache import BuildCache, fingerprint
+from .canvas import Canvas
+from .manifest import Manifest, image_stats, text_stats
+from .palette import as_rgba
+
+# Repository root (tools/pixelkit/../..)
+PROJECT_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+# Generator scripts, relative to PROJECT_ROOT
+GENERATORS = [
+    "tools/generate_sprites.py",
+    "generate_collectibles_ui.py",
+    "assets/sprites/tiles/generate_tiles.py",
+    "assets/sprites/player/generate_sprites.py",
+    "generate_character_sprites.py",
+    "generate_sprites.py",
+    "tools/generate_sprite_frames.py",
+    "tools/generate_atlases.py",
+    "tools/generate_variants.py",
+    "tools/generate_crowd.py",
+]
+
+
+class BuildError(Exception):
+    """Raised when a generator returns something that does not match its registration."""
+
+
+def load_generators(paths):
+    """Import generator scripts by path so their @asset declarations register."""
+    loaded = {entry.source for entry in registry.ASSETS.values()}
+    sources = []
+    for path in paths:
+        path = os.path.abspath(os.path.join(PROJECT_ROOT, path))
+        sources.append(path)
+        if path in loaded:
+            continue
+        rel = os.path.relpath(path, PROJECT_ROOT)
+        module_name = "pixelkit_gen_" + os.path.splitext(rel)[0].replace(os.sep, "_").replace(".", "_")
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        loaded.add(path)
+    return sources
+
+
+def load_static(path, root):
+    """Canvas of a hand-drawn PNG, path relative to the project root of the build."""
+    return Canvas.open(os.path.join(root, path))
+
+
+def check_static(entry, root):
+    """Raise BuildError unless every static input of entry is under root."""
+    for path in entry.static:
+        if not os.path.isfile(os.path.join(root, path)):
+            raise BuildError("%s reads %s, which is not in %s" % (entry.name, path, root))
+
+
+def render(entry, inputs, root=PROJECT_ROOT):
+    """Run one generator and check its result against the registration.
+
+    Dependencies always arrive as RGBA Canvases, even when their generator drew
+    into an IndexedCanvas.
+    """
+    kwargs = {}
+    if entry.takes_rng:
+        kwargs["rng"] = random.Random(entry.seed)
+    if entry.takes_root:
+        kwargs["root"] = root
+    img = entry.func(*[as_rgba(i) for i in inputs], **kwargs)
+    if entry.size is not None and tuple(img.size) != entry.size:
+        raise BuildError("%s rendered %dx%d, registered as %dx%d"
+                         % ((entry.name,) + tuple(img.size) + entry.size))
+    return img
+
+
+def write(entry, img, root):
+    """Save a rendered asset under root unless the file already matches. Returns True if written.
+
+    Generators return a Canvas or IndexedCanvas (saved as PNG) or a str (text
+    resource such as a .tres).
+    """
+    path = os.path.join(root, entry.output)
+    if isinstance(img, str):
+        return output.save_text(img, path)
+    return output.save_png(img, path)
+
+
+def describe(img):
+    return "%d bytes" % len(img.encode("utf-8")) if isinstance(img, str) else "%dx%d" % img.size
+
+
+def waves(assets):
+    """Split dependency-ordered assets into lists that only depend on earlier lists."""
+    depth = {}
+    groups = []
+    for entry in assets:
+        d = max((depth[dep] + 1 for dep in entry.deps), default=0)
+        depth[entry.name] = d
+        if d == len(groups):
+            groups.append([])
+        groups[d].append(entry)
+    return groups
+
+
+def _init_worker(sources):
+    load_generators(sources)
+
+
+def _task(name, inputs, root, save):
+    """Render one asset, and if `save` write it and return its manifest record and timings.
+
+    Runs in a worker process or inline; returns (img, record or None, timings or None).
+    """
+    entry = registry.ASSETS[name]
+    start = time.perf_counter()
+    img = render(entry, inputs, root)
+    if not save:
+        return img, None, None
+    rendered = time.perf_counter()
+    changed = write(entry, img, root)
+    record = text_stats(img) if isinstance(img, str) else image_stats(img)
+    timings = {"render_ms": round((rendered - start) * 1000, 3),
+               "encode_ms": round((time.perf_counter() - rendered) * 1000, 3),
+               "written": changed}
+    return img, record, timings
+
+
+def build(assets, root=PROJECT_ROOT, log=print, cache=None, force=False, jobs=1, manifest=None):
+    """Render `assets` (already in dependency order) and write their outputs under root.
+
+    Hand-made inputs (static) are read from the same root. With a
+    BuildCache, only assets whose fingerprint changed (or whose output is
+    missing) are written, unless `force`; their unchanged dependencies are
+    still rendered in memory when needed as inputs. With jobs > 1 the work is
+    spread over that many processes. Every written (or confirmed unchanged)
+    file is recorded in `manifest` if given. Returns the rendered images by name.
+    """
+    fingerprints = {}
+    stale = set()
+    for entry in assets:
+        check_static(entry, root)
+        fp = fingerprint(entry, [fingerprints[dep] for dep in entry.deps], root)
+        fingerprints[entry.name] = fp
+        if force or cache is None or not cache.is_fresh(entry, fp, root):
+            stale.add(entry.name)
+    needed = set(stale)
+    for entry in reversed(assets):
+        if entry.name in needed:
+            needed.update(entry.deps)
+
+    pool = None
+    if jobs > 1 and len(needed) > 1:
+        sources = list(dict.fromkeys(entry.source for entry in assets))
+        pool = ProcessPoolExecutor(min(jobs, len(needed)), initializer=_init_worker, initargs=(sources,))
+    results = {}
+    written = 0
+    try:
+        for wave in waves(assets):
+            wave = [entry for entry in wave if entry.name in needed]
+            if not wave:
+                continue
+            tasks = [(entry.name, [results[dep] for dep in entry.deps], root,
+                      entry.name in stale and entry.output is not None) for entry in wave]
+            done = pool.map(_task, *zip(*tasks)) if pool else [_task(*task) for task in tasks]
+            for entry, (img, record, timings) in zip(wave, done):
+                results[entry.name] = img
+                if record is not None:
+                    written += timings["written"]
+                    log("  %-32s %s %s (%s, %.1f ms)"
+                        % (entry.name, "->" if timings["written"] else "==", entry.output,
+                           describe(img), timings["render_ms"] + timings["encode_ms"]))
+                    if manifest is not None:
+                        manifest.record(entry, record, timings)
+                if cache is not None and entry.name in stale:
+                    cache.record(entry, fingerprints[entry.name])
+    finally:
+        if pool:
+            pool.shutdown()
+    if manifest is not None:
+        manifest.save()
+    if cache is not None:
+        cache.save()
+        log("  %d rebuilt (%d files written), %d up to date"
+            % (len(stale), written, len(assets) - len(stale)))
+    return results
+
+
+def parse_args(argv=None, **defaults):
+    """Parse build options; keyword arguments override option defaults (e.g. variants=True)."""
+    parser = argparse.ArgumentParser(description="Build generated sprites.")
+    parser.add_argument("--root", default=PROJECT_ROOT,
+                        help="project root to read hand-made inputs from and write assets into "
+                             "(default: this repository)")
+    parser.add_argument("--only", action="append", default=[], metavar="GLOB",
+                        help="build assets whose name matches GLOB, e.g. 'tiles/floor_*' (repeatable)")
+    parser.add_argument("--tag", action="append", default=[],
+                        help="build assets carrying TAG, e.g. 'ui' or 'floor' (repeatable)")
+    parser.add_argument("--variants", action="store_true",
+                        help="also build declared variants (e.g. the 16x16 enemies and flat collectibles)")
+    parser.add_argument("--list", action="store_true", help="list the selected assets and exit")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild every selected asset, ignoring the build cache")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: one per CPU; 1 renders in this process)")
+    parser.set_defaults(**defaults)
+    return parser.parse_args(argv)
+
+
+def run(args, sources=GENERATORS):
+    """Build the assets selected by parsed `args` from the given generator scripts."""
+    sources = load_generators(sources)
+    names = registry.select(args.only, args.tag, sources, args.variants)
+    if not names:
+        print("No assets match the selection.", file=sys.stderr)
+        return 1
+    assets = registry.resolve(names)
+    if args.list:
+        for entry in assets:
+            print("%-32s %-52s %s" % (entry.name, entry.output or "(intermediate)", ",".join(entry.tags)))
+        return 0
+
+    print("Building %d assets into %s" % (len(assets), args.root))
+    start = time.perf_counter()
+    try:
+        build(assets, args.root, cache=BuildCache.for_root(args.root), force=args.force, jobs=args.jobs,
+              manifest=Manifest.for_root(args.root))
+    except BuildError as exc:
+        print("Build failed: %s" % exc, file=sys.stderr)
+        return 1
+    print("Done in %.0f ms." % ((time.perf_counter() - start) * 1000))
+    return 0
+
+
+def main(argv=None, sources=GENERATORS, **defaults):
+    return run(parse_args(argv, **defaults), sources)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
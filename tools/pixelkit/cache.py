@@ -0,0 +1,183 @@
+"""
+Incremental build cache.
+Each asset gets a fingerprint built from its generator's bytecode (and the
+bytecode of every helper it calls), the module-level constants it reads (the
+palettes), its registration (output path, size, seed), the content of the
+hand-made files it reads from the build root and the fingerprints of its
+dependencies. Assets whose fingerprint matches the last build are skipped.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import types
+
+from .output import write_if_changed
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_PLAIN = (int, float, str, bytes, bool, type(None))
+
+
+def _stable(value, depth=0, reached=None):
+    """Deterministic text for plain constant data, or None for anything else.
+
+    With a `reached` list, functions inside the data (e.g. a table of part
+    painters) are appended to it and stand in as their qualified name.
+    """
+    if isinstance(value, _PLAIN):
+        return repr(value)
+    if reached is not None and isinstance(value, types.FunctionType):
+        reached.append(value)
+        return "<function %s>" % value.__qualname__
+    if depth > 8:
+        return None
+    if isinstance(value, (tuple, list, frozenset, set)):
+        parts = [_stable(v, depth + 1, reached) for v in value]
+        if None in parts:
+            return None
+        if isinstance(value, (set, frozenset)):
+            parts.sort()
+        return "%s(%s)" % (type(value).__name__, ",".join(parts))
+    if isinstance(value, dict):
+        parts = []
+        for k, v in value.items():
+            ks, vs = _stable(k, depth + 1, reached), _stable(v, depth + 1, reached)
+            if ks is None or vs is None:
+                return None
+            parts.append(ks + ":" + vs)
+        return "dict(%s)" % ",".join(sorted(parts))
+    return None
+
+
+def _hash_code(code, h):
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(const, h)
+        else:
+            h.update((_stable(const) or type(const).__name__).encode())
+
+
+def _global_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def code_digest(func):
+    """Hash func's bytecode plus every Python function and plain constant it reaches via globals.
+
+    Line numbers and comments are not part of the bytecode, so editing them
+    does not invalidate anything.
+    """
+    h = hashlib.sha256()
+    seen = set()
+    stack = [func]
+    while stack:
+        fn = stack.pop()
+        if id(fn) in seen:
+            continue
+        seen.add(id(fn))
+        code = fn.__code__
+        h.update((fn.__qualname__ + "\0").encode())
+        _hash_code(code, h)
+        if fn.__defaults__:
+            h.update((_stable(fn.__defaults__) or "").encode())
+        for cell in fn.__closure__ or ():
+            value = cell.cell_contents
+            if isinstance(value, types.FunctionType):
+                stack.append(value)
+            else:
+                h.update((_stable(value, reached=stack) or "").encode())
+        if os.path.dirname(os.path.abspath(code.co_filename)) == PACKAGE_DIR:
+            # pixelkit itself is covered by library_digest()
+            continue
+        scope = fn.__globals__
+        for name in sorted(_global_names(code)):
+            if name not in scope:
+                continue
+            value = scope[name]
+            # memoized helpers (functools.lru_cache) are hashed as the function they wrap
+            value = getattr(value, "__wrapped__", value)
+            if isinstance(value, types.FunctionType):
+                stack.append(value)
+            else:
+                text = _stable(value, reached=stack)
+                if text is not None:
+                    h.update(("%s=%s\0" % (name, text)).encode())
+    return h.hexdigest()
+
+
+_LIBRARY_DIGEST = None
+
+
+def library_digest():
+    """Hash of the pixelkit sources and Python version; any change invalidates every asset."""
+    global _LIBRARY_DIGEST
+    if _LIBRARY_DIGEST is None:
+        h = hashlib.sha256(sys.version.encode())
+        for name in sorted(os.listdir(PACKAGE_DIR)):
+            if name.endswith(".py"):
+                with open(os.path.join(PACKAGE_DIR, name), "rb") as f:
+                    h.update(name.encode() + b"\0" + f.read())
+        _LIBRARY_DIGEST = h.hexdigest()
+    return _LIBRARY_DIGEST
+
+
+def file_digest(path):
+    """sha256 of a file's bytes."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def fingerprint(entry, dep_fingerprints=(), root=None):
+    """Fingerprint of one asset given the fingerprints of its dependencies.
+
+    The entry's static inputs are read under root.
+    """
+    h = hashlib.sha256()
+    h.update(library_digest().encode())
+    h.update(code_digest(entry.func).encode())
+    h.update(repr((entry.name, entry.output, entry.size, getattr(entry, "seed", None))).encode())
+    for path in getattr(entry, "static", ()):
+        h.update(("%s=%s\0" % (path, file_digest(os.path.join(root, path)))).encode())
+    for dep in dep_fingerprints:
+        h.update(dep.encode())
+    return h.hexdigest()
+
+
+class BuildCache:
+    """Fingerprints of the last successful build, stored as JSON under the project root."""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.entries = json.load(f).get("assets", {})
+            except (OSError, ValueError):
+                self.entries = {}
+
+    @classmethod
+    def for_root(cls, root):
+        return cls(os.path.join(root, ".pixelkit", "build_cache.json"))
+
+    def is_fresh(self, entry, fp, root):
+        """True when entry was last built with fingerprint fp and its output is still on disk."""
+        cached = self.entries.get(entry.name)
+        if not cached or cached.get("fingerprint") != fp:
+            return False
+        return entry.output is None or os.path.exists(os.path.join(root, entry.output))
+
+    def record(self, entry, fp):
+        self.entries[entry.name] = {"fingerprint": fp, "output": entry.output}
+
+    def save(self):
+        data = json.dumps({"assets": self.entries}, indent=1, sort_keys=True) + "\n"
+        write_if_changed(self.path, data.encode("utf-8"))
@@ -0,0 +1,192 @@
+"""
+Array-backed RGBA canvas used by every sprite generator.
+Pixels live in one contiguous bytearray (4 bytes per pixel, row-major) with a
+NumPy view on top for region operations. The canvas only becomes a PIL image
+once, when it is saved.
+"""
+
+import numpy as np
+from PIL import Image
+
+FLIP_LEFT_RIGHT = Image.FLIP_LEFT_RIGHT
+FLIP_TOP_BOTTOM = Image.FLIP_TOP_BOTTOM
+
+_INK_CACHE = {}
+
+
+def ink(color):
+    """Return the 4-byte RGBA encoding of a hex string or 3/4-tuple color."""
+    try:
+        return _INK_CACHE[color]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable (list) colors are converted every time
+        return _encode(color)
+    data = _INK_CACHE[color] = _encode(color)
+    return data
+
+
+def _encode(color):
+    if isinstance(color, str):
+        h = color.lstrip("#")
+        color = tuple(int(h[i:i + 2], 16) for i in range(0, len(h), 2))
+    if len(color) == 3:
+        color = tuple(color) + (255,)
+    return bytes(color)
+
+
+def alpha_bbox(pixels):
+    """(left, top, right, bottom) of the pixels with alpha > 0 in an (h, w, 4) array, or None."""
+    alpha = pixels[..., 3]
+    cols = np.flatnonzero(alpha.any(axis=0))
+    if not len(cols):
+        return None
+    rows = np.flatnonzero(alpha.any(axis=1))
+    return (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
+
+
+class Canvas:
+    """RGBA pixel buffer exposing the subset of the PIL image API the generators use."""
+
+    mode = "RGBA"
+    wrap = False  # tiling.WrapCanvas draws modulo its size instead of clipping
+
+    def __init__(self, width, height, color=(0, 0, 0, 0)):
+        self.width = width
+        self.height = height
+        self.buf = bytearray(ink(color) * (width * height))
+        self.pixels = np.frombuffer(self.buf, dtype=np.uint8).reshape(height, width, 4)
+
+    @property
+    def size(self):
+        return (self.width, self.height)
+
+    # ------------------------------------------------------------------
+    # Construction / conversion
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_array(cls, array):
+        """Wrap a copy of an (h, w, 4) uint8 array."""
+        h, w = array.shape[:2]
+        canvas = cls(w, h)
+        canvas.pixels[...] = array
+        return canvas
+
+    @classmethod
+    def from_bytes(cls, width, height, data):
+        """Wrap a copy of raw RGBA bytes."""
+        canvas = cls(width, height)
+        canvas.buf[:] = data
+        return canvas
+
+    @classmethod
+    def from_image(cls, img):
+        """Copy a PIL image into a new canvas."""
+        img = img.convert("RGBA")
+        return cls.from_bytes(img.width, img.height, img.tobytes())
+
+    @classmethod
+    def open(cls, path):
+        """Load a PNG (e.g. a hand-drawn sheet) into a new canvas."""
+        with Image.open(path) as img:
+            return cls.from_image(img)
+
+    @classmethod
+    def from_grid(cls, width, height, rows, background=(0, 0, 0, 0)):
+        """Build a canvas from a 2D list of colors; short rows leave the background."""
+        canvas = cls(width, height, background)
+        stride = width * 4
+        for y, row in enumerate(rows[:height]):
+            data = b"".join(ink(c) for c in row[:width])
+            canvas.buf[y * stride:y * stride + len(data)] = data
+        return canvas
+
+    def to_image(self):
+        """Encode the buffer as a PIL image (the only PIL conversion per asset)."""
+        return Image.frombytes("RGBA", self.size, bytes(self.buf))
+
+    def tobytes(self):
+        return bytes(self.buf)
+
+    def save(self, path):
+        self.to_image().save(path)
+
+    def copy(self):
+        return Canvas.from_array(self.pixels)
+
+    def __reduce__(self):
+        # pickle the buffer only; the numpy view is rebuilt on load
+        return (Canvas.from_bytes, (self.width, self.height, bytes(self.buf)))
+
+    def transpose(self, method):
+        """Mirror the canvas like PIL's Image.transpose (flips only)."""
+        if method == FLIP_LEFT_RIGHT:
+            return Canvas.from_array(self.pixels[:, ::-1])
+        if method == FLIP_TOP_BOTTOM:
+            return Canvas.from_array(self.pixels[::-1])
+        raise ValueError("unsupported transpose method: %r" % (method,))
+
+    def getbbox(self):
+        """(left, top, right, bottom) of the non-transparent pixels, or None, like PIL's getbbox."""
+        return alpha_bbox(self.pixels)
+
+    def crop(self, box):
+        """Copy of the (left, top, right, bottom) box, which must lie inside the canvas."""
+        left, top, right, bottom = box
+        return Canvas.from_array(self.pixels[top:bottom, left:right])
+
+    # ------------------------------------------------------------------
+    # PIL-compatible pixel access (raises on out-of-range like PIL)
+    # ------------------------------------------------------------------
+    def _offset(self, xy):
+        x, y = xy
+        if x < 0:
+            x += self.width
+        if y < 0:
+            y += self.height
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError("image index out of range")
+        return (y * self.width + x) * 4
+
+    def putpixel(self, xy, color):
+        o = self._offset(xy)
+        self.buf[o:o + 4] = ink(color)
+
+    def getpixel(self, xy):
+        o = self._offset(xy)
+        return tuple(self.buf[o:o + 4])
+
+    # ------------------------------------------------------------------
+    # Clipped drawing helpers (silently ignore pixels off the canvas)
+    # ------------------------------------------------------------------
+    def put(self, x, y, color):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            o = (y * self.width + x) * 4
+            self.buf[o:o + 4] = ink(color)
+
+    def get(self, x, y, default=None):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            o = (y * self.width + x) * 4
+            return tuple(self.buf[o:o + 4])
+        return default
+
+    def fill_rect(self, x0, y0, w, h, color):
+        """Fill a w x h rectangle whose top-left corner is (x0, y0)."""
+        x1 = min(x0 + w, self.width)
+        y1 = min(y0 + h, self.height)
+        x0 = max(x0, 0)
+        y0 = max(y0, 0)
+        if x0 < x1 and y0 < y1:
+            self.pixels[y0:y1, x0:x1] = np.frombuffer(ink(color), dtype=np.uint8)
+
+    def hline(self, x0, x1, y, color):
+        """Draw a horizontal line from x0 to x1 inclusive."""
+        self.fill_rect(x0, y, x1 - x0 + 1, 1, color)
+
+    def vline(self, x, y0, y1, color):
+        """Draw a vertical line from y0 to y1 inclusive."""
+        self.fill_rect(x, y0, 1, y1 - y0 + 1, color)
+
+    def fill(self, color):
+        self.buf[:] = ink(color) * (self.width * self.height)
@@ -0,0 +1,160 @@
+"""
+Crowd synthesis.
+Background characters are assembled from a part library instead of being
+drawn one by one. Each slot (legs, shoes, torso, face, hair) has a few
+styles, drawn once as text grids (pixelkit.grids) in a fixed template
+palette whose colours are the roles (hair shadow, skin, shirt highlight...).
+A character is one style per slot plus a palette set: for each role group,
+the ramp replacing the template ramp (the same role scheme as
+pixelkit.recolor).
+
+Part grids are laid out as rows of cells for the down, up and left views;
+the right view mirrors the left. A part drawn in one column is used for
+every pose, otherwise the columns are the poses (idle, walk 1, walk 2).
+Parts load once into uint8 role maps of the whole walk sheet, so a batch of
+N characters is one np.where per slot for each distinct combination of
+styles and one colour-table gather per character into a single
+(N, h, w, 4) buffer.
+"""
+
+import os
+from collections import namedtuple
+
+import numpy as np
+
+from . import grids, recolor
+from .canvas import Canvas, ink
+from .primitives import generator, palette_array
+
+VIEWS = ("down", "up", "left")
+POSES = 3
+
+# slots: slot names in drawing order; styles: {slot: style names}; parts:
+# {slot: uint8 (styles, h, w) role maps}; roles: {group: template ramp};
+# template: (roles, 4) colours, role 0 transparent; cell: frame size
+Library = namedtuple("Library", "slots styles parts roles template cell")
+
+
+def load_library(paths, slots, roles, cell=(16, 24), cache_dir=None):
+    """Library of the part grids at paths, named <slot>_<style>.grid.
+
+    slots lists the slots bottom layer first; roles maps each colour group to
+    its template ramp, dark to light. cache_dir is passed to grids.load.
+    """
+    template = [ink((0, 0, 0, 0))] + [ink(c) for ramp in roles.values() for c in ramp]
+    ids = {color: i for i, color in enumerate(template)}
+    styles = {slot: [] for slot in slots}
+    maps = {slot: [] for slot in slots}
+    for path in sorted(paths):
+        slot, style = os.path.basename(path)[:-len(".grid")].split("_", 1)
+        if slot not in styles:
+            raise grids.GridError("%s: unknown slot %r (slots are %s)" % (path, slot, ", ".join(slots)))
+        img = grids.load(path, cache_dir)
+        try:
+            lut = np.array([ids[entry] for entry in img.palette], dtype=np.uint8)
+        except KeyError as exc:
+            raise grids.GridError("%s: #%s is not a template colour" % (path, exc.args[0].hex())) from None
+        styles[slot].append(style)
+        maps[slot].append(_sheet(lut[img.pixels], cell, path))
+    for slot in slots:
+        if not styles[slot]:
+            raise grids.GridError("no parts for slot %r" % slot)
+    return Library(tuple(slots), {slot: tuple(names) for slot, names in styles.items()},
+                   {slot: np.stack(parts) for slot, parts in maps.items()},
+                   dict(roles), palette_array(template), cell)
+
+
+def _sheet(role_map, cell, name):
+    """Walk sheet role map (rows down, up, left, right x POSES columns) of a part grid."""
+    cw, ch = cell
+    h, w = role_map.shape
+    if h != len(VIEWS) * ch or w not in (cw, POSES * cw):
+        raise grids.GridError("%s: %dx%d is not %d rows of 1 or %d cells of %dx%d"
+                              % (name, w, h, len(VIEWS), POSES, cw, ch))
+    if w == cw:
+        role_map = np.tile(role_map, (1, POSES))
+    left = role_map[2 * ch:]
+    right = left.reshape(ch, POSES, cw)[:, :, ::-1].reshape(ch, POSES * cw)
+    return np.concatenate([role_map, right])
+
+
+def palette_table(library, ramps):
+    """(roles, 4) colour table: the template with each {group: ramp} swapped in."""
+    table = library.template.copy()
+    row = {bytes(color): i for i, color in enumerate(table)}
+    for base, color in recolor.ramp_table(library.roles, ramps).items():
+        table[row[ink(base)]] = np.frombuffer(ink(color), dtype=np.uint8)
+    return table
+
+
+def encode(library, description, palette_sets):
+    """(picks, table) of one character.
+
+    description maps every slot to a style name and "colors" to
+    {group: palette set name}; groups left out keep the template ramp.
+    """
+    picks = [library.styles[slot].index(description[slot]) for slot in library.slots]
+    colors = description.get("colors", {})
+    table = palette_table(library, {group: palette_sets[group][name] for group, name in colors.items()})
+    return np.array(picks), table
+
+
+def synthesize(library, picks, tables):
+    """(N, h, w, 4) uint8 walk sheets of N characters, in one buffer.
+
+    picks is (N, slots) style indices, tables the (N, roles, 4) colour tables.
+    Each distinct combination of styles is layered once; its characters then
+    differ only in the colour table gathered through its role map.
+    """
+    picks = np.asarray(picks)
+    combos, which = np.unique(picks, axis=0, return_inverse=True)
+    roles = library.parts[library.slots[0]][combos[:, 0]]
+    for i, slot in enumerate(library.slots[1:], 1):
+        layer = library.parts[slot][combos[:, i]]
+        roles = np.where(layer > 0, layer, roles)
+    words = np.ascontiguousarray(tables, dtype=np.uint8).view(np.uint32)[..., 0]
+    out = np.empty((len(picks),) + roles.shape[1:], dtype=np.uint32)
+    which = which.ravel()
+    for combo, role_map in enumerate(roles):
+        members = np.flatnonzero(which == combo)
+        out[members] = words[members][:, role_map]
+    return out.view(np.uint8).reshape(out.shape + (4,))
+
+
+def sheet(library, description, palette_sets):
+    """Canvas of one character's walk sheet."""
+    picks, table = encode(library, description, palette_sets)
+    return Canvas.from_array(synthesize(library, picks[None], table[None])[0])
+
+
+def random_batch(library, palette_sets, n, rng):
+    """(picks, tables) of n distinct random characters, for synthesize.
+
+    Every style and every palette set of each group is equally likely;
+    rng is a random.Random (or the random module).
+    """
+    groups = list(palette_sets)
+    radix = [len(library.styles[slot]) for slot in library.slots] + [len(palette_sets[g]) for g in groups]
+    total = int(np.prod(radix, dtype=object))
+    if n > total:
+        raise ValueError("only %d distinct characters in this library, %d asked" % (total, n))
+    draw = generator(rng)
+    codes = np.empty(0, dtype=np.int64)
+    while len(codes) < n:
+        codes = np.concatenate([codes, draw.integers(0, total, n - len(codes), dtype=np.int64)])
+        _, first = np.unique(codes, return_index=True)
+        codes = codes[np.sort(first)]
+    digits = np.empty((n, len(radix)), dtype=np.int64)
+    for i, base in enumerate(radix):
+        digits[:, i] = codes % base
+        codes = codes // base
+    picks = digits[:, :len(library.slots)]
+    tables = np.repeat(library.template[None], n, axis=0)
+    row = {bytes(color): i for i, color in enumerate(library.template)}
+    for i, group in enumerate(groups):
+        rows = [row[ink(c)] for c in library.roles[group]]
+        for ramp in palette_sets[group].values():
+            recolor.ramp_table(library.roles, {group: ramp})  # checks the group and the ramp length
+        options = np.stack([palette_array(ramp) for ramp in palette_sets[group].values()])
+        tables[:, rows] = options[digits[:, len(library.slots) + i]]
+    return picks, tables
@@ -0,0 +1,172 @@
+"""
+Godot resource export.
+Writes SpriteFrames .tres files (text resources, format 3) whose frames are
+AtlasTexture regions of a sheet, so scenes load one shared resource instead
+of building the atlas graph in GDScript for every instance, and standalone
+AtlasTexture resources for sprites packed into an atlas, plus the
+palette-swap shader and its per-palette ShaderMaterials, and TileSets of
+tile strips with weighted alternative tiles.
+"""
+
+DIRECTIONS = ("down", "up", "left", "right")
+
+# canvas_item shader for index textures: the red channel holds the palette
+# index (gray level i = index i), `palette` is the Nx1 strip of colours
+PALETTE_SWAP_SHADER = """shader_type canvas_item;
+
+uniform sampler2D palette : filter_nearest;
+
+void fragment() {
+	int index = int(round(texture(TEXTURE, UV).r * 255.0));
+	COLOR = texelFetch(palette, ivec2(index, 0), 0);
+}
+"""
+
+
+def res_path(output):
+    """res:// path of a project-relative output."""
+    return "res://" + output.replace("\\", "/")
+
+
+def four_way(cols, cycles):
+    """Animations for a sheet with one row per direction (down, up, left, right).
+
+    cycles maps an animation prefix to (column sequence, fps), e.g.
+    {"idle": ([0], 8), "walk": ([0, 1, 0, 2], 8)} gives idle_down, walk_down,
+    idle_up, ... with frames as row-major region indices.
+    """
+    animations = []
+    for row, direction in enumerate(DIRECTIONS):
+        for prefix, (sequence, speed) in cycles.items():
+            animations.append({
+                "name": "%s_%s" % (prefix, direction),
+                "speed": speed,
+                "loop": True,
+                "frames": [row * cols + col for col in sequence],
+            })
+    return animations
+
+
+def _num(value):
+    return "%d" % value if float(value).is_integer() else repr(float(value))
+
+
+def _margin(region, placement):
+    """AtlasTexture margin giving a trimmed region back its original size and offset."""
+    x, y, ow, oh = placement
+    return "margin = Rect2(%s)" % ", ".join(_num(v) for v in (x, y, ow - region[2], oh - region[3]))
+
+
+def sprite_frames_tres(texture, regions, animations, filter_clip=True, trims=None):
+    """Text of a SpriteFrames resource.
+
+    texture is a res:// path, regions a list of (x, y, w, h) and animations a
+    list of {"name", "speed", "loop", "frames": [region index, ...]}. Only the
+    regions some animation uses get an AtlasTexture. Animations with a true
+    "flip_h" (mirrors of stored frames, see sheets.remap) are listed in the
+    resource's flip_h metadata; the sprite sets flip_h while playing them.
+    trims maps a region index to the (x, y, w, h) placement of a trimmed
+    region inside its full frame (see sheets.trim_regions).
+    """
+    trims = trims or {}
+    used = sorted({i for anim in animations for i in anim["frames"]})
+    ids = {i: "AtlasTexture_%d" % i for i in used}
+    out = ['[gd_resource type="SpriteFrames" load_steps=%d format=3]' % (len(used) + 2), ""]
+    out += ['[ext_resource type="Texture2D" path="%s" id="1_sheet"]' % texture, ""]
+    for i in used:
+        out += ['[sub_resource type="AtlasTexture" id="%s"]' % ids[i],
+                'atlas = ExtResource("1_sheet")',
+                "region = Rect2(%s)" % ", ".join(_num(v) for v in regions[i])]
+        if i in trims:
+            out.append(_margin(regions[i], trims[i]))
+        if filter_clip:
+            out.append("filter_clip = true")
+        out.append("")
+    blocks = []
+    for anim in animations:
+        frames = ", ".join('{\n"duration": 1.0,\n"texture": SubResource("%s")\n}' % ids[i]
+                           for i in anim["frames"])
+        blocks.append('{\n"frames": [%s],\n"loop": %s,\n"name": &"%s",\n"speed": %s\n}'
+                      % (frames, "true" if anim.get("loop", True) else "false", anim["name"],
+                         repr(float(anim["speed"]))))
+    out += ["[resource]", "animations = [%s]" % ", ".join(blocks)]
+    flipped = [anim["name"] for anim in animations if anim.get("flip_h")]
+    if flipped:
+        out.append("metadata/flip_h = PackedStringArray(%s)" % ", ".join('"%s"' % n for n in flipped))
+    out.append("")
+    return "\n".join(out)
+
+
+def atlas_texture_tres(texture, region, filter_clip=True, trim=None):
+    """Text of a standalone AtlasTexture resource for one region of texture.
+
+    trim is the (x, y, w, h) placement of a trimmed sprite in its original
+    canvas, restored through the margin.
+    """
+    out = ['[gd_resource type="AtlasTexture" load_steps=2 format=3]', "",
+           '[ext_resource type="Texture2D" path="%s" id="1_atlas"]' % texture, "",
+           "[resource]",
+           'atlas = ExtResource("1_atlas")',
+           "region = Rect2(%s)" % ", ".join(_num(v) for v in region)]
+    if trim:
+        out.append(_margin(region, trim))
+    if filter_clip:
+        out.append("filter_clip = true")
+    out.append("")
+    return "\n".join(out)
+
+
+def palette_material_tres(shader, palette, index_texture):
+    """Text of a ShaderMaterial binding a palette strip to the palette-swap shader.
+
+    The index texture the palette applies to is kept as metadata/index_texture,
+    so a node can set its texture and material from this one resource.
+    """
+    return "\n".join([
+        '[gd_resource type="ShaderMaterial" load_steps=4 format=3]', "",
+        '[ext_resource type="Shader" path="%s" id="1_shader"]' % shader,
+        '[ext_resource type="Texture2D" path="%s" id="2_palette"]' % palette,
+        '[ext_resource type="Texture2D" path="%s" id="3_index"]' % index_texture, "",
+        "[resource]",
+        'shader = ExtResource("1_shader")',
+        'shader_parameter/palette = ExtResource("2_palette")',
+        'metadata/index_texture = ExtResource("3_index")',
+        ""])
+
+
+def tileset_tres(texture, tile_size, sources):
+    """Text of a TileSet whose atlas sources are strips of one texture.
+
+    sources is a list of (name, origin, tiles): origin is the (x, y) pixel
+    offset of the strip in texture and tiles has one entry per column, a
+    list of (orientation, probability) alternatives where orientation is a
+    (flip_h, flip_v, transpose) triple. The first alternative of each tile
+    is its base tile and must not be flipped. The source ids follow the list
+    and each source is named, so a script finds it by resource_name.
+    """
+    w, h = tile_size
+    out = ['[gd_resource type="TileSet" load_steps=%d format=3]' % (len(sources) + 2), "",
+           '[ext_resource type="Texture2D" path="%s" id="1_texture"]' % texture, ""]
+    for i, (name, (x, y), tiles) in enumerate(sources):
+        out += ['[sub_resource type="TileSetAtlasSource" id="TileSetAtlasSource_%d"]' % i,
+                'resource_name = "%s"' % name,
+                'texture = ExtResource("1_texture")',
+                "margins = Vector2i(%d, %d)" % (x, y),
+                "texture_region_size = Vector2i(%d, %d)" % (w, h)]
+        for col, alternatives in enumerate(tiles):
+            if any(alternatives[0][0]):
+                raise ValueError("%s tile %d: the base alternative cannot be flipped" % (name, col))
+            for alt, ((flip_h, flip_v, transpose), probability) in enumerate(alternatives):
+                key = "%d:0/%d" % (col, alt)
+                out.append("%s = %d" % (key, alt))
+                for prop, value in (("flip_h", flip_h), ("flip_v", flip_v), ("transpose", transpose)):
+                    if value:
+                        out.append("%s/%s = true" % (key, prop))
+                out.append("%s/probability = %s" % (key, repr(float(probability))))
+            if len(alternatives) > 1:
+                out.append("%d:0/next_alternative_id = %d" % (col, len(alternatives)))
+        out.append("")
+    out += ["[resource]", "tile_size = Vector2i(%d, %d)" % (w, h)]
+    out += ['sources/%d = SubResource("TileSetAtlasSource_%d")' % (i, i) for i in range(len(sources))]
+    out.append("")
+    return "\n".join(out)
@@ -0,0 +1,153 @@
+"""
+Compiled sprite grids.
+Hand-placed sprites are written as text instead of Python tuple tables: a
+legend of one character per colour, a blank line, then one line of
+characters per pixel row. Every legend line is a character and a #rrggbb or
+#rrggbbaa colour; the first entry is the background (palette index 0) and
+also fills short rows. `#` starts a comment, on its own line or after a
+legend entry or row:
+
+    # Lewis, bully leader
+    .  #00000000          # transparent
+    O  #181425            # OL: outline
+    s  #ebc8a5            # SKIN
+
+    ......OOOO......      # Row 0: hair top
+    .....OssssO.....
+
+A grid compiles to palette-index bytes plus the palette, which become an
+IndexedCanvas in one copy. The compiled form can be cached on disk
+(cache_dir_for(root) is .pixelkit/grids under a build root, keyed by the
+SHA-1 of the text), so only grids whose text changed are parsed again. A cached blob that does
+not read back as a whole grid counts as a miss and is compiled again.
+"""
+
+import hashlib
+import os
+import struct
+from collections import namedtuple
+
+from .canvas import ink
+from .output import atomic_write
+from .palette import IndexedCanvas, MAX_COLORS
+
+_MAGIC = b"PKG1"
+_HEADER = struct.Struct("<4sHHH")
+
+Grid = namedtuple("Grid", "width height palette data")
+
+
+class GridError(ValueError):
+    """Raised for a malformed grid text."""
+
+
+def _colour(field):
+    """4-byte colour of a #rrggbb or #rrggbbaa legend field, or None."""
+    digits = field[1:]
+    if not field.startswith("#") or len(digits) not in (6, 8):
+        return None
+    try:
+        int(digits, 16)
+    except ValueError:
+        return None
+    return ink(field)
+
+
+def compile_text(text, name="<grid>"):
+    """Grid (width, height, palette of 4-byte entries, index bytes) of a grid text.
+
+    The legend is the first run of non-comment lines and must be followed by
+    a blank line; everything after it is rows.
+    """
+    legend = {}
+    palette = []
+    rows = []
+    in_legend = None  # None before the legend, True inside it, False after the blank line
+    for number, line in enumerate(text.splitlines(), 1):
+        fields = line.split()
+        if not fields:
+            if in_legend:
+                in_legend = False
+            continue
+        if fields[0].startswith("#"):
+            continue
+        if in_legend is None:
+            in_legend = True
+        if not in_legend:
+            rows.append((number, fields[0]))
+            continue
+        colour = _colour(fields[1]) if len(fields) >= 2 and len(fields[0]) == 1 else None
+        if colour is None or (len(fields) > 2 and not fields[2].startswith("#")):
+            raise GridError("%s:%d: expected a legend entry '<char> #rrggbb[aa]' "
+                            "(a blank line separates the legend from the rows)" % (name, number))
+        char = fields[0]
+        if char in legend:
+            raise GridError("%s:%d: %r defined twice" % (name, number, char))
+        if len(palette) == MAX_COLORS:
+            raise GridError("%s:%d: more than %d colours" % (name, number, MAX_COLORS))
+        legend[char] = len(palette)
+        palette.append(colour)
+    if not palette:
+        raise GridError("%s: no legend" % name)
+    if not rows:
+        raise GridError("%s: no rows after the legend (is the blank line after it missing?)" % name)
+    width = max((len(row) for _, row in rows), default=0)
+    data = bytearray(width * len(rows))
+    for y, (number, row) in enumerate(rows):
+        try:
+            data[y * width:y * width + len(row)] = bytes(legend[c] for c in row)
+        except KeyError as exc:
+            raise GridError("%s:%d: %r is not in the legend" % (name, number, exc.args[0])) from None
+    return Grid(width, len(rows), palette, bytes(data))
+
+
+def cache_dir_for(root):
+    """Grid cache directory of a build root."""
+    return os.path.join(root, ".pixelkit", "grids")
+
+
+def to_canvas(grid):
+    return IndexedCanvas.from_indices(grid.width, grid.height, grid.data, grid.palette)
+
+
+def pack(grid):
+    """Binary form of a compiled grid, as stored in the cache."""
+    return (_HEADER.pack(_MAGIC, grid.width, grid.height, len(grid.palette))
+            + b"".join(grid.palette) + grid.data)
+
+
+def unpack(blob):
+    """Grid of a cache blob; raises GridError unless it is a whole compiled grid."""
+    if len(blob) < _HEADER.size:
+        raise GridError("not a compiled grid")
+    magic, width, height, colors = _HEADER.unpack_from(blob)
+    if magic != _MAGIC:
+        raise GridError("not a compiled grid")
+    if len(blob) != _HEADER.size + 4 * colors + width * height:
+        raise GridError("compiled grid is %d bytes, expected %d"
+                        % (len(blob), _HEADER.size + 4 * colors + width * height))
+    start = _HEADER.size
+    palette = [blob[start + 4 * i:start + 4 * i + 4] for i in range(colors)]
+    start += 4 * colors
+    return Grid(width, height, palette, blob[start:start + width * height])
+
+
+def load(path, cache_dir=None):
+    """IndexedCanvas of a grid file, compiling it only when its text is not in cache_dir.
+
+    Without a cache_dir the grid is always compiled.
+    """
+    with open(path, "rb") as f:
+        text = f.read()
+    cached = os.path.join(cache_dir, hashlib.sha1(_MAGIC + text).hexdigest() + ".bin") if cache_dir else None
+    if cached and os.path.exists(cached):
+        with open(cached, "rb") as f:
+            blob = f.read()
+        try:
+            return to_canvas(unpack(blob))
+        except GridError:
+            pass  # truncated or foreign blob: compile again and replace it
+    grid = compile_text(text.decode("utf-8"), path)
+    if cached:
+        atomic_write(cached, pack(grid))
+    return to_canvas(grid)
@@ -0,0 +1,44 @@
+"""
+Layer compositing.
+Characters are assembled from body-part layers (head, torso, legs...) that
+are painted once and shared by every frame showing them: a frame is its
+layers alpha-composited in order at their offsets, so a longer walk cycle
+or another direction costs array copies, not repainting. The "over" blend
+is straight alpha and exact for fully opaque and fully transparent pixels,
+so hard-edged pixel art composes bit for bit.
+"""
+
+import numpy as np
+
+from .canvas import Canvas
+from .palette import as_rgba
+
+
+def over(dst, src, x=0, y=0):
+    """Composite src onto the Canvas dst in place, its top-left corner at (x, y); clipped at the edges."""
+    src = as_rgba(src)
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + src.width, dst.width), min(y + src.height, dst.height)
+    if x0 >= x1 or y0 >= y1:
+        return dst
+    s = src.pixels[y0 - y:y1 - y, x0 - x:x1 - x]
+    d = dst.pixels[y0:y1, x0:x1]
+    sa = s[..., 3:]
+    if (sa == 255).all():
+        d[...] = s
+        return dst
+    a = sa / 255.0
+    da = d[..., 3:] / 255.0 * (1.0 - a)
+    alpha = a + da
+    rgb = (s[..., :3] * a + d[..., :3] * da) / np.where(alpha > 0, alpha, 1.0)
+    blend = np.concatenate([rgb, alpha * 255.0], axis=-1).round().astype(np.uint8)
+    d[...] = np.where(sa == 255, s, np.where(sa == 0, d, blend))
+    return dst
+
+
+def compose(size, layers):
+    """New transparent Canvas of size with each (layer, (x, y)) composited in order, bottom first."""
+    out = Canvas(*size)
+    for layer, (x, y) in layers:
+        over(out, layer, x, y)
+    return out
@@ -0,0 +1,85 @@
+"""
+Build manifest.
+One JSON record per output file: pixel hash, size, mode, opaque and colour
+counts (text resources: hash and byte count), all taken from the in-memory
+result while building. Checks (the generators' verification, CI, diffs
+between builds) read the manifest instead of decoding the PNGs again, so it
+only holds content: two builds of the same assets write the same manifest.
+Render/encode times and whether each file was written go to a separate
+report, timings.json, which is replaced by every build.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from .output import write_if_changed
+from .palette import MAX_COLORS, as_rgba
+
+
+def image_stats(img):
+    """Pixel hash, size, PNG mode, opaque pixel count and distinct visible colours of a Canvas."""
+    mode = img.mode
+    img = as_rgba(img)
+    words = np.frombuffer(img.buf, dtype=np.uint32)
+    visible = img.pixels[..., 3].reshape(-1) > 0
+    return {
+        "sha256": hashlib.sha256(img.buf).hexdigest(),
+        "width": img.width,
+        "height": img.height,
+        # what output.encode_png writes: palette PNG up to MAX_COLORS colours
+        "mode": "L" if mode == "L" else "P" if np.unique(words).size <= MAX_COLORS else "RGBA",
+        "opaque": int(np.count_nonzero(visible)),
+        "colors": int(np.unique(words[visible]).size),
+    }
+
+
+def text_stats(text):
+    """Hash and size of a text output (e.g. a Godot .tres)."""
+    data = text.encode("utf-8")
+    return {"sha256": hashlib.sha256(data).hexdigest(), "bytes": len(data), "mode": "text"}
+
+
+class Manifest:
+    """Records of the files on disk, keyed by asset name, stored as JSON under the project root."""
+
+    def __init__(self, path, timings_path=None):
+        self.path = path
+        self.timings_path = timings_path
+        self.assets = {}
+        self.timings = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.assets = json.load(f).get("assets", {})
+            except (OSError, ValueError):
+                self.assets = {}
+
+    @classmethod
+    def for_root(cls, root):
+        state = os.path.join(root, ".pixelkit")
+        return cls(os.path.join(state, "manifest.json"), os.path.join(state, "timings.json"))
+
+    def record(self, entry, record, timings=None):
+        """Store the record for entry's output, replacing any other asset's record for that file.
+
+        timings (render_ms, encode_ms, written) go to this build's report only.
+        """
+        for name in [n for n, rec in self.assets.items() if rec["output"] == entry.output]:
+            del self.assets[name]
+        self.assets[entry.name] = dict(record, output=entry.output)
+        if timings is not None:
+            self.timings[entry.name] = timings
+
+    def by_output(self):
+        """Records keyed by project-relative output path."""
+        return {rec["output"]: rec for rec in self.assets.values()}
+
+    def save(self):
+        data = json.dumps({"assets": self.assets}, indent=1, sort_keys=True) + "\n"
+        write_if_changed(self.path, data.encode("utf-8"))
+        if self.timings_path:
+            data = json.dumps({"assets": self.timings}, indent=1, sort_keys=True) + "\n"
+            write_if_changed(self.timings_path, data.encode("utf-8"))
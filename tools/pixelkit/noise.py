@@ -0,0 +1,243 @@
+"""
+Procedural noise for tile textures.
+Every function works on a whole batch: `seeds` is a sequence of N integer
+seeds and the result is an (N, h, w) float array, one field per seed, so a
+hundred variants of a material cost one array operation instead of a hundred
+loops. Nothing here touches a random.Random: values come from an integer
+hash of (x, y, seed), so the same seed gives the same field in any process
+and in any batch.
+
+All fields tile: lattice noise wraps its grid at the tile size, and the
+dither masks are toroidal, so a texture built from them repeats without a
+seam. quantize turns a field into palette indices by cutoffs, optionally
+dithered by an ordered (Bayer) or blue-noise threshold mask.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+# unit gradients of the lattice noise, picked by hash: fixed table, no trig
+_GRADIENTS = np.array([(1, 0), (-1, 0), (0, 1), (0, -1),
+                       (0.7071067811865476, 0.7071067811865476), (-0.7071067811865476, 0.7071067811865476),
+                       (0.7071067811865476, -0.7071067811865476), (-0.7071067811865476, -0.7071067811865476)])
+
+
+def _seeds(seeds):
+    return np.asarray(seeds, dtype=np.int64).reshape(-1).astype(np.uint32)
+
+
+def hash32(x, y, seeds):
+    """uint32 hash of integer lattice coordinates; seeds broadcast against x and y."""
+    h = (np.asarray(x, dtype=np.int64).astype(np.uint32) * np.uint32(0x8DA6B343)
+         ^ np.asarray(y, dtype=np.int64).astype(np.uint32) * np.uint32(0xD8163841)
+         ^ np.asarray(seeds, dtype=np.uint32) * np.uint32(0xCB1AB31F))
+    # lowbias32 finalizer
+    h ^= h >> np.uint32(16)
+    h *= np.uint32(0x7FEB352D)
+    h ^= h >> np.uint32(15)
+    h *= np.uint32(0x846CA68B)
+    h ^= h >> np.uint32(16)
+    return h
+
+
+def white(size, seeds, salt=0):
+    """(N, h, w) independent uniform values in [0, 1) per pixel; salt gives another stream per seed."""
+    w, h = size
+    seeds = _seeds(seeds)[:, None, None] ^ np.uint32(salt * 0x9E3779B9 & 0xFFFFFFFF)
+    ys, xs = np.mgrid[0:h, 0:w]
+    return hash32(xs, ys, seeds) / 4294967296.0
+
+
+def _lattice(size, period):
+    """Cell coordinates of each pixel centre for a tileable grid of period x period cells."""
+    w, h = size
+    if w % period or h % period:
+        raise ValueError("a %dx%d tile does not split into %d lattice cells per side" % (w, h, period))
+    fx = (np.arange(w) + 0.5) * period / w
+    fy = (np.arange(h) + 0.5) * period / h
+    x0, y0 = np.floor(fx).astype(np.int64), np.floor(fy).astype(np.int64)
+    return x0, y0, fx - x0, fy - y0
+
+
+def _fade(t):
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+
+def _octave_value(size, period, seeds, border=None):
+    x0, y0, tx, ty = _lattice(size, period)
+    # (1, corner x, corner y, h, w) lattice coordinates of each pixel's four corners
+    gx = np.stack([x0 % period, (x0 + 1) % period])[None, :, None, None, :]
+    gy = np.stack([y0 % period, (y0 + 1) % period])[None, None, :, :, None]
+    corners = hash32(gx, gy, seeds[:, None, None, None, None])
+    if border is not None:
+        # lattice points on the tile edge hash their distance to the nearest corner
+        # with the shared border seed, the same along all four edges
+        along = np.where(gx == 0, gy, gx)
+        shared = hash32(np.minimum(along, period - along), 0, border)
+        corners = np.where((gx == 0) | (gy == 0), shared, corners)
+    corners = corners / 4294967296.0
+    u, v = _fade(tx)[None, :], _fade(ty)[:, None]
+    top = corners[:, 0, 0] * (1 - u) + corners[:, 1, 0] * u
+    bottom = corners[:, 0, 1] * (1 - u) + corners[:, 1, 1] * u
+    return top * (1 - v) + bottom * v
+
+
+def _octave_perlin(size, period, seeds):
+    x0, y0, tx, ty = _lattice(size, period)
+    u, v = _fade(tx)[None, :], _fade(ty)[:, None]
+    dots = {}
+    for cx in (0, 1):
+        for cy in (0, 1):
+            g = _GRADIENTS[hash32(((x0 + cx) % period)[None, :], ((y0 + cy) % period)[:, None],
+                                  seeds[:, None, None]) & np.uint32(7)]
+            dots[cx, cy] = g[..., 0] * (tx - cx)[None, :] + g[..., 1] * (ty - cy)[:, None]
+    top = dots[0, 0] * (1 - u) + dots[1, 0] * u
+    bottom = dots[0, 1] * (1 - u) + dots[1, 1] * u
+    # gradient noise stays within +-sqrt(2)/2; map it to [0, 1]
+    return (top * (1 - v) + bottom * v) * 0.7071067811865476 + 0.5
+
+
+def _fractal(octave, size, period, seeds, octaves, persistence, border=None):
+    seeds = _seeds(seeds)
+    out = np.zeros((len(seeds), size[1], size[0]))
+    total = 0.0
+    amplitude = 1.0
+    for i in range(octaves):
+        salt = np.uint32(i * 0x68E31DA4)
+        if border is None:
+            layer = octave(size, period << i, seeds ^ salt)
+        else:
+            layer = octave(size, period << i, seeds ^ salt, np.uint32(border & 0xFFFFFFFF) ^ salt)
+        out += amplitude * layer
+        total += amplitude
+        amplitude *= persistence
+    return out / total
+
+
+def value_noise(size, period, seeds, octaves=1, persistence=0.5, border=None):
+    """(N, h, w) tileable value noise in [0, 1]: period x period random cells, smoothly blended.
+
+    Each further octave doubles the period (which must still divide the
+    tile) and scales its amplitude by persistence. With a border seed, the
+    lattice values along the tile edges come from it instead of each seed
+    and read the same from either end of every edge: all the tiles of a
+    batch then join each other, also flipped or transposed.
+    """
+    return _fractal(_octave_value, size, period, seeds, octaves, persistence, border=border)
+
+
+def perlin(size, period, seeds, octaves=1, persistence=0.5):
+    """(N, h, w) tileable gradient (Perlin) noise in [0, 1], octaves as in value_noise."""
+    return _fractal(_octave_perlin, size, period, seeds, octaves, persistence)
+
+
+def equalize(field):
+    """Rank each tile's values into an even spread over [0, 1), keeping their order.
+
+    Cutoffs on an equalized field are area fractions: a cutoff of 0.4 puts
+    exactly 40% of the pixels below it, whatever the noise.
+    """
+    n = field.shape[0]
+    flat = field.reshape(n, -1)
+    ranks = np.empty(flat.shape)
+    order = np.argsort(flat, axis=1, kind="stable")
+    np.put_along_axis(ranks, order, np.arange(flat.shape[1]) / flat.shape[1], axis=1)
+    return ranks.reshape(field.shape)
+
+
+# ============================================================
+# Threshold masks
+# ============================================================
+@lru_cache(maxsize=None)
+def bayer(n):
+    """(n, n) ordered-dither thresholds in (0, 1), n a power of two."""
+    if n < 1 or n & (n - 1):
+        raise ValueError("Bayer matrix size must be a power of two, got %d" % n)
+    m = np.zeros((1, 1), dtype=np.int64)
+    while len(m) < n:
+        m = np.block([[4 * m, 4 * m + 2], [4 * m + 3, 4 * m + 1]])
+    out = (m + 0.5) / (n * n)
+    out.flags.writeable = False
+    return out
+
+
+@lru_cache(maxsize=None)
+def blue_noise(n, seed=0, sigma=1.5):
+    """(n, n) toroidal blue-noise thresholds in (0, 1) by void-and-cluster.
+
+    Neighbouring thresholds are as far apart as possible, so any cutoff
+    scatters its pixels evenly with no clumps and no visible grid.
+    """
+    ys, xs = np.mgrid[0:n, 0:n]
+    dx, dy = np.minimum(xs, n - xs), np.minimum(ys, n - ys)
+    kernel = np.exp(-(dx * dx + dy * dy) / (2.0 * sigma * sigma))
+    spectrum = np.fft.rfft2(kernel)
+
+    def energy(points):
+        return np.fft.irfft2(np.fft.rfft2(points) * spectrum, s=(n, n))
+
+    total = n * n
+    start = np.random.RandomState(seed).random_sample((n, n)) < 0.1
+    points = start.astype(np.float64)
+    # relax the initial points: move the tightest cluster into the largest void until stable
+    for _ in range(total):
+        e = energy(points)
+        cluster = np.argmax(np.where(points > 0, e, -np.inf))
+        points.flat[cluster] = 0
+        void = np.argmin(np.where(points > 0, np.inf, energy(points)))
+        points.flat[void] = 1
+        if void == cluster:
+            break
+    ranks = np.zeros(total, dtype=np.int64)
+    ones = int(points.sum())
+    # the initial points take ranks below `ones`, tightest cluster last out
+    current = points.copy()
+    e = energy(current)
+    for rank in range(ones - 1, -1, -1):
+        cluster = np.argmax(np.where(current > 0, e, -np.inf))
+        current.flat[cluster] = 0
+        e -= np.roll(kernel, divmod(cluster, n), axis=(0, 1))
+        ranks[cluster] = rank
+    # the rest fill the largest void first
+    e = energy(points)
+    for rank in range(ones, total):
+        void = np.argmin(np.where(points > 0, np.inf, e))
+        points.flat[void] = 1
+        e += np.roll(kernel, divmod(void, n), axis=(0, 1))
+        ranks[void] = rank
+    out = ((ranks + 0.5) / total).reshape(n, n)
+    out.flags.writeable = False
+    return out
+
+
+def masks(size, mask, seeds):
+    """(N, h, w) copies of a square threshold mask tiled over size, each rolled by its seed.
+
+    Rolling keeps the mask toroidal, so every seed gets its own arrangement
+    of the same evenly spread thresholds.
+    """
+    w, h = size
+    n = len(mask)
+    seeds = _seeds(seeds)
+    shift = hash32(seeds, seeds >> np.uint32(16), seeds)
+    dy, dx = (shift % np.uint32(n)).astype(np.int64), ((shift >> np.uint32(8)) % np.uint32(n)).astype(np.int64)
+    ys = (np.arange(h)[None, :] + dy[:, None]) % n
+    xs = (np.arange(w)[None, :] + dx[:, None]) % n
+    return mask[ys[:, :, None], xs[:, None, :]]
+
+
+# ============================================================
+# Quantization
+# ============================================================
+def quantize(field, cutoffs, threshold=None, spread=0.0):
+    """Palette indices of a field: the number of cutoffs each value reaches.
+
+    A threshold mask (same shape as field, values in (0, 1)) dithers the
+    boundaries: each value is shifted by (threshold - 0.5) * spread before
+    the cutoffs, so neighbouring pixels near a cutoff alternate in the
+    mask's pattern instead of forming a hard contour.
+    """
+    if threshold is not None:
+        field = field + (threshold - 0.5) * spread
+    return np.searchsorted(np.asarray(cutoffs, dtype=np.float64), field, side="right")
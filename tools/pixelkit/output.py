@@ -0,0 +1,103 @@
+"""
+Change-aware, atomic file output.
+Godot re-imports a texture whenever its PNG is rewritten, even with identical
+pixels, so outputs are only replaced when their content (or PNG format)
+actually changed, and then via a temporary file renamed into place so the
+editor never sees a half-written PNG. Canvases with at most 256 colours are written as 8-bit
+palette PNGs (mode "P", alpha in tRNS); the rest as RGBA.
+"""
+
+import io
+import os
+import tempfile
+
+from PIL import Image
+
+from .palette import as_rgba, to_indexed
+
+
+def encode_png(img):
+    """PNG bytes for a Canvas, IndexedCanvas or PIL image; mode "P" when the canvas qualifies."""
+    if hasattr(img, "to_image"):
+        img = (to_indexed(img) or img).to_image()
+    out = io.BytesIO()
+    img.save(out, format="PNG")
+    return out.getvalue()
+
+
+def _umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def atomic_write(path, data):
+    """Write bytes to path through a temporary file in the same directory."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix="." + os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates 0600 files; give outputs the usual umask-based mode
+        os.chmod(tmp, 0o666 & ~_umask())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def write_if_changed(path, data):
+    """Atomically write bytes unless path already holds exactly them. Returns True if written."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    atomic_write(path, data)
+    return True
+
+
+def same_pixels(path, img):
+    """True when the PNG at path decodes to the same size and RGBA pixels as img."""
+    rgba = as_rgba(img).tobytes() if hasattr(img, "to_image") else img.convert("RGBA").tobytes()
+    try:
+        with Image.open(path) as current:
+            current = current.convert("RGBA")
+            return current.size == tuple(img.size) and current.tobytes() == rgba
+    except (OSError, ValueError):
+        return False
+
+
+def png_format(data):
+    """(bit depth, colour type) from the IHDR chunk of PNG bytes."""
+    return tuple(data[24:26])
+
+
+def save_png(img, path):
+    """Save img as a PNG unless the file already has the same bytes, or the same pixels in the same format.
+
+    A file holding the same pixels in another PNG format (e.g. RGBA where a
+    palette PNG now qualifies) is rewritten. Returns True if written.
+    """
+    data = encode_png(img)
+    try:
+        with open(path, "rb") as f:
+            current = f.read()
+    except FileNotFoundError:
+        current = None
+    if current is not None:
+        if current == data:
+            return False
+        # encoded differently (older encoder, other options) but maybe the same image
+        if png_format(current) == png_format(data) and same_pixels(path, img):
+            return False
+    atomic_write(path, data)
+    return True
+
+
+def save_text(text, path):
+    """Save a UTF-8 text resource unless the file already holds it. Returns True if written."""
+    return write_if_changed(path, text.encode("utf-8"))
@@ -0,0 +1,176 @@
+"""
+Palette-indexed canvas.
+Pixels are one byte each, an index into a palette of up to 256 RGBA colours
+(alpha included, written to the PNG as a tRNS chunk). The sprites are drawn
+from a handful of fixed colours, so this quarters the buffer size and lets
+the PNG encoder work on 8-bit data. Any RGBA Canvas with at most 256
+distinct colours converts losslessly (to_indexed), which is how output.py
+writes mode "P" PNGs; anything with more colours stays RGBA.
+"""
+
+import numpy as np
+from PIL import Image
+
+from .canvas import Canvas, ink
+
+MAX_COLORS = 256
+
+
+class IndexedCanvas:
+    """Palette-index buffer exposing the drawing API of Canvas."""
+
+    mode = "P"
+    wrap = False
+
+    def __init__(self, width, height, color=(0, 0, 0, 0), palette=()):
+        self.width = width
+        self.height = height
+        self.palette = []
+        self._lookup = {}
+        for entry in palette:
+            self._add(ink(entry))
+        self.buf = bytearray([self.index(color)]) * (width * height)
+        self.pixels = np.frombuffer(self.buf, dtype=np.uint8).reshape(height, width)
+
+    @property
+    def size(self):
+        return (self.width, self.height)
+
+    def index(self, color):
+        """Palette index of color, adding it if new."""
+        data = ink(color)
+        try:
+            return self._lookup[data]
+        except KeyError:
+            return self._add(data)
+
+    def _add(self, data):
+        # entries may repeat (e.g. after a recolor merges two colours); lookups use the first
+        if len(self.palette) == MAX_COLORS:
+            raise ValueError("more than %d colors in an indexed canvas" % MAX_COLORS)
+        self.palette.append(data)
+        return self._lookup.setdefault(data, len(self.palette) - 1)
+
+    # ------------------------------------------------------------------
+    # Construction / conversion
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_indices(cls, width, height, data, palette):
+        """Wrap a copy of raw index bytes over a list of 4-byte RGBA palette entries."""
+        canvas = cls(width, height, palette[0] if palette else (0, 0, 0, 0), palette)
+        canvas.buf[:] = data
+        return canvas
+
+    @classmethod
+    def from_grid(cls, width, height, rows, background=(0, 0, 0, 0)):
+        """Build a canvas from a 2D list of colors; short rows leave the background."""
+        canvas = cls(width, height, background)
+        for y, row in enumerate(rows[:height]):
+            indices = bytes(canvas.index(c) for c in row[:width])
+            canvas.buf[y * width:y * width + len(indices)] = indices
+        return canvas
+
+    def rgba(self):
+        """(h, w, 4) uint8 array of the colors."""
+        table = np.frombuffer(b"".join(self.palette), dtype=np.uint8).reshape(-1, 4)
+        return table[self.pixels]
+
+    def to_canvas(self):
+        return Canvas.from_array(self.rgba())
+
+    def to_image(self):
+        """PIL "P" image; palette alpha becomes the PNG tRNS chunk."""
+        img = Image.frombytes("P", self.size, bytes(self.buf))
+        img.putpalette(b"".join(entry[:3] for entry in self.palette), "RGB")
+        alpha = bytes(entry[3] for entry in self.palette)
+        if alpha.rstrip(b"\xff"):
+            img.info["transparency"] = alpha.rstrip(b"\xff")
+        return img
+
+    def tobytes(self):
+        return bytes(self.buf)
+
+    def copy(self):
+        return type(self).from_indices(self.width, self.height, self.buf, self.palette)
+
+    def __reduce__(self):
+        return (type(self).from_indices, (self.width, self.height, bytes(self.buf), list(self.palette)))
+
+    # ------------------------------------------------------------------
+    # Drawing (same clipping rules as Canvas)
+    # ------------------------------------------------------------------
+    def putpixel(self, xy, color):
+        x, y = xy
+        if not (-self.width <= x < self.width and -self.height <= y < self.height):
+            raise IndexError("image index out of range")
+        self.pixels[y, x] = self.index(color)
+
+    def getpixel(self, xy):
+        x, y = xy
+        if not (-self.width <= x < self.width and -self.height <= y < self.height):
+            raise IndexError("image index out of range")
+        return tuple(self.palette[self.pixels[y, x]])
+
+    def put(self, x, y, color):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.buf[y * self.width + x] = self.index(color)
+
+    def get(self, x, y, default=None):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return tuple(self.palette[self.buf[y * self.width + x]])
+        return default
+
+    def fill_rect(self, x0, y0, w, h, color):
+        """Fill a w x h rectangle whose top-left corner is (x0, y0)."""
+        x1 = min(x0 + w, self.width)
+        y1 = min(y0 + h, self.height)
+        x0 = max(x0, 0)
+        y0 = max(y0, 0)
+        if x0 < x1 and y0 < y1:
+            self.pixels[y0:y1, x0:x1] = self.index(color)
+
+    def hline(self, x0, x1, y, color):
+        """Draw a horizontal line from x0 to x1 inclusive."""
+        self.fill_rect(x0, y, x1 - x0 + 1, 1, color)
+
+    def vline(self, x, y0, y1, color):
+        """Draw a vertical line from y0 to y1 inclusive."""
+        self.fill_rect(x, y0, 1, y1 - y0 + 1, color)
+
+    def fill(self, color):
+        self.pixels[...] = self.index(color)
+
+
+class IndexMap(IndexedCanvas):
+    """The palette indices themselves as an 8-bit grayscale image (index i = gray level i).
+
+    Written as a single-channel "L" PNG for shaders that look the colours up in
+    a palette texture; dependents see the gray levels, not the colours.
+    """
+
+    mode = "L"
+
+    def rgba(self):
+        gray = np.repeat(self.pixels[..., None], 4, axis=2)
+        gray[..., 3] = 255
+        return gray
+
+    def to_image(self):
+        return Image.frombytes("L", self.size, bytes(self.buf))
+
+
+def to_indexed(img):
+    """Lossless IndexedCanvas of an RGBA Canvas, or None if it has more than 256 colors."""
+    if isinstance(img, IndexedCanvas):
+        return img
+    words = np.frombuffer(img.buf, dtype=np.uint32)
+    colors, indices = np.unique(words, return_inverse=True)
+    if colors.size > MAX_COLORS:
+        return None
+    palette = [bytes(entry) for entry in colors.view(np.uint8).reshape(-1, 4)]
+    return IndexedCanvas.from_indices(img.width, img.height, indices.astype(np.uint8).tobytes(), palette)
+
+
+def as_rgba(img):
+    """Canvas for any image result (IndexedCanvas is expanded); other values pass through."""
+    return img.to_canvas() if isinstance(img, IndexedCanvas) else img
@@ -0,0 +1,137 @@
+"""
+Vectorized drawing primitives operating on whole canvas regions.
+Random fills draw all their numbers in one batch from a NumPy Generator
+seeded with the next 64 bits of the caller's random.Random (the asset's own
+stream, seeded from its name, or the random module itself). Only the public
+API of either generator is used, so the output depends on the asset seed
+alone, not on how CPython or NumPy lay out their internal state.
+"""
+
+import random
+from functools import lru_cache
+
+import numpy as np
+
+from .canvas import ink
+
+def generator(rng):
+    """NumPy Generator for one batch of draws, seeded from rng (advances it by 64 bits)."""
+    return np.random.default_rng(rng.getrandbits(64))
+
+
+def uniform(rng, n):
+    """Return n floats in [0, 1) drawn in one call from generator(rng)."""
+    return generator(rng).random(n)
+
+
+def palette_array(colors):
+    """Stack colors into a (k, 4) uint8 array."""
+    return np.frombuffer(b"".join(ink(c) for c in colors), dtype=np.uint8).reshape(-1, 4)
+
+
+@lru_cache(maxsize=None)
+def parity_mask(x0, y0, w, h, phase=0):
+    """Boolean (h, w) mask of pixels where (x + y) % 2 == phase, in canvas coordinates."""
+    ys, xs = np.mgrid[y0:y0 + h, x0:x0 + w]
+    mask = (xs + ys) % 2 == phase
+    mask.flags.writeable = False
+    return mask
+
+
+def _write(img, x0, y0, w, h, colors, mask=None):
+    """Write an (h, w, 4) color block into img, clipped (or wrapped); mask limits which pixels land."""
+    if img.wrap:
+        ys = np.arange(y0, y0 + h) % img.height
+        xs = np.arange(x0, x0 + w) % img.width
+        if mask is None:
+            img.pixels[np.ix_(ys, xs)] = colors
+        else:
+            my, mx = np.nonzero(mask)
+            img.pixels[ys[my], xs[mx]] = colors[my, mx]
+        return
+    cx0, cy0 = max(x0, 0), max(y0, 0)
+    cx1, cy1 = min(x0 + w, img.width), min(y0 + h, img.height)
+    if cx0 >= cx1 or cy0 >= cy1:
+        return
+    src = (slice(cy0 - y0, cy1 - y0), slice(cx0 - x0, cx1 - x0))
+    dst = img.pixels[cy0:cy1, cx0:cx1]
+    if mask is None:
+        dst[...] = colors[src]
+    else:
+        m = mask[src]
+        dst[m] = colors[src][m]
+
+
+# ============================================================
+# Solid fills
+# ============================================================
+def rect(img, x0, y0, w, h, color):
+    img.fill_rect(x0, y0, w, h, color)
+
+
+def hline(img, x0, x1, y, color):
+    img.hline(x0, x1, y, color)
+
+
+def vline(img, x, y0, y1, color):
+    img.vline(x, y0, y1, color)
+
+
+# ============================================================
+# Random fills
+# ============================================================
+def random_fill(img, x0, y0, w, h, colors, cutoffs, mask=None, inclusive=False, rng=random):
+    """Draw one random number per (masked) pixel, row-major, and pick a color by cutoff.
+
+    With inclusive=False a draw r picks colors[i] for the first cutoff with
+    r < cutoffs[i] (the `if r < 0.4: ... elif r < 0.65: ...` idiom); with
+    inclusive=True the test is r <= cutoffs[i]. Draws past the last cutoff
+    take colors[len(cutoffs)] when given, otherwise leave the pixel untouched.
+    A None color also leaves its pixels untouched.
+    """
+    n = w * h if mask is None else int(np.count_nonzero(mask))
+    if n == 0:
+        return
+    draws = uniform(rng, n)
+    side = "left" if inclusive else "right"
+    index = np.searchsorted(np.asarray(cutoffs, dtype=np.float64), draws, side=side)
+    pal = palette_array([(0, 0, 0, 0) if c is None else c for c in colors])
+    valid = np.array([c is not None for c in colors] + [False])
+    keep = valid[np.minimum(index, len(colors))]
+    block = np.zeros((h, w, 4), dtype=np.uint8)
+    hit = np.zeros((h, w), dtype=bool)
+    if mask is None:
+        block.reshape(-1, 4)[keep] = pal[index[keep]]
+        hit.reshape(-1)[keep] = True
+    else:
+        where = np.flatnonzero(mask)[keep]
+        block.reshape(-1, 4)[where] = pal[index[keep]]
+        hit.reshape(-1)[where] = True
+    _write(img, x0, y0, w, h, block, hit)
+
+
+def dither_fill(img, x0, y0, w, h, c1, c2, density=0.5, rng=random):
+    """Fill rectangle with checkerboard dither between two colors."""
+    hi = uniform(rng, w * h).reshape(h, w) > density * 0.3
+    even = parity_mask(x0, y0, w, h)
+    pal = palette_array((c2, c1))
+    _write(img, x0, y0, w, h, pal[(hi == even).astype(np.intp)])
+
+
+def noise_fill(img, x0, y0, w, h, colors, weights=None, rng=random):
+    """Fill rectangle with random noise from a palette."""
+    if weights is None:
+        weights = [1.0 / len(colors)] * len(colors)
+    total = sum(weights)
+    cumulative = np.cumsum([wv / total for wv in weights])
+    random_fill(img, x0, y0, w, h, colors, cumulative, inclusive=True, rng=rng)
+
+
+def parity_dither(img, x0, y0, w, h, base, alt, threshold, rng=random):
+    """Checkerboard where even pixels are base and odd ones turn alt when random() > threshold.
+
+    Only odd pixels get a draw.
+    """
+    rect(img, x0, y0, w, h, base)
+    random_fill(img, x0, y0, w, h, (base, alt), (threshold,),
+                mask=parity_mask(x0, y0, w, h, 1), inclusive=True, rng=rng)
@@ -0,0 +1,67 @@
+"""
+Palette swaps.
+A variant is a base sheet plus a table {base colour: new colour}; colours
+not in the table are kept. On an IndexedCanvas the swap only rewrites the
+palette, on an RGBA Canvas it is one vectorized lookup over the pixels, so
+a crowd of recoloured NPCs costs no drawing at all. Tables are usually built
+from named ramps (ramp_table): the base lists its colour roles (hair, skin,
+shirt...) dark to light, and each variant gives new ramps for the roles it
+changes. For swaps at runtime, index_map and palette_strip split an indexed
+sheet into its gray index texture and a one-row palette texture; every
+variant of a base keeps the same indices, so only the strip differs.
+"""
+
+import numpy as np
+
+from .canvas import Canvas, ink
+from .palette import IndexedCanvas, IndexMap
+
+
+def ramp_table(roles, ramps):
+    """{base colour: new colour} pairing each role's base ramp with the variant's ramp step by step."""
+    table = {}
+    for role, ramp in ramps.items():
+        if role not in roles:
+            raise KeyError("unknown colour role %r (base has %s)" % (role, ", ".join(roles)))
+        if len(ramp) != len(roles[role]):
+            raise ValueError("ramp %r has %d colours, the base has %d" % (role, len(ramp), len(roles[role])))
+        table.update(zip(roles[role], ramp))
+    return table
+
+
+def _words(colors):
+    return np.frombuffer(b"".join(ink(c) for c in colors), dtype=np.uint32)
+
+
+def recolor(img, table):
+    """Copy of img with every colour in table replaced."""
+    table = {ink(k): ink(v) for k, v in table.items()}
+    if isinstance(img, IndexedCanvas):
+        palette = [table.get(entry, entry) for entry in img.palette]
+        return IndexedCanvas.from_indices(img.width, img.height, img.buf, palette)
+    if not table:
+        return img.copy()
+    keys = _words(table)
+    order = np.argsort(keys)
+    keys, values = keys[order], _words(table.values())[order]
+    words = np.frombuffer(img.buf, dtype=np.uint32)
+    at = np.minimum(np.searchsorted(keys, words), len(keys) - 1)
+    out = np.where(keys[at] == words, values[at], words)
+    return Canvas.from_bytes(img.width, img.height, out.tobytes())
+
+
+def index_map(img):
+    """IndexMap (gray level = palette index) of an IndexedCanvas."""
+    return IndexMap.from_indices(img.width, img.height, img.buf, img.palette)
+
+
+def palette_strip(img, width=16):
+    """Palette of an IndexedCanvas as a width x 1 Canvas, index i at x = i.
+
+    Unused entries are transparent; the width doubles until the palette fits.
+    """
+    while width < len(img.palette):
+        width *= 2
+    strip = Canvas(width, 1)
+    strip.buf[:len(img.palette) * 4] = b"".join(img.palette)
+    return strip
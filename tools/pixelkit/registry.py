@@ -0,0 +1,146 @@
+"""
+Asset registry shared by every sprite generator.
+Generators declare what they produce with the @asset decorator; the build
+orchestrator (pixelkit.build) decides what to render, in which order and where
+to write it.
+"""
+
+import fnmatch
+import hashlib
+import inspect
+import os
+
+
+class RegistryError(Exception):
+    """Raised for duplicate names or outputs, unknown dependencies or dependency cycles."""
+
+
+def seed_for(name):
+    """Stable 64-bit RNG seed derived from an asset name."""
+    return int.from_bytes(hashlib.sha256(name.encode("utf-8")).digest()[:8], "big")
+
+
+class Asset:
+    """One registered generator: its output path, size, tags, dependencies, static inputs and RNG seed."""
+
+    def __init__(self, name, func, output, size, tags, deps, variant=None, static=()):
+        self.name = name
+        self.variant = variant
+        self.func = func
+        self.output = output
+        self.size = tuple(size) if size is not None else None
+        self.tags = tags
+        self.deps = deps
+        self.static = static
+        self.seed = seed_for(name)
+        params = inspect.signature(func).parameters
+        self.takes_rng = "rng" in params
+        self.takes_root = "root" in params
+        self.source = os.path.abspath(func.__code__.co_filename)
+
+    @property
+    def group(self):
+        return self.name.split("/", 1)[0]
+
+    def __repr__(self):
+        return "<Asset %s -> %s>" % (self.name, self.output)
+
+
+# name -> Asset, in registration order
+ASSETS = {}
+
+# output path -> name of the only asset allowed to write it
+OUTPUTS = {}
+
+
+def default_output(name):
+    """Project-relative PNG path for an asset name, e.g. tiles/bed -> assets/sprites/tiles/bed.png.
+
+    Variant names map next to the base file: enemies/enemy_fear@16x16 ->
+    assets/sprites/enemies/enemy_fear_16x16.png.
+    """
+    return "assets/sprites/%s.png" % name.replace("@", "_")
+
+
+def asset(name, output=None, size=None, tags=(), deps=(), variant=None, intermediate=False, static=()):
+    """Register the decorated function as the producer of one asset.
+
+    The function receives the rendered dependencies (in `deps` order) as
+    positional arguments, plus `rng` (a random.Random seeded from the name)
+    and `root` (the project root of the build) if it declares those
+    parameters, and returns a Canvas. `static` lists the project-relative
+    hand-made files it reads under that root (e.g. a drawn sheet); their
+    content is part of its fingerprint. `output` defaults to
+    default_output(name); the first path segment of the name is always added
+    as a tag. A `variant` registers an alternative version of `name` as
+    "name@variant", tagged "variant", with its own output beside the base one.
+    An `intermediate` asset (e.g. a frame packed into a sheet) is only
+    rendered as an input and never written. Every output belongs to exactly
+    one asset.
+    """
+    if variant:
+        name = "%s@%s" % (name, variant)
+        tags = tuple(tags) + ("variant",)
+
+    def register(func):
+        entry = Asset(name, func, None if intermediate else output or default_output(name), size,
+                      tuple(dict.fromkeys(tuple(tags) + (name.split("/", 1)[0],))), tuple(deps), variant,
+                      tuple(static))
+        previous = ASSETS.get(name)
+        if previous is not None and previous.source != entry.source:
+            raise RegistryError("asset %r is registered by both %s and %s"
+                                % (name, previous.source, entry.source))
+        owner = OUTPUTS.get(entry.output) if entry.output else None
+        if owner is not None and owner != name:
+            raise RegistryError("%s is written by both %r (%s) and %r (%s); declare one as a variant"
+                                % (entry.output, owner, ASSETS[owner].source, name, entry.source))
+        if previous is not None:
+            OUTPUTS.pop(previous.output, None)
+        ASSETS[name] = entry
+        if entry.output:
+            OUTPUTS[entry.output] = name
+        return func
+    return register
+
+
+def select(patterns=(), tags=(), sources=None, variants=False):
+    """Names of registered assets matching any glob in `patterns` and any tag in `tags`.
+
+    Variants are left out unless `variants` is true or a pattern names them exactly.
+    """
+    names = []
+    for entry in ASSETS.values():
+        if sources is not None and entry.source not in sources:
+            continue
+        if entry.variant and not variants and entry.name not in patterns:
+            continue
+        if patterns and not any(fnmatch.fnmatchcase(entry.name, p) for p in patterns):
+            continue
+        if tags and not set(tags) & set(entry.tags):
+            continue
+        names.append(entry.name)
+    return names
+
+
+def resolve(names):
+    """Return the Assets for `names` plus their dependencies, dependencies first."""
+    order = []
+    state = {}
+
+    def visit(name, chain):
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "active":
+            raise RegistryError("dependency cycle: " + " -> ".join(chain + [name]))
+        if name not in ASSETS:
+            needed = " (needed by %s)" % chain[-1] if chain else ""
+            raise RegistryError("unknown asset %r%s" % (name, needed))
+        state[name] = "active"
+        for dep in ASSETS[name].deps:
+            visit(dep, chain + [name])
+        state[name] = "done"
+        order.append(ASSETS[name])
+
+    for name in names:
+        visit(name, [])
+    return order
@@ -0,0 +1,63 @@
+"""
+Mask-based silhouette shading: rim lighting and dark cores.
+Everything works on boolean arrays whose last two axes are (y, x), so a
+single call shades one silhouette or a whole (n, h, w) stack of them.
+"""
+
+import numpy as np
+
+from .primitives import palette_array
+from . import shapes
+from .shapes import shift
+
+# Offsets of the 5x5, stride-2 neighbourhood used for the dark core
+CORE_OFFSETS = [(dx, dy) for dy in (-2, 0, 2) for dx in (-2, 0, 2) if (dx, dy) != (0, 0)]
+
+
+def mask_from_rows(rows, width=None, height=None, char="x"):
+    """Turn string rows ('x' = filled) into a boolean (height, width) mask (memoized, read-only)."""
+    return shapes.mask(rows, char, width, height)
+
+
+def rim_mask(mask, light=(1, -1)):
+    """Filled pixels whose neighbour towards the light is empty.
+
+    light = (dx, dy) picks the lit sides, e.g. (1, -1) for right and top,
+    (-1, -1) for left and top; 0 disables that axis. Off-canvas pixels count
+    as empty horizontally but as filled vertically, so a shape touching the
+    top row does not get a rim along the canvas edge.
+    """
+    dx, dy = light
+    lit = np.zeros(mask.shape, dtype=bool)
+    if dx:
+        lit |= ~shift(mask, dx, 0, fill=False)
+    if dy:
+        lit |= ~shift(mask, 0, dy, fill=True)
+    return mask & lit
+
+
+def core_mask(mask):
+    """Erode with the stride-2 5x5 neighbourhood: pixels deep inside the shape."""
+    core = mask.copy()
+    for dx, dy in CORE_OFFSETS:
+        core &= shift(mask, dx, dy)
+    return core
+
+
+def shade_mask(mask, light=(1, -1)):
+    """Return an int8 role map: 0 empty, 1 body, 2 rim, 3 dark core."""
+    mask = np.asarray(mask, dtype=bool)
+    roles = mask.astype(np.int8)
+    roles[rim_mask(mask, light)] = 2
+    roles[core_mask(mask)] = 3
+    return roles
+
+
+def paint_shape(img, shape, body_color, rim_color, dark_color, light=(1, -1)):
+    """Paint a silhouette (string rows or boolean mask) with rim lighting and dark core."""
+    if not isinstance(shape, np.ndarray):
+        shape = mask_from_rows(shape, img.width, img.height)
+    roles = shade_mask(shape, light)
+    pal = palette_array((body_color, body_color, rim_color, dark_color))
+    filled = roles > 0
+    img.pixels[filled] = pal[roles[filled]]
@@ -0,0 +1,86 @@
+"""
+String-row shapes.
+Silhouettes and small glyphs are drawn as rows of characters: a legend
+string names the characters that mean something (legend[i] is role i + 1),
+anything else is empty. Rows compile to NumPy role maps and masks once per
+distinct text (memoized, returned read-only), and the zone and outline
+helpers replace the per-pixel set walks, so painting a glyph is a handful
+of array operations.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from .primitives import palette_array
+
+EDGE_4 = ((-1, 0), (1, 0), (0, -1), (0, 1))
+EDGE_8 = EDGE_4 + ((-1, -1), (1, -1), (-1, 1), (1, 1))
+
+
+def shift(mask, dx, dy, fill=False):
+    """Return out with out[..., y, x] = mask[..., y + dy, x + dx], `fill` past the edges."""
+    h, w = mask.shape[-2:]
+    out = np.full(mask.shape, fill, dtype=bool)
+    if abs(dx) >= w or abs(dy) >= h:
+        return out
+    ys = slice(max(-dy, 0), h - max(dy, 0))
+    xs = slice(max(-dx, 0), w - max(dx, 0))
+    ys_src = slice(max(dy, 0), h + min(dy, 0))
+    xs_src = slice(max(dx, 0), w + min(dx, 0))
+    out[..., ys, xs] = mask[..., ys_src, xs_src]
+    return out
+
+
+@lru_cache(maxsize=None)
+def _parse(rows, legend, width, height):
+    height = len(rows) if height is None else height
+    width = max((len(r) for r in rows), default=0) if width is None else width
+    text = b"".join(r[:width].ljust(width).encode("latin-1") for r in rows[:height]).ljust(width * height)
+    lut = np.zeros(256, dtype=np.uint8)
+    for i, char in enumerate(legend):
+        lut[ord(char)] = i + 1
+    roles = lut[np.frombuffer(text, dtype=np.uint8)].reshape(height, width)
+    roles.setflags(write=False)
+    return roles
+
+
+def roles(rows, legend="x", width=None, height=None):
+    """uint8 (height, width) role map: cells holding legend[i] are i + 1, the rest 0."""
+    return _parse(tuple(rows), legend, width, height)
+
+
+@lru_cache(maxsize=None)
+def _mask(rows, legend, width, height):
+    out = _parse(rows, legend, width, height) > 0
+    out.setflags(write=False)
+    return out
+
+
+def mask(rows, legend="x", width=None, height=None):
+    """Boolean (height, width) mask of the cells holding any legend character."""
+    return _mask(tuple(rows), legend, width, height)
+
+
+def outline(shape, neighbours=EDGE_4):
+    """Filled cells with an empty neighbour at one of the (dx, dy) offsets; off-canvas is empty."""
+    edge = np.zeros(shape.shape, dtype=bool)
+    for dx, dy in neighbours:
+        edge |= ~shift(shape, dx, dy)
+    return shape & edge
+
+
+def paint_zones(img, shape, zones, default):
+    """Paint the filled cells of shape with the colour of the first (mask, colour) zone holding them.
+
+    Cells in no zone get default.
+    """
+    pick = np.select([zone for zone, _ in zones], np.arange(1, len(zones) + 1), 0)
+    pal = palette_array([default] + [color for _, color in zones])
+    img.pixels[shape] = pal[pick[shape]]
+
+
+def paint_roles(img, role_map, colors):
+    """Paint the cells of each role in colors ({role: colour}); other cells are untouched."""
+    for role, color in colors.items():
+        img.pixels[role_map == role] = palette_array([color])[0]
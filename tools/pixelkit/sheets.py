@@ -0,0 +1,147 @@
+"""
+Spritesheet assembly.
+Lays rendered frames out on a fixed grid of cells, row-major, in a single
+buffer, so a sheet costs one PNG encode. Frames can be upscaled by an integer
+factor and are anchored bottom-centre in their cell. Cells can be separated
+by `padding` transparent pixels and surrounded by `extrude` pixels copied
+from the cell edge, which stops neighbouring frames bleeding in when the
+engine samples a region with filtering or at fractional positions.
+Frames that are pixel-identical copies or horizontal mirrors of another
+frame can be stored once (dedupe) and played back with flip_h, and frame
+regions can be shrunk to their alpha bounding box (trim_regions) so the
+engine does not draw the transparent part of every cell.
+"""
+
+import hashlib
+
+import numpy as np
+
+from .canvas import Canvas, alpha_bbox
+
+
+def sheet_size(cols, rows, cell, padding=0, extrude=0):
+    """Pixel size of a sheet of cols x rows cells."""
+    cw, ch = cell
+    return (cols * (cw + 2 * extrude + padding) - padding,
+            rows * (ch + 2 * extrude + padding) - padding)
+
+
+def grid_regions(cols, rows, cell, padding=0, extrude=0):
+    """Row-major list of (x, y, w, h) frame regions inside the sheet (extrusion excluded)."""
+    cw, ch = cell
+    pitch_x = cw + 2 * extrude + padding
+    pitch_y = ch + 2 * extrude + padding
+    return [(c * pitch_x + extrude, r * pitch_y + extrude, cw, ch)
+            for r in range(rows) for c in range(cols)]
+
+
+def fit_cell(frame, cell, scale=1):
+    """(h, w, 4) array of `cell` size holding frame, upscaled and anchored bottom-centre."""
+    cw, ch = cell
+    pixels = frame.pixels
+    if scale != 1:
+        pixels = pixels.repeat(scale, axis=0).repeat(scale, axis=1)
+    h, w = pixels.shape[:2]
+    if w > cw or h > ch:
+        raise ValueError("frame %dx%d does not fit a %dx%d cell" % (w, h, cw, ch))
+    out = np.zeros((ch, cw, 4), dtype=np.uint8)
+    x0 = (cw - w) // 2
+    out[ch - h:, x0:x0 + w] = pixels
+    return out
+
+
+def assemble(frames, cols, cell, padding=0, extrude=0, scale=1):
+    """Build a sheet Canvas from frames (row-major, None = empty cell)."""
+    rows = -(-len(frames) // cols)
+    width, height = sheet_size(cols, rows, cell, padding, extrude)
+    sheet = Canvas(width, height)
+    regions = grid_regions(cols, rows, cell, padding, extrude)
+    cw, ch = cell
+    for frame, (x, y, _, _) in zip(frames, regions):
+        if frame is None:
+            continue
+        block = fit_cell(frame, cell, scale)
+        if extrude:
+            block = np.pad(block, ((extrude, extrude), (extrude, extrude), (0, 0)), mode="edge")
+        sheet.pixels[y - extrude:y + ch + extrude, x - extrude:x + cw + extrude] = block
+    return sheet
+
+
+def trim_regions(sheet, regions):
+    """Shrink each (x, y, w, h) region to the opaque part of the sheet inside it.
+
+    Returns (regions, trims): trims maps the index of every shrunk region to
+    its (x, y, w, h) placement inside the full cell, for godot.sprite_frames_tres.
+    Empty cells keep their full region.
+    """
+    tight, trims = [], {}
+    for i, (x, y, w, h) in enumerate(regions):
+        box = alpha_bbox(sheet.pixels[y:y + h, x:x + w])
+        if box is None or box == (0, 0, w, h):
+            tight.append((x, y, w, h))
+            continue
+        left, top, right, bottom = box
+        tight.append((x + left, y + top, right - left, bottom - top))
+        trims[i] = (left, top, w, h)
+    return tight, trims
+
+
+def _key(pixels):
+    h, w = pixels.shape[:2]
+    return (w, h, hashlib.sha1(np.ascontiguousarray(pixels).tobytes()).digest())
+
+
+def dedupe(frames, animations=(), mirrors=True):
+    """Store every distinct frame once; return (unique frames, refs).
+
+    refs[i] is (index into unique, flip_h) for frames[i], or None for a None
+    frame. A frame that is the exact horizontal mirror of a stored one refers
+    to it with flip_h=True (unless `mirrors` is false, for consumers that
+    cannot flip). Matches are found by hash and then compared pixel by pixel
+    with the stored frame, so only true copies and mirrors are folded. Godot
+    flips a whole AnimatedSprite2D, not single frames, so with animations
+    ({"frames": [frame index, ...]}) an animation is mirrored only as a
+    whole: when every frame it adds mirrors a frame stored by an earlier
+    animation. Frames outside any animation are handled one by one.
+    """
+    unique, refs, stored = [], [None] * len(frames), {}
+
+    def find(pixels):
+        j = stored.get(_key(pixels))
+        if j is not None and np.array_equal(unique[j].pixels, pixels):
+            return j
+        return None
+
+    def store(i):
+        j = find(frames[i].pixels)
+        if j is None:
+            j = len(unique)
+            stored.setdefault(_key(frames[i].pixels), j)
+            unique.append(frames[i])
+        refs[i] = (j, False)
+
+    groups = [anim["frames"] for anim in animations] + [[i] for i in range(len(frames))]
+    for group in groups:
+        new = [i for i in dict.fromkeys(group) if frames[i] is not None and refs[i] is None]
+        if not new:
+            continue
+        flipped = [find(frames[i].pixels[:, ::-1]) for i in new] if mirrors else [None]
+        exact = all(find(frames[i].pixels) is not None for i in new)
+        if not exact and None not in flipped:
+            for i, j in zip(new, flipped):
+                refs[i] = (j, True)
+        else:
+            for i in new:
+                store(i)
+    return unique, refs
+
+
+def remap(animations, refs):
+    """Animations over deduplicated frames: frames become unique indices, plus a flip_h flag."""
+    out = []
+    for anim in animations:
+        flips = {refs[i][1] for i in anim["frames"]}
+        if len(flips) > 1:
+            raise ValueError("animation %r mixes mirrored and stored frames" % anim["name"])
+        out.append(dict(anim, frames=[refs[i][0] for i in anim["frames"]], flip_h=flips == {True}))
+    return out
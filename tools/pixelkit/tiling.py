@@ -0,0 +1,96 @@
+"""
+Seamless tiles.
+Floors and walls are painted with TextureRect.STRETCH_TILE, so the last
+column of a tile sits next to its own first column (and the last row next
+to the first). WrapCanvas draws with that in mind: every write, from put to
+the vectorized primitives, lands modulo the tile size, so a crack or a brick
+that runs off one edge comes back in on the other instead of being clipped.
+
+seam_contrast checks the result for a whole batch of tiles at once: each
+tile is laid out as a 3x3 mosaic and the colour contrast across its wrap
+lines is compared with the strongest line drawn inside it. A score above 1
+means the seam stands out more than anything in the tile itself.
+joint_contrast does the same for a set of variants of one material, which
+must also join each other in any order.
+"""
+
+import numpy as np
+
+from .canvas import Canvas, ink
+
+
+class WrapCanvas(Canvas):
+    """Canvas whose drawing wraps around its edges instead of clipping."""
+
+    wrap = True
+
+    def put(self, x, y, color):
+        Canvas.put(self, x % self.width, y % self.height, color)
+
+    def get(self, x, y, default=None):
+        return Canvas.get(self, x % self.width, y % self.height)
+
+    def fill_rect(self, x0, y0, w, h, color):
+        """Fill a w x h rectangle whose top-left corner is (x0, y0), wrapping at the edges."""
+        if w <= 0 or h <= 0:
+            return
+        ys = np.arange(y0, y0 + min(h, self.height)) % self.height
+        xs = np.arange(x0, x0 + min(w, self.width)) % self.width
+        self.pixels[np.ix_(ys, xs)] = np.frombuffer(ink(color), dtype=np.uint8)
+
+    def copy(self):
+        return WrapCanvas.from_array(self.pixels)
+
+    def __reduce__(self):
+        return (WrapCanvas.from_bytes, (self.width, self.height, bytes(self.buf)))
+
+
+def _stack(tiles):
+    return np.stack([tile.pixels for tile in tiles]).astype(np.int16)
+
+
+def edge_contrast(tiles):
+    """(N, 2) mean colour difference between opposite edges: (last/first column, last/first row)."""
+    pixels = _stack(tiles)
+    x = np.abs(pixels[:, :, -1] - pixels[:, :, 0]).sum(axis=-1).mean(axis=1)
+    y = np.abs(pixels[:, -1] - pixels[:, 0]).sum(axis=-1).mean(axis=1)
+    return np.stack([x, y], axis=1)
+
+
+def seam_contrast(tiles):
+    """(N, 2) seam scores of equally sized tiles across their vertical and horizontal wrap lines.
+
+    The contrast of a line is the mean colour difference of the two pixel
+    columns (or rows) it separates in the centre tile of the mosaic; a seam
+    scores its wrap line over the strongest line inside the tile.
+    """
+    pixels = _stack(tiles)
+    n, h, w = pixels.shape[:3]
+    mosaic = np.tile(pixels, (1, 3, 3, 1))
+    # columns w-1 | w and 2w-1 | 2w are the wrap lines around the centre tile
+    cols = np.abs(np.diff(mosaic[:, h:2 * h], axis=2)).sum(axis=-1).mean(axis=1)
+    rows = np.abs(np.diff(mosaic[:, :, w:2 * w], axis=1)).sum(axis=-1).mean(axis=2)
+    out = np.empty((n, 2))
+    for axis, (lines, size) in enumerate(((cols, w), (rows, h))):
+        seam = np.maximum(lines[:, size - 1], lines[:, 2 * size - 1])
+        inside = lines[:, size:2 * size - 1].max(axis=1)
+        out[:, axis] = seam / np.maximum(inside, 1)
+    return out
+
+
+def joint_contrast(tiles):
+    """(2,) worst seam score of equally sized tiles laid next to each other in any order.
+
+    Every ordered pair is joined left/right and top/bottom, and each join
+    line scores as in seam_contrast, over the stronger of the two tiles'
+    inside lines.
+    """
+    pixels = _stack(tiles)
+    out = np.empty(2)
+    for axis in (0, 1):
+        # axis 0: columns (left/right joins), axis 1: rows (top/bottom joins)
+        first, last = (pixels[:, :, 0], pixels[:, :, -1]) if axis == 0 else (pixels[:, 0], pixels[:, -1])
+        joins = np.abs(last[:, None] - first[None]).sum(axis=-1).mean(axis=-1)
+        inside = np.abs(np.diff(pixels, axis=2 - axis)).sum(axis=-1).mean(axis=1 + axis).max(axis=1)
+        out[axis] = (joins / np.maximum(np.maximum(inside[:, None], inside[None]), 1)).max()
+    return out